@@ -0,0 +1,127 @@
+"""
+Micro-benchmarks for scoring.py on a deterministic synthetic corpus.
+
+Usage:
+    python scripts/benchmark_scoring.py                      # run and print
+    python scripts/benchmark_scoring.py --save base.json     # save a baseline
+    python scripts/benchmark_scoring.py --compare base.json  # diff against it
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.job_hunter_ai.scoring import (
+    ScoringContext,
+    compute_deterministic_score,
+    compute_hybrid_score,
+    extract_job_skills,
+    normalize_text,
+    seniority_penalty,
+)
+from src.job_hunter_ai.testing.synthetic import generate_jobs
+
+PROFILE_PATH = Path(__file__).resolve().parent.parent / "profile" / "profile.yml"
+
+
+def time_per_item(fn, items, repeat: int) -> float:
+    """Best-of-`repeat` seconds to run fn over all items."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(n: int, seed: int, repeat: int, skill_density: float) -> dict:
+    profile = yaml.safe_load(PROFILE_PATH.read_text(encoding="utf-8"))
+    ctx = ScoringContext.from_profile(profile)
+    jobs = list(generate_jobs(n, seed=seed, skill_density=skill_density))
+    raw_texts = [f"{j['title']}\n{j['description']}" for j in jobs]
+    texts = [normalize_text(t) for t in raw_texts]
+
+    cases = {
+        "normalize_text": (normalize_text, raw_texts),
+        "extract_job_skills": (extract_job_skills, texts),
+        "seniority_penalty": (seniority_penalty, texts),
+        "compute_deterministic_score[profile]": (
+            lambda job: compute_deterministic_score(profile, job), jobs
+        ),
+        "compute_deterministic_score[context]": (
+            lambda job: compute_deterministic_score(ctx, job), jobs
+        ),
+        "compute_hybrid_score[context]": (
+            lambda job: compute_hybrid_score(ctx, job, llm_score=70), jobs
+        ),
+    }
+
+    results = {}
+    for name, (fn, items) in cases.items():
+        total = time_per_item(fn, items, repeat)
+        results[name] = {
+            "total_s": total,
+            "per_item_us": total / len(items) * 1e6,
+            "items_per_s": len(items) / total if total else float("inf"),
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "n": n,
+            "seed": seed,
+            "repeat": repeat,
+            "skill_density": skill_density,
+            "avg_text_chars": sum(len(t) for t in texts) / len(texts),
+        },
+        "results": results,
+    }
+
+
+def print_report(report: dict, baseline: dict = None) -> None:
+    meta = report["meta"]
+    print(
+        f"n={meta['n']} seed={meta['seed']} repeat={meta['repeat']} "
+        f"avg_chars={meta['avg_text_chars']:.0f} python={meta['python']}"
+    )
+    print(f"{'benchmark':40} {'us/item':>10} {'items/s':>12} {'vs base':>9}")
+    for name, res in report["results"].items():
+        delta = ""
+        if baseline and name in baseline.get("results", {}):
+            base = baseline["results"][name]["per_item_us"]
+            delta = f"{(res['per_item_us'] - base) / base * 100:+.1f}%"
+        print(f"{name:40} {res['per_item_us']:10.1f} {res['items_per_s']:12.0f} {delta:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=2000, help="synthetic jobs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best is kept)")
+    parser.add_argument("--skill-density", type=float, default=0.3)
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare against")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.n, args.seed, args.repeat, args.skill_density)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print_report(report, baseline)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"✅ Baseline saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
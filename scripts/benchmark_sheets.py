@@ -0,0 +1,136 @@
+"""
+API-call and wall-time benchmarks for the Google Sheets I/O paths, offline.
+
+Each stage runs against a FakeWorksheet pre-filled with synthetic jobs, with a
+simulated per-call / per-cell latency (virtual time, nothing actually sleeps).
+
+Usage:
+    python scripts/benchmark_sheets.py                       # 1k and 10k rows
+    python scripts/benchmark_sheets.py --sizes 1000 10000 100000 --new 50
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import gspread
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from filter_jobs import filter_worksheet
+from src.job_hunter_ai.ingest.pipeline import MicroBatchSink
+from src.job_hunter_ai.ratelimit import TokenBucket
+from src.job_hunter_ai.sheets.incremental import RowCheckpoint
+from src.job_hunter_ai.sheets.sync import SheetSync
+from src.job_hunter_ai.sheets.writer import SheetWriter
+from src.job_hunter_ai.store import JobStore
+from src.job_hunter_ai.testing.fake_sheets import FakeWorksheet
+from src.job_hunter_ai.testing.synthetic import generate_jobs
+
+HEADERS = [
+    "job_id", "source", "published_at", "country", "city", "title", "company", "url",
+    "description", "status", "years_required_guess", "junior_ok", "language",
+    "language_ok", "notes",
+]
+
+
+def build_sheet(n: int, new: int, latency: float, latency_per_cell: float) -> FakeWorksheet:
+    rows = [HEADERS]
+    for i, job in enumerate(generate_jobs(n, seed=n, max_words=120)):
+        job["status"] = "NEW" if i >= n - new else "READY_LLM"
+        rows.append([job.get(h, "") for h in HEADERS])
+    return FakeWorksheet(rows, latency=latency, latency_per_cell=latency_per_cell, sleep=None)
+
+
+def unlimited_writer(ws) -> SheetWriter:
+    return SheetWriter(ws, HEADERS, rate_limiter=TokenBucket(rate=1e9, capacity=1e9))
+
+
+# ---------- Stages ----------
+def legacy_filter(ws, n, new, tmp):
+    """The original filter_jobs I/O: whole-sheet read, one Cell per field."""
+    records = ws.get_all_records()
+    headers = ws.row_values(1)
+    cells = []
+    for i, rec in enumerate(records, start=2):
+        if rec.get("status") == "NEW":
+            for col in ("years_required_guess", "junior_ok", "language", "notes", "status"):
+                cells.append(gspread.Cell(i, headers.index(col) + 1, "x"))
+    ws.update_cells(cells, value_input_option="RAW")
+
+
+def filter_incremental(ws, n, new, tmp):
+    checkpoint = RowCheckpoint("bench", ws.id, path=tmp / f"checkpoint_{n}.json")
+    checkpoint.save(n + 1 - new)
+    filter_worksheet(ws, checkpoint=checkpoint)
+
+
+def filter_full(ws, n, new, tmp):
+    filter_worksheet(ws, full=True, checkpoint=RowCheckpoint("bench", ws.id, path=tmp / "c.json"))
+
+
+def ingest_append(ws, n, new, tmp):
+    """Append `new` rows through the streaming sink (micro-batches of 200)."""
+    writer = unlimited_writer(ws)
+
+    def write_batch(rows):
+        writer.append_rows([[row.get(h, "") for h in HEADERS] for row in rows])
+        writer.flush()
+
+    with MicroBatchSink(write_batch, max_rows=200, max_seconds=None) as sink:
+        for job in generate_jobs(new, seed=-n):
+            sink.put(job)
+
+
+def sync_push(ws, n, new, tmp):
+    """Pull the sheet into a fresh store, then push `new` changed rows."""
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws, writer=unlimited_writer(ws))
+    sync.pull()
+    for job in list(store.iter_jobs(status="NEW"))[:new]:
+        store.update(job["job_id"], status="READY_LLM", notes="benchmark")
+    sync.push()
+
+
+STAGES = {
+    "filter[legacy full read]": legacy_filter,
+    "filter[incremental]": filter_incremental,
+    "filter[--full]": filter_full,
+    "ingest[append via sink]": ingest_append,
+    "sync[pull + push]": sync_push,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--new", type=int, default=50, help="NEW / changed rows per run")
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated seconds per call")
+    parser.add_argument(
+        "--latency-per-cell", type=float, default=2e-6, help="simulated seconds per cell"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'stage':26} {'rows':>7} {'reads':>6} {'writes':>6} {'cells read':>11} "
+        f"{'cells written':>14} {'api s':>8} {'cpu s':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            for name, stage in STAGES.items():
+                ws = build_sheet(n, args.new, args.latency, args.latency_per_cell)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):  # stage progress prints
+                    stage(ws, n, args.new, Path(tmp))
+                cpu = time.perf_counter() - start
+                print(
+                    f"{name:26} {n:7d} {ws.requests['read']:6d} {ws.requests['write']:6d} "
+                    f"{ws.cells_read:11d} {ws.cells_written:14d} {ws.api_time_s:8.2f} {cpu:7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
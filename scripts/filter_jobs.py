@@ -1,88 +1,25 @@
-import os
+import argparse
 import re
+import sys
+from pathlib import Path
+
 import gspread
-from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 
-load_dotenv()
-
-# ---------- Config ----------
-SENIOR_NEGATIVE = [
-    r"\bsenior\b", r"\blead\b", r"\bstaff\b", r"\bprincipal\b",
-    r"\bexpert\b", r"\bconfirmed?\b", r"\bmanager\b", r"\bhead of\b",
-]
-
-# exclude internships / alternance / apprenticeships
-NO_INTERNSHIPS = [
-    r"\bintern\b", r"\binternship\b", r"\bstage\b",
-    r"\balternance\b", r"\bapprenticeship\b", r"\bapprenti\b", r"\bapprentissage\b",
-    r"\btrainee\b"
-]
-
-# positive junior hints (not strictly required, but helps scoring/notes)
-JUNIOR_POSITIVE = [
-    r"\bjunior\b", r"\bentry[- ]level\b", r"\bgraduate\b",
-    r"\bd[ée]butant\b", r"\bpremi[eè]re exp[eé]rience\b",
-    r"\b0\s*[-–]\s*2\b", r"\b0\s*to\s*2\b",
-]
-
-# detect explicit years requirement (we accept <=2; otherwise reject)
-YEARS_PATTERNS = [
-    # English: 3 years, 3+ years, 3 yrs
-    r"(\d+)\s*\+?\s*(?:years?|yrs?)\b",
-
-    # French: 3 ans, 3 années
-    r"(\d+)\s*\+?\s*(?:ans?|ann[eé]es?)\b",
-
-    # With experience wording
-    r"(\d+)\s*\+?\s*(?:years?|yrs?|ans?|ann[eé]es?)\s+(?:of\s+)?exp[eé]rience",
-
-    # minimum / at least (English)
-    r"(?:minimum|at\s+least)\s+(\d+)\s*(?:years?|yrs?)",
-
-    # minimum / au moins (French)
-    r"(?:minimum|au\s+moins)\s+(\d+)\s*(?:ans?|ann[eé]es?)",
-]
-
-
-def connect_worksheet():
-    spreadsheet_name = os.environ["GOOGLE_SHEETS_SPREADSHEET_NAME"]
-    worksheet_name = os.environ.get("GOOGLE_SHEETS_WORKSHEET_NAME", "job_pipeline")
-
-    creds_path = os.environ["GOOGLE_CREDENTIALS_PATH"]
-
-    creds = Credentials.from_service_account_file(
-        creds_path,
-        scopes=[
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ],
-    )
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.job_hunter_ai.rules import evaluate_rules
+from src.job_hunter_ai.sheets.client import connect_worksheet
+from src.job_hunter_ai.sheets.incremental import RowCheckpoint
+from src.job_hunter_ai.sheets.sync import SheetSync
+from src.job_hunter_ai.sheets.writer import SheetWriter
+from src.job_hunter_ai.store import JobStore
 
-    gc = gspread.authorize(creds)
-    sh = gc.open(spreadsheet_name)
-    return sh.worksheet(worksheet_name)
+load_dotenv()
 
 
 def norm_text(s: str) -> str:
     return " ".join((s or "").lower().split())
 
-def contains_any(text: str, patterns: list[str]) -> bool:
-    return any(re.search(p, text, re.IGNORECASE) for p in patterns)
-
-def extract_years_required(text: str):
-    """Return (years:int|None, evidence:str|None)."""
-    for pat in YEARS_PATTERNS:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            try:
-                years = int(m.group(1))
-                evidence = m.group(0)
-                return years, evidence
-            except ValueError:
-                continue
-    return None, None
-
 def detect_language(text: str):
     # lightweight keyword detection
     has_fr = bool(re.search(r"\bfran[cç]ais\b|\bfrancophone\b|\bb2\b|\bc1\b", text, re.IGNORECASE)) and \
@@ -98,122 +35,181 @@ def detect_language(text: str):
     # You said accept unknown
     return "UNKNOWN", True
 
-def main():
-    ws = connect_worksheet()
 
-    # Pull all rows as records using header row
-    rows = ws.get_all_records()  # list[dict], each dict keyed by header names
-    headers = ws.row_values(1)
+REQUIRED_COLUMNS = ["status", "description", "title"]
+OUTPUT_COLUMNS = ["years_required_guess", "junior_ok", "language", "language_ok", "notes"]
 
-    required_cols = ["status", "description", "title"]
-    for col in required_cols:
+
+def check_columns(headers) -> None:
+    for col in REQUIRED_COLUMNS:
         if col not in headers:
             raise RuntimeError(f"Missing column in sheet: '{col}'")
 
-    # Find column indexes for updates
-    def col_idx(name: str) -> int:
-        return headers.index(name) + 1  # 1-based
-
     # Ensure optional columns exist
-    optional = ["years_required_guess", "junior_ok", "language", "language_ok", "notes"]
-    missing = [c for c in optional if c not in headers]
+    missing = [c for c in OUTPUT_COLUMNS if c not in headers]
     if missing:
         raise RuntimeError(
             "Add these columns to your sheet first: " + ", ".join(missing)
         )
 
-    updates = []  # list of (row_number, {col_name: value})
 
-    for i, rec in enumerate(rows, start=2):  # data starts at row 2
-        status = (rec.get("status") or "").strip().upper()
-        if status != "NEW":
-            continue
-
-        title = norm_text(str(rec.get("title") or ""))
-        desc = norm_text(str(rec.get("description") or ""))
-        full = f"{title} {desc}"
-
-        notes = []
-
-        # hard exclusions
-        if contains_any(full, NO_INTERNSHIPS):
-            updates.append((i, {
-                "years_required_guess": "",
-                "junior_ok": "FALSE",
-                "language": "UNKNOWN",
-                "language_ok": "TRUE",
-                "notes": "Excluded: internship/alternance/apprenticeship detected",
-                "status": "SKIPPED",
-            }))
-            continue
-
-        if contains_any(full, SENIOR_NEGATIVE):
-            notes.append("Senior keyword detected")
-            # still check years; but senior keywords are enough to skip
-            updates.append((i, {
-                "years_required_guess": "",
-                "junior_ok": "FALSE",
-                "language": detect_language(full)[0],
-                "language_ok": "TRUE",
-                "notes": "Excluded: senior role indicators",
-                "status": "SKIPPED",
-            }))
-            continue
-
-        # years requirement
-        years, evidence = extract_years_required(full)
-        if years is None:
-            # your rule: assume junior
-            junior_ok = True
-            years_guess = ""
-            notes.append("No explicit years found → assumed junior")
+def screen_job(rec: dict):
+    """Field updates for a NEW job (status READY_LLM or SKIPPED), None for other statuses."""
+    status = (rec.get("status") or "").strip().upper()
+    if status != "NEW":
+        return None
+
+    title = norm_text(str(rec.get("title") or ""))
+    desc = norm_text(str(rec.get("description") or ""))
+    text = f"{title} {desc}"
+
+    notes = []
+    verdict = evaluate_rules(text)
+
+    # hard exclusions
+    if verdict.internship:
+        return {
+            "years_required_guess": "",
+            "junior_ok": "FALSE",
+            "language": "UNKNOWN",
+            "language_ok": "TRUE",
+            "notes": verdict.excluded_reason,
+            "status": "SKIPPED",
+        }
+
+    if verdict.senior:
+        # senior keywords are enough to skip
+        return {
+            "years_required_guess": "",
+            "junior_ok": "FALSE",
+            "language": detect_language(text)[0],
+            "language_ok": "TRUE",
+            "notes": verdict.excluded_reason,
+            "status": "SKIPPED",
+        }
+
+    # years requirement
+    if verdict.years is None:
+        # your rule: assume junior
+        junior_ok = True
+        years_guess = ""
+        notes.append("No explicit years found → assumed junior")
+    else:
+        years_guess = str(verdict.years)
+        junior_ok = verdict.kept
+        if junior_ok:
+            notes.append(f"Explicit years requirement OK: {verdict.years_evidence}")
         else:
-            years_guess = str(years)
-            if years <= 2:
-                junior_ok = True
-                notes.append(f"Explicit years requirement OK: {evidence}")
-            else:
-                junior_ok = False
-                notes.append(f"Excluded: years requirement too high ({evidence})")
-
-        language, language_ok = detect_language(full)
-
-        if not junior_ok:
-            updates.append((i, {
-                "years_required_guess": years_guess,
-                "junior_ok": "FALSE",
-                "language": language,
-                "language_ok": "TRUE" if language_ok else "FALSE",
-                "notes": "; ".join(notes),
-                "status": "SKIPPED",
-            }))
-            continue
-
-        # optional: add a note if junior signals exist
-        if contains_any(full, JUNIOR_POSITIVE):
-            notes.append("Junior signal keywords present")
-
-        updates.append((i, {
+            notes.append(verdict.excluded_reason)
+
+    language, language_ok = detect_language(text)
+
+    if not junior_ok:
+        return {
             "years_required_guess": years_guess,
-            "junior_ok": "TRUE",
+            "junior_ok": "FALSE",
             "language": language,
             "language_ok": "TRUE" if language_ok else "FALSE",
             "notes": "; ".join(notes),
-            "status": "READY_LLM",
-        }))
+            "status": "SKIPPED",
+        }
+
+    # optional: add a note if junior signals exist
+    if verdict.junior_signals:
+        notes.append("Junior signal keywords present")
+
+    return {
+        "years_required_guess": years_guess,
+        "junior_ok": "TRUE",
+        "language": language,
+        "language_ok": "TRUE" if language_ok else "FALSE",
+        "notes": "; ".join(notes),
+        "status": "READY_LLM",
+    }
+
+
+def filter_store(store: JobStore) -> int:
+    """Screen the store's NEW jobs in place (one transaction). Returns jobs updated."""
+    updates = {}
+    for job in store.iter_jobs(status="NEW"):
+        fields = screen_job(job)
+        if fields is not None:
+            updates[job["job_id"]] = fields
+    store.update_many(updates)
+    return len(updates)
+
+
+def filter_worksheet(ws, full: bool = False, checkpoint: RowCheckpoint | None = None) -> int:
+    """
+    Screen NEW rows directly in the sheet, without the store (only rows past
+    the checkpoint unless full). Returns rows updated.
+    """
+    headers = ws.row_values(1)
+    check_columns(headers)
+
+    # Only read rows appended since the last run (ingest always appends at the bottom)
+    checkpoint = checkpoint or RowCheckpoint("filter_jobs", ws.id)
+    start_row = 2 if full else checkpoint.last_row + 1
+    last_col = re.sub(r"\d", "", gspread.utils.rowcol_to_a1(1, len(headers)))
+    # a range starting below the grid is a 400 from the API, not an empty read
+    values = ws.get(f"A{start_row}:{last_col}") if start_row <= ws.row_count else []
+    rows = [dict(zip(headers, row)) for row in values]
+    end_row = start_row + len(rows) - 1
+
+    updates = []  # list of (row_number, {col_name: value})
+    for i, rec in enumerate(rows, start=start_row):
+        fields = screen_job(rec)
+        if fields is not None:
+            updates.append((i, fields))
 
     if not updates:
+        if rows:
+            checkpoint.save(end_row)
         print("ℹ️ No NEW rows to process.")
-        return
+        return 0
+
+    # Cells are merged into rectangular ranges and sent in one quota-paced batch update
+    with SheetWriter(ws, headers) as writer:
+        for row_num, data in updates:
+            writer.update(row_num, data)
+    checkpoint.save(end_row)
+    print(
+        f"✅ Updated {len(updates)} rows (NEW → READY_LLM / SKIPPED), "
+        f"read rows {start_row}-{end_row}."
+    )
+    return len(updates)
+
 
-    # Batch update cells for each row
-    cell_updates = []
-    for row_num, data in updates:
-        for k, v in data.items():
-            cell_updates.append(gspread.Cell(row_num, col_idx(k), str(v)))
+def main():
+    parser = argparse.ArgumentParser(description="Screen NEW jobs of the pipeline")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="re-read the whole sheet instead of only the rows added since the last run",
+    )
+    parser.add_argument(
+        "--no-store", action="store_true",
+        help="screen the sheet directly instead of the local job store",
+    )
+    args = parser.parse_args()
 
-    ws.update_cells(cell_updates, value_input_option="RAW")
-    print(f"✅ Updated {len(updates)} rows (NEW → READY_LLM / SKIPPED).")
+    ws = connect_worksheet()
+    if args.no_store:
+        filter_worksheet(ws, full=args.full)
+        return
+
+    with JobStore() as store:
+        sync = SheetSync(store, ws)
+        sync.pull(full=args.full)  # rows added outside the store, manual edits with --full
+        check_columns(sync.headers)
+        updated = filter_store(store)
+        stats = sync.push()
+    if updated:
+        print(
+            f"✅ Updated {updated} jobs (NEW → READY_LLM / SKIPPED), "
+            f"{stats.api_calls} sheet API calls."
+        )
+    else:
+        print("ℹ️ No NEW jobs to process.")
 
 if __name__ == "__main__":
     main()
@@ -1,16 +1,27 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import argparse
 import json
 import os
 from pathlib import Path
 from src.job_hunter_ai.latex.render_template import render_template
 from src.job_hunter_ai.drive.upload import upload_to_drive
+from src.job_hunter_ai.llm.cache import get_completion_cache, set_completion_cache
 from src.job_hunter_ai.llm.enrich import enrich_with_llm
 from src.job_hunter_ai.scoring import compute_hybrid_score
 import yaml
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate CV and cover letter for a job")
+    parser.add_argument(
+        "--no-llm-cache", action="store_true",
+        help="always call Groq instead of reusing cached completions",
+    )
+    args = parser.parse_args()
+    if args.no_llm_cache:
+        set_completion_cache(None)
+
     # Dummy job for testing
     job = {
         "title": "Data Engineer",
@@ -32,6 +43,8 @@ def main():
         profile, experiences_md, projects_md,
         job, deterministic.final_score
     )
+    timings = ", ".join(f"{name}={sec:.1f}s" for name, sec in llm_output["timings"].items())
+    print(f"LLM stages: {timings}")
 
     job_id = job["id"]
     out_dir = Path(f"build/jobs/{job_id}")
@@ -53,6 +66,11 @@ def main():
     print(f"✔ Generated LaTeX CV: {cv_path}")
     print(f"✔ Generated LaTeX Cover Letter: {cover_path}")
 
+    cache = get_completion_cache()
+    if cache is not None:
+        stats = cache.stats()
+        print(f"LLM cache: {stats.hits} hits, {stats.misses} misses")
+
     # Step 4: upload files to Drive (optional)
     cv_drive_url = upload_to_drive(cv_path)
     cover_drive_url = upload_to_drive(cover_path)
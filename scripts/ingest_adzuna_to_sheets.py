@@ -1,205 +1,119 @@
+import argparse
 import os
-import re
-import hashlib
-import requests
-import gspread
-from google.oauth2.service_account import Credentials
+import sys
+from pathlib import Path
+
+import yaml
 from dotenv import load_dotenv
 
-load_dotenv()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.job_hunter_ai.config import (
+    INGEST_MIN_QUERY_YIELD,
+    INGEST_PARALLEL_QUERIES,
+    INGEST_REQUEST_BUDGET,
+    get_profile_path,
+)
+from src.job_hunter_ai.ingest.adzuna import AdzunaClient, RequestBudget
+from src.job_hunter_ai.ingest.dedup import SeenIndex
+from src.job_hunter_ai.ingest.http import HttpSession
+from src.job_hunter_ai.ingest.near_dup import NearDuplicateIndex
+from src.job_hunter_ai.ingest.pipeline import MicroBatchSink, run_pipeline
+from src.job_hunter_ai.ingest.planner import MultiQueryFetcher, YieldHistory, plan_queries
+from src.job_hunter_ai.sheets.client import connect_worksheet
+from src.job_hunter_ai.sheets.sync import SheetSync
+from src.job_hunter_ai.store import JobStore
 
-# -------------------- Filtering Rules --------------------
-SENIOR_NEGATIVE = [
-    r"\bsenior\b", r"\blead\b", r"\bstaff\b", r"\bprincipal\b",
-    r"\bexpert\b", r"\bconfirmed?\b", r"\bmanager\b", r"\bhead of\b",
-]
-
-NO_INTERNSHIPS = [
-    r"\bintern\b", r"\binternship\b", r"\bstage\b",
-    r"\balternance\b", r"\bapprenticeship\b", r"\bapprenti\b",
-    r"\bapprentissage\b", r"\btrainee\b"
-]
-
-# Handles: "3 years", "3+ years", "3 ans", "3 années", "au moins 3 ans", "minimum 3 years", "3 ans d'expérience"
-YEARS_PATTERNS = [
-    r"(\d+)\s*\+?\s*(?:years?|yrs?)\b",
-    r"(\d+)\s*\+?\s*(?:ans?|ann[eé]es?)\b",
-    r"(?:minimum|at\s+least)\s+(\d+)\s*(?:years?|yrs?)\b",
-    r"(?:minimum|au\s+moins)\s+(\d+)\s*(?:ans?|ann[eé]es?)\b",
-    r"(\d+)\s*\+?\s*(?:years?|yrs?|ans?|ann[eé]es?)\s+(?:of\s+)?exp[eé]rience\b",
-]
-
-def contains_any(text: str, patterns: list[str]) -> bool:
-    return any(re.search(p, text, re.IGNORECASE) for p in patterns)
-
-def extract_years_required(text: str):
-    for pat in YEARS_PATTERNS:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            try:
-                return int(m.group(1)), m.group(0)
-            except ValueError:
-                pass
-    return None, None
-
-def should_keep(title: str, description: str):
-    full = f"{title} {description}".lower()
-
-    # exclude internships/alternance always
-    if contains_any(full, NO_INTERNSHIPS):
-        return False, None, "Excluded: internship/alternance/apprenticeship detected"
-
-    # exclude senior roles
-    if contains_any(full, SENIOR_NEGATIVE):
-        return False, None, "Excluded: senior role indicators"
-
-    # years requirement: accept <=2, assume junior if not mentioned
-    years, evidence = extract_years_required(full)
-    if years is None:
-        return True, "", "Kept: no explicit years found (assumed junior)"
-    if years <= 2:
-        return True, str(years), f"Kept: explicit years <=2 ({evidence})"
-    return False, str(years), f"Excluded: explicit years >2 ({evidence})"
-
-# -------------------- Utilities --------------------
-def sha1(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()
-
-def safe_str(v) -> str:
-    if v is None:
-        return ""
-    return " ".join(str(v).split()).strip()
-
-def pick_city(location: dict) -> str:
-    location = location or {}
-    display = safe_str(location.get("display_name"))
-
-    for sep in [",", " - ", "-"]:
-        if sep in display:
-            return safe_str(display.split(sep)[0])
-
-    area = location.get("area")
-    if isinstance(area, list) and area:
-        return safe_str(area[-1])
-
-    return display  # e.g. "Remote"
-
-# -------------------- Adzuna --------------------
-def fetch_adzuna_jobs(country_code: str, query: str, page: int, results_per_page: int):
-    app_id = os.environ["ADZUNA_APP_ID"]
-    app_key = os.environ["ADZUNA_APP_KEY"]
-
-    url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}"
-    params = {
-        "app_id": app_id,
-        "app_key": app_key,
-        "what": query,
-        "results_per_page": results_per_page,
-    }
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-    return r.json().get("results", [])
-
-# -------------------- Google Sheets --------------------
-def connect_worksheet():
-    spreadsheet_name = os.environ["GOOGLE_SHEETS_SPREADSHEET_NAME"]
-    worksheet_name = os.environ.get("GOOGLE_SHEETS_WORKSHEET_NAME", "job_pipeline")
-
-    creds_path = os.environ["GOOGLE_CREDENTIALS_PATH"]
-
-    creds = Credentials.from_service_account_file(
-        creds_path,
-        scopes=[
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ],
-    )
+load_dotenv()
 
-    gc = gspread.authorize(creds)
-    sh = gc.open(spreadsheet_name)
-    return sh.worksheet(worksheet_name)
+# -------------------- Reporting --------------------
+def print_query_report(stats, dropped) -> None:
+    if stats:
+        print(f"{'query':55} {'requests':>8} {'jobs':>6} {'new':>5} {'dupes':>6} {'yield':>6}")
+    for s in stats:
+        note = f"  ⚠️ {s.error}" if s.error else ""
+        print(
+            f"{str(s.task):55} {s.requests:8d} {s.jobs:6d} {s.new_jobs:5d} "
+            f"{s.duplicates:6d} {s.yield_per_request:6.2f}{note}"
+        )
+    for task in dropped:
+        print(f"{task}: skipped, low yield")
 
+# -------------------- Main --------------------
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch Adzuna jobs into the job store and the pipeline sheet"
+    )
+    parser.add_argument(
+        "--rebuild-dedup", action="store_true",
+        help="rebuild the local dedup index from the job store",
+    )
+    parser.add_argument(
+        "--budget", type=int, default=INGEST_REQUEST_BUDGET,
+        help="Adzuna page requests for the whole run, shared by all queries",
+    )
+    parser.add_argument(
+        "--all-queries", action="store_true",
+        help="also run the queries dropped for low yield in earlier runs",
+    )
+    parser.add_argument("--plan", action="store_true", help="print the planned queries and exit")
+    args = parser.parse_args()
+
+    # roles x locations from profile.yml, best-yielding queries first
+    profile = yaml.safe_load(get_profile_path("profile.yml").read_text(encoding="utf-8"))
+    history = YieldHistory()
+    min_yield = 0.0 if args.all_queries else INGEST_MIN_QUERY_YIELD
+    tasks, dropped = history.select(plan_queries(profile), min_yield=min_yield)
+    if args.plan:
+        print("\n".join(str(task) for task in tasks))
+        print_query_report([], dropped)
+        return
+
+    # jobs go to the local store first; the sheet is synced from it after every batch
+    store = JobStore()
+    sync = SheetSync(store, connect_worksheet())
+    sync.pull()  # rows added to the sheet outside the store (all of them on the first run)
+
+    # known job ids come from the local index, (re)built from the store when needed
+    existing = SeenIndex()
+    if existing.is_new or args.rebuild_dedup:
+        existing.rebuild(store.job_ids())
+
+    # HTTP_CACHE_TTL_SECONDS > 0 lets re-runs inside that window reuse cached pages
+    cache_ttl = float(os.environ.get("HTTP_CACHE_TTL_SECONDS", "0"))
+    http = HttpSession(cache=True if cache_ttl > 0 else None, cache_ttl=cache_ttl)
+    client = AdzunaClient(http=http)
+
+    # overlapping queries share one request budget and one in-memory dedupe
+    fetcher = MultiQueryFetcher(
+        client, budget=RequestBudget(args.budget), max_parallel=INGEST_PARALLEL_QUERIES
+    )
+    jobs = fetcher.iter_jobs(tasks, known_ids=existing)
 
+    # reposts / syndicated copies of a job already seen get a new url, hence a new job_id
+    near_dups = NearDuplicateIndex()
 
-def get_headers(ws) -> list[str]:
-    headers = ws.row_values(1)
-    return [h.strip() for h in headers if h and h.strip()]
+    def write_batch(rows: list[dict]) -> None:
+        store.upsert(rows)
+        sync.push()
+        existing.add_many(row["job_id"] for row in rows)
 
-def get_existing_job_ids(ws, headers: list[str]) -> set[str]:
-    if "job_id" not in headers:
-        raise RuntimeError("Sheet must have a 'job_id' column in header row.")
-    job_id_col = headers.index("job_id") + 1
-    col = ws.col_values(job_id_col)
-    return set(v.strip() for v in col[1:] if v and v.strip())
+    # rows are appended in micro-batches while later pages are still being fetched
+    with store, MicroBatchSink(write_batch, max_rows=200, max_seconds=10) as sink:
+        # rejected ids are recorded too, so later runs skip them and stop paging early
+        stats = run_pipeline(jobs, sink, known=existing, near_dups=near_dups, seen=existing)
 
-def build_row_values(headers: list[str], data: dict) -> list[str]:
-    return [safe_str(data.get(h, "")) for h in headers]
+    history.record(fetcher.stats)
+    history.save()
+    print_query_report(fetcher.stats, dropped)
 
-# -------------------- Main --------------------
-def main():
-    ws = connect_worksheet()
-    headers = get_headers(ws)
-    existing = get_existing_job_ids(ws, headers)
-
-    # You can later make these configurable via .env
-    jobs = fetch_adzuna_jobs(country_code="fr", query="data engineer", page=1, results_per_page=30)
-
-    kept_count = 0
-    skipped_count = 0
-    new_rows = []
-
-    for job in jobs:
-        source = "adzuna"
-        job_url = safe_str(job.get("redirect_url") or job.get("adref") or job.get("url"))
-        if not job_url:
-            skipped_count += 1
-            continue
-
-        job_id = sha1(f"{source}|{job_url}")
-        if job_id in existing:
-            continue
-
-        title = safe_str(job.get("title"))
-        description = safe_str(job.get("description"))
-
-        keep, years_guess, reason = should_keep(title, description)
-        if not keep:
-            skipped_count += 1
-            continue
-
-        kept_count += 1
-
-        row_dict = {
-            "job_id": job_id,
-            "source": source,
-            "published_at": safe_str(job.get("created")),
-            "country": "FR",
-            "city": pick_city(job.get("location")),
-            "title": title,
-            "company": safe_str((job.get("company") or {}).get("display_name")),
-            "contract_ty": safe_str(job.get("contract_type") or ""),
-            "url": job_url,
-            "description": description,
-
-            # keep status NEW for your workflow
-            "status": "NEW",
-
-            # optional columns (safe if they exist; ignored if not)
-            "years_required_guess": years_guess,
-            "notes": reason,
-            # leave these empty for later scripts
-            "junior_ok": "",
-            "language": "",
-            "language_ok": "",
-        }
-
-        new_rows.append(build_row_values(headers, row_dict))
-
-    if new_rows:
-        ws.append_rows(new_rows, value_input_option="RAW")
-        print(f"✅ Added {len(new_rows)} jobs (kept={kept_count}, skipped={skipped_count}).")
+    summary = (
+        f"kept={stats.kept}, skipped={stats.skipped}, "
+        f"near-duplicates={stats.near_duplicates}, batches={stats.batches}"
+    )
+    if stats.written:
+        print(f"✅ Added {stats.written} jobs ({summary}).")
     else:
-        print(f"ℹ️ No new jobs to add (kept={kept_count}, skipped={skipped_count}).")
+        print(f"ℹ️ No new jobs to add ({summary}).")
 
 if __name__ == "__main__":
     main()
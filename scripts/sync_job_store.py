@@ -0,0 +1,51 @@
+"""
+Sync the local job store with the pipeline Google Sheet.
+
+Usage:
+    python scripts/sync_job_store.py pull           # new sheet rows -> store
+    python scripts/sync_job_store.py pull --full    # every row (picks up manual edits)
+    python scripts/sync_job_store.py push           # changed jobs in store -> sheet
+    python scripts/sync_job_store.py both           # pull then push
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.job_hunter_ai.sheets.client import connect_worksheet
+from src.job_hunter_ai.sheets.sync import SheetSync
+from src.job_hunter_ai.store import JobStore
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("direction", choices=["pull", "push", "both"])
+    parser.add_argument("--store", type=Path, help="SQLite job store (default: JOB_STORE_PATH)")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="pull every sheet row, not only the rows below the last known one",
+    )
+    args = parser.parse_args()
+
+    with JobStore(args.store) as store:
+        sync = SheetSync(store, connect_worksheet())
+        if args.direction in ("pull", "both"):
+            changed = sync.pull(full=args.full)
+            print(f"⬇️  Pulled sheet: {changed} jobs new or changed ({len(store)} in store).")
+        if args.direction in ("push", "both"):
+            stats = sync.push()
+            print(
+                f"⬆️  Pushed: {stats.updated} rows updated, {stats.appended} appended "
+                f"({stats.relocated} found at a new row, {stats.restored} re-added; "
+                f"{stats.api_calls} API calls)."
+            )
+        print(f"📊 Status counts: {store.count_by_status()}")
+
+
+if __name__ == "__main__":
+    main()
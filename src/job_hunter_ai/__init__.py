@@ -8,9 +8,16 @@ Includes job ingestion, scoring, and LLM-powered document generation.
 __version__ = "0.1.0"
 
 # Expose main scoring functions
-from .scoring import compute_deterministic_score, compute_hybrid_score
+from .scoring import (
+    ScoringContext,
+    compute_deterministic_score,
+    compute_hybrid_score,
+    score_jobs,
+)
 
 __all__ = [
+    "ScoringContext",
     "compute_deterministic_score",
     "compute_hybrid_score",
+    "score_jobs",
 ]
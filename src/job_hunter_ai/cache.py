@@ -0,0 +1,153 @@
+"""
+Small persistent key/value cache on top of SQLite.
+
+Shared by the scoring, HTTP and LLM caches: text values keyed by a string,
+optional TTL, size-bounded LRU eviction and hit/miss counters.
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SqliteCache:
+    """
+    Persistent string -> text cache.
+
+    Args:
+        path: SQLite file (":memory:" for a throwaway cache); parent dirs are created
+        max_entries: Keep at most this many entries, evicting least recently used
+        ttl_seconds: Entries older than this are treated as missing (None = never expire);
+            expired entries left by earlier runs are deleted when the cache opens
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache(accessed_at)")
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if ttl_seconds is not None:
+            self.prune(ttl_seconds)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds is not None:
+                if now - row[1] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._entries -= 1
+                    row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if not existed:
+                self._entries += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.max_entries is None or self._entries <= self.max_entries:
+            return
+        excess = self._entries - self.max_entries
+        self._conn.execute(
+            "DELETE FROM cache WHERE key IN"
+            " (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+            (excess,),
+        )
+        self._entries -= excess
+        self.evictions += excess
+
+    def prune(self, max_age_seconds: float) -> int:
+        """Delete entries created more than max_age_seconds ago. Returns how many."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE created_at < ?", (time.time() - max_age_seconds,)
+            )
+            self._entries -= cur.rowcount
+            return cur.rowcount
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._entries -= cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._entries = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits, misses=self.misses, entries=self._entries, evictions=self.evictions
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __enter__(self) -> "SqliteCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
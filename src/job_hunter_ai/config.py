@@ -16,6 +16,8 @@ PROFILE_DIR = PROJECT_ROOT / "profile"
 PROMPTS_DIR = PROJECT_ROOT / "prompts"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 BUILD_DIR = PROJECT_ROOT / "build"
+CACHE_DIR = Path(os.environ.get("JOB_HUNTER_CACHE_DIR", PROJECT_ROOT / ".cache"))
+DATA_DIR = Path(os.environ.get("JOB_HUNTER_DATA_DIR", PROJECT_ROOT / "data"))
 
 # =====================================
 # LLM Configuration
@@ -24,6 +26,28 @@ GROQ_API_KEY: Optional[str] = os.environ.get("GROQ_API_KEY")
 GROQ_MODEL: str = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
 GROQ_TEMPERATURE: float = float(os.environ.get("GROQ_TEMPERATURE", "0.2"))
 GROQ_TIMEOUT: int = int(os.environ.get("GROQ_TIMEOUT", "60"))
+# Connection pool of the shared client (keep-alive connections are reused across calls)
+GROQ_MAX_CONNECTIONS: int = int(os.environ.get("GROQ_MAX_CONNECTIONS", "20"))
+GROQ_KEEPALIVE_CONNECTIONS: int = int(os.environ.get("GROQ_KEEPALIVE_CONNECTIONS", "10"))
+
+# Account limits enforced client-side by llm/ratelimit.py (see the Groq console)
+GROQ_REQUESTS_PER_MINUTE: float = float(os.environ.get("GROQ_REQUESTS_PER_MINUTE", "30"))
+GROQ_TOKENS_PER_MINUTE: float = float(os.environ.get("GROQ_TOKENS_PER_MINUTE", "12000"))
+# Expected completion size, reserved up front and settled with the reported usage
+GROQ_COMPLETION_TOKENS_ESTIMATE: int = int(
+    os.environ.get("GROQ_COMPLETION_TOKENS_ESTIMATE", "1000")
+)
+GROQ_MAX_RETRIES: int = int(os.environ.get("GROQ_MAX_RETRIES", "5"))
+
+# Jobs enriched at the same time by llm/batch.py (each runs up to 2 calls at once)
+GROQ_BATCH_CONCURRENCY: int = int(os.environ.get("GROQ_BATCH_CONCURRENCY", "4"))
+
+# Completion cache (see llm/cache.py); identical prompts are answered from disk
+GROQ_CACHE_ENABLED: bool = os.environ.get("GROQ_CACHE_ENABLED", "1").lower() not in (
+    "0", "false", "no"
+)
+GROQ_CACHE_TTL_SECONDS: float = float(os.environ.get("GROQ_CACHE_TTL_SECONDS", str(30 * 86400)))
+GROQ_CACHE_MAX_ENTRIES: int = int(os.environ.get("GROQ_CACHE_MAX_ENTRIES", "5000"))
 
 # =====================================
 # Scoring Configuration
@@ -45,6 +69,9 @@ SENIORITY_PENALTY: int = -20
 # Default candidate max experience (can be overridden from profile)
 DEFAULT_MAX_YEARS: int = 2
 
+# Persistent score cache (see score_cache.py)
+SCORE_CACHE_MAX_ENTRIES: int = int(os.environ.get("SCORE_CACHE_MAX_ENTRIES", "500000"))
+
 # =====================================
 # Google Sheets Configuration
 # =====================================
@@ -55,12 +82,41 @@ GOOGLE_SHEETS_WORKSHEET_NAME: str = os.environ.get(
     "GOOGLE_SHEETS_WORKSHEET_NAME", "daily_jobs"
 )
 
+# Local job store (system of record); the sheet is a synced view of it
+JOB_STORE_PATH = Path(os.environ.get("JOB_STORE_PATH", DATA_DIR / "jobs.sqlite"))
+SHEETS_SYNC_BATCH_SIZE: int = int(os.environ.get("SHEETS_SYNC_BATCH_SIZE", "500"))
+# Sheets API default quota: 60 write requests per minute per user
+SHEETS_WRITES_PER_MINUTE: int = int(os.environ.get("SHEETS_WRITES_PER_MINUTE", "60"))
+
 # =====================================
 # Adzuna API Configuration
 # =====================================
 ADZUNA_APP_ID: Optional[str] = os.environ.get("ADZUNA_APP_ID")
 ADZUNA_APP_KEY: Optional[str] = os.environ.get("ADZUNA_APP_KEY")
 
+# Default Adzuna quota is 25 calls/minute; max page size is 50
+ADZUNA_RATE_PER_MINUTE: int = int(os.environ.get("ADZUNA_RATE_PER_MINUTE", "25"))
+ADZUNA_MAX_IN_FLIGHT: int = int(os.environ.get("ADZUNA_MAX_IN_FLIGHT", "4"))
+ADZUNA_RESULTS_PER_PAGE: int = int(os.environ.get("ADZUNA_RESULTS_PER_PAGE", "50"))
+
+# Query planner: page requests per ingest run (all queries), queries fetched at once,
+# and the new-jobs-per-request below which a query is dropped from later runs
+INGEST_REQUEST_BUDGET: int = int(os.environ.get("INGEST_REQUEST_BUDGET", "60"))
+INGEST_PARALLEL_QUERIES: int = int(os.environ.get("INGEST_PARALLEL_QUERIES", "2"))
+INGEST_MIN_QUERY_YIELD: float = float(os.environ.get("INGEST_MIN_QUERY_YIELD", "1"))
+
+# =====================================
+# HTTP (shared by job source connectors)
+# =====================================
+HTTP_MAX_RETRIES: int = int(os.environ.get("HTTP_MAX_RETRIES", "4"))
+HTTP_BACKOFF_SECONDS: float = float(os.environ.get("HTTP_BACKOFF_SECONDS", "1"))
+HTTP_MAX_BACKOFF_SECONDS: float = float(os.environ.get("HTTP_MAX_BACKOFF_SECONDS", "60"))
+# Response cache freshness; 0 disables the on-disk cache in the ingest script
+HTTP_CACHE_TTL_SECONDS: float = float(os.environ.get("HTTP_CACHE_TTL_SECONDS", "0"))
+# Stale responses are kept this much longer for ETag revalidation, then deleted
+HTTP_CACHE_STALE_SECONDS: float = float(os.environ.get("HTTP_CACHE_STALE_SECONDS", "604800"))
+HTTP_CACHE_MAX_ENTRIES: int = int(os.environ.get("HTTP_CACHE_MAX_ENTRIES", "20000"))
+
 # =====================================
 # Google Drive Configuration (Optional)
 # =====================================
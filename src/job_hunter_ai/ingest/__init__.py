@@ -0,0 +1,8 @@
+"""
+Job ingestion module.
+
+Provides job source connectors (Adzuna) and the helpers used to normalize,
+filter and deduplicate postings before they reach the pipeline sheet.
+"""
+
+__all__ = []
@@ -0,0 +1,231 @@
+"""
+Adzuna job search connector.
+
+Walks every result page of a query with a bounded number of concurrent
+requests, a token bucket matched to the Adzuna quota, and early stopping once a
+page (sorted by date) contains only jobs we already know. Jobs are yielded as a
+stream in page order.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Deque, Dict, Iterator, List, Optional
+
+import requests
+
+from ..config import (
+    ADZUNA_MAX_IN_FLIGHT,
+    ADZUNA_RATE_PER_MINUTE,
+    ADZUNA_RESULTS_PER_PAGE,
+)
+from ..ratelimit import TokenBucket
+from .http import HttpSession
+from .normalize import adzuna_job_url, make_job_id
+
+ADZUNA_SEARCH_URL = "https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
+SOURCE = "adzuna"
+
+
+def adzuna_job_id(job: Dict) -> str:
+    """Pipeline job id of a raw Adzuna result ("" if it has no URL)."""
+    url = adzuna_job_url(job)
+    return make_job_id(SOURCE, url) if url else ""
+
+
+@dataclass
+class FetchStats:
+    pages_requested: int = 0
+    pages_yielded: int = 0
+    jobs_yielded: int = 0
+    total_count: Optional[int] = None
+    stopped_on_known_page: bool = False
+    budget_exhausted: bool = False
+
+
+class RequestBudget:
+    """
+    Thread-safe cap on page requests, shared by every query of a run.
+
+    Usage:
+        budget = RequestBudget(60)
+        for query in queries:
+            client.iter_jobs(query, budget=budget)
+    """
+
+    def __init__(self, max_requests: Optional[int] = None):
+        self.max_requests = max_requests
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Spend one request; False once the budget is used up."""
+        with self._lock:
+            if self.max_requests is not None and self.used >= self.max_requests:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.max_requests is None:
+            return None
+        return max(0, self.max_requests - self.used)
+
+
+class AdzunaClient:
+    """
+    Usage:
+        client = AdzunaClient()
+        for job in client.iter_jobs("data engineer", country_code="fr", known_ids=existing):
+            ...
+        print(client.last_stats)
+
+    Args:
+        app_id / app_key: Credentials (default: ADZUNA_APP_ID / ADZUNA_APP_KEY env vars)
+        max_in_flight: Concurrent page requests
+        rate_limiter: Shared TokenBucket (default: ADZUNA_RATE_PER_MINUTE)
+        http: HttpSession to fetch with (default: a new pooled one); the client
+            paces it so that every attempt, retries included, takes a token
+        get: Callable with the requests.get signature, used instead of http; only
+            one token is taken per page then, whatever it does internally
+    """
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_key: Optional[str] = None,
+        max_in_flight: int = ADZUNA_MAX_IN_FLIGHT,
+        rate_limiter: Optional[TokenBucket] = None,
+        get: Optional[Callable[..., requests.Response]] = None,
+        timeout: float = 30,
+        http: Optional[HttpSession] = None,
+    ):
+        self.app_id = app_id or os.environ["ADZUNA_APP_ID"]
+        self.app_key = app_key or os.environ["ADZUNA_APP_KEY"]
+        self.max_in_flight = max(1, max_in_flight)
+        self.rate_limiter = rate_limiter or TokenBucket.per_minute(
+            ADZUNA_RATE_PER_MINUTE, burst=self.max_in_flight
+        )
+        self._http: Optional[HttpSession] = None
+        if get is None:
+            self._http = http or HttpSession(pool_size=self.max_in_flight)
+            self._http.pace = self.rate_limiter.acquire
+            get = self._http.get
+        self._get = get
+        self.timeout = timeout
+        self.last_stats = FetchStats()
+
+    def fetch_page(
+        self,
+        country_code: str,
+        query: str,
+        page: int,
+        results_per_page: int = ADZUNA_RESULTS_PER_PAGE,
+        **params,
+    ) -> Dict:
+        """One search page as returned by Adzuna (keys: 'results', 'count', ...)."""
+        if self._http is None:  # an HttpSession takes its own tokens, per attempt
+            self.rate_limiter.acquire()
+        r = self._get(
+            ADZUNA_SEARCH_URL.format(country=country_code, page=page),
+            params={
+                "app_id": self.app_id,
+                "app_key": self.app_key,
+                "what": query,
+                "results_per_page": results_per_page,
+                **params,
+            },
+            timeout=self.timeout,
+        )
+        r.raise_for_status()
+        return r.json()
+
+    def iter_jobs(
+        self,
+        query: str,
+        country_code: str = "fr",
+        results_per_page: int = ADZUNA_RESULTS_PER_PAGE,
+        max_pages: Optional[int] = None,
+        known_ids: Optional[AbstractSet[str]] = None,
+        sort_by: str = "date",
+        budget: Optional[RequestBudget] = None,
+        stats: Optional[FetchStats] = None,
+        **params,
+    ) -> Iterator[Dict]:
+        """
+        Yield raw Adzuna results for every page of a query, in page order.
+
+        Up to max_in_flight pages are requested concurrently. Stops after the last
+        page (from the reported 'count'), an empty page, max_pages, or the first
+        page whose jobs are all in known_ids (newest first with sort_by="date"),
+        or when the shared `budget` refuses the next request. Pass `stats` to
+        collect them per call when several queries run on one client at once.
+        Extra params (e.g. where="Lyon", max_days_old=1) are passed to Adzuna.
+        """
+        stats = self.last_stats = stats or FetchStats()
+        last_page = max_pages
+        next_page = 1
+        probing = True  # until page 1 tells us the total, only ask for one page
+        pending: Deque[Future] = deque()
+
+        def page_params(page: int) -> Dict:
+            return dict(
+                country_code=country_code,
+                query=query,
+                page=page,
+                results_per_page=results_per_page,
+                sort_by=sort_by,
+                **params,
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+
+            def submit_more() -> None:
+                nonlocal next_page
+                while len(pending) < self.max_in_flight and (
+                    last_page is None or next_page <= last_page
+                ):
+                    if budget is not None and not budget.take():
+                        stats.budget_exhausted = True
+                        return
+                    pending.append(pool.submit(self.fetch_page, **page_params(next_page)))
+                    stats.pages_requested += 1
+                    next_page += 1
+                    if probing:
+                        break
+
+            submit_more()
+            try:
+                while pending:
+                    data = pending.popleft().result()
+                    results: List[Dict] = data.get("results", []) or []
+
+                    if probing:
+                        probing = False
+                        if data.get("count") is not None:
+                            stats.total_count = int(data["count"])
+                            pages = math.ceil(stats.total_count / results_per_page)
+                            last_page = pages if max_pages is None else min(max_pages, pages)
+
+                    if not results:
+                        break
+                    if known_ids is not None and all(
+                        adzuna_job_id(job) in known_ids for job in results
+                    ):
+                        stats.stopped_on_known_page = True
+                        break
+
+                    submit_more()
+                    stats.pages_yielded += 1
+                    for job in results:
+                        stats.jobs_yielded += 1
+                        yield job
+            finally:
+                for future in pending:
+                    future.cancel()
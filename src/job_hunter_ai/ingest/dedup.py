@@ -0,0 +1,103 @@
+"""
+Persistent dedup index for pipeline job ids.
+
+Every id the pipeline has decided on (written to the store, or screened out /
+dropped as a near-duplicate) lives in an append-only text file (one id per
+line) and is held in memory as a set: loading 100k ids takes milliseconds and
+never touches the Sheets API. Written ids are appended once their write
+succeeded, rejected ones at the end of the run; rebuild() rewrites the file
+atomically from an authoritative source (the job store's ids) when the two may
+have drifted, which forgets the rejected ids. The store stays the record of
+which jobs were written.
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Set, Union
+
+from ..config import DATA_DIR
+
+
+class SeenIndex:
+    """
+    Usage:
+        seen = SeenIndex()
+        if seen.is_new:                      # first run on this machine
+            seen.rebuild(store.job_ids())
+        if job_id not in seen:
+            ...
+        seen.add_many(written_or_rejected_ids)
+
+    Args:
+        path: Index file (default: DATA_DIR/seen_job_ids.txt)
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or DATA_DIR / "seen_job_ids.txt")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.is_new = not self.path.exists()
+        text = "" if self.is_new else self.path.read_text(encoding="utf-8")
+        self._ids: Set[str] = set(text.split())
+        self._file = open(self.path, "a", encoding="utf-8")
+        if text and not text.endswith("\n"):
+            # torn last line after a crash: keep it as a (harmless) id, start a new line
+            self._file.write("\n")
+
+    def add(self, job_id: str) -> bool:
+        """Record one id. Returns True if it was not seen before."""
+        return self.add_many([job_id]) == 1
+
+    def add_many(self, job_ids: Iterable[str]) -> int:
+        """Record ids (one write + flush). Returns how many were new."""
+        with self._lock:
+            new = []
+            for job_id in job_ids:
+                job_id = (job_id or "").strip()
+                if job_id and job_id not in self._ids:
+                    self._ids.add(job_id)
+                    new.append(job_id)
+            if new:
+                self._file.write("".join(f"{job_id}\n" for job_id in new))
+                self._file.flush()
+            return len(new)
+
+    def rebuild(self, job_ids: Iterable[str]) -> int:
+        """Replace the index with exactly these ids (atomic). Returns the new size."""
+        ids = {(job_id or "").strip() for job_id in job_ids} - {""}
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write("".join(f"{job_id}\n" for job_id in sorted(ids)))
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(tmp, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._ids = ids
+            self.is_new = False
+        return len(ids)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(set(self._ids))
+
+    def __enter__(self) -> "SeenIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,194 @@
+"""
+Shared HTTP layer for job source connectors.
+
+One pooled requests.Session (keep-alive, so pages of a query reuse the same TLS
+connection), retries with jittered exponential backoff that honour Retry-After,
+and an optional on-disk response cache keyed by URL + params.
+
+Cached responses are served without touching the network while younger than
+cache_ttl. Older ones are revalidated with If-None-Match / If-Modified-Since
+when the server sent an ETag / Last-Modified, so a 304 still costs no body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import time
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ..cache import SqliteCache
+from ..config import (
+    CACHE_DIR,
+    HTTP_BACKOFF_SECONDS,
+    HTTP_CACHE_MAX_ENTRIES,
+    HTTP_CACHE_STALE_SECONDS,
+    HTTP_CACHE_TTL_SECONDS,
+    HTTP_MAX_BACKOFF_SECONDS,
+    HTTP_MAX_RETRIES,
+)
+from ..ratelimit import parse_retry_after
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+# the body is cached decoded, so transfer headers would no longer be true
+UNCACHED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def cache_key(url: str, params: Optional[Mapping] = None) -> str:
+    """Stable key for a GET request (params order does not matter)."""
+    payload = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _build_response(url: str, entry: Dict) -> requests.Response:
+    r = requests.Response()
+    r.url = url
+    r.status_code = entry["status"]
+    r.headers = CaseInsensitiveDict(entry["headers"])
+    r._content = entry["body"].encode("utf-8")
+    r.encoding = "utf-8"
+    return r
+
+
+class HttpSession:
+    """
+    Usage:
+        http = HttpSession(cache_ttl=3600)
+        r = http.get(url, params={...}, timeout=30)
+        client = AdzunaClient(http=http)   # every attempt takes an Adzuna token
+
+    Args:
+        max_retries: Extra attempts after a 429/5xx or connection error
+        backoff: Base delay in seconds (doubles per attempt, full jitter)
+        max_backoff: Upper bound for a single delay (Retry-After included)
+        pool_size: Keep-alive connections kept per host
+        cache: SqliteCache, a path for one, or True for CACHE_DIR/http.sqlite (None = off).
+            A cache opened from a path holds HTTP_CACHE_MAX_ENTRIES responses and
+            drops them HTTP_CACHE_STALE_SECONDS after they go stale
+        cache_ttl: Seconds a cached response is served without revalidation
+        pace: Called before every network attempt, retries included (e.g. a
+            TokenBucket's acquire), so retries stay inside the source's quota
+    """
+
+    def __init__(
+        self,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff: float = HTTP_BACKOFF_SECONDS,
+        max_backoff: float = HTTP_MAX_BACKOFF_SECONDS,
+        pool_size: int = 10,
+        cache: Union[SqliteCache, str, Path, bool, None] = None,
+        cache_ttl: float = HTTP_CACHE_TTL_SECONDS,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+        pace: Optional[Callable[[], object]] = None,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cache_ttl = cache_ttl
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self.retries = 0
+        self.pace = pace
+
+        if cache is True:
+            cache = CACHE_DIR / "http.sqlite"
+        if isinstance(cache, (str, Path)):
+            cache = SqliteCache(
+                cache,
+                max_entries=HTTP_CACHE_MAX_ENTRIES,
+                ttl_seconds=max(0.0, cache_ttl) + HTTP_CACHE_STALE_SECONDS,
+            )
+        self.cache: Optional[SqliteCache] = cache if isinstance(cache, SqliteCache) else None
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number `attempt` (0-based)."""
+        if retry_after is not None:
+            return min(self.max_backoff, retry_after)
+        return self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _send(self, url: str, params: Optional[Mapping], headers: Dict, timeout: float):
+        for attempt in range(self.max_retries + 1):
+            last_try = attempt == self.max_retries
+            if self.pace is not None:
+                self.pace()
+            try:
+                r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            except RETRY_EXCEPTIONS:
+                if last_try:
+                    raise
+                delay = self.backoff_delay(attempt)
+            else:
+                if r.status_code not in RETRY_STATUSES or last_try:
+                    return r
+                delay = self.backoff_delay(attempt, parse_retry_after(r.headers.get("Retry-After")))
+                r.close()
+            self.retries += 1
+            self._sleep(delay)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping] = None,
+        timeout: float = 30,
+        use_cache: bool = True,
+    ) -> requests.Response:
+        """GET with retries; served from / stored in the cache when enabled."""
+        if self.cache is None or not use_cache:
+            return self._send(url, params, {}, timeout)
+
+        key = cache_key(url, params)
+        raw = self.cache.get(key)
+        entry = json.loads(raw) if raw else None
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if time.time() - entry["fetched_at"] <= self.cache_ttl:
+                return _build_response(url, entry)
+            cached_headers = CaseInsensitiveDict(entry["headers"])
+            if "ETag" in cached_headers:
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        r = self._send(url, params, headers, timeout)
+        if r.status_code == 304 and entry is not None:
+            entry["fetched_at"] = time.time()
+            self.cache.set(key, json.dumps(entry))
+            return _build_response(url, entry)
+        if r.status_code == 200:
+            entry = {
+                "status": r.status_code,
+                "headers": {
+                    k: v for k, v in r.headers.items() if k.lower() not in UNCACHED_HEADERS
+                },
+                "body": r.text,
+                "fetched_at": time.time(),
+            }
+            self.cache.set(key, json.dumps(entry))
+        return r
+
+    def close(self) -> None:
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "HttpSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
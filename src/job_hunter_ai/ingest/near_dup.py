@@ -0,0 +1,244 @@
+"""
+Near-duplicate detection for job postings (MinHash + LSH banding).
+
+Exact dedup keys on sha1(source|url), so a reposted offer with a new redirect
+URL, or the same offer syndicated by another board, looks new. Here each posting
+is reduced to a MinHash signature over word shingles of its normalized
+title + company + description. Signatures are split into bands; postings that
+share any band are candidates, and candidates are confirmed by their estimated
+Jaccard similarity. Lookups touch a handful of indexed band keys, never the
+whole corpus.
+
+Every indexed job belongs to a cluster named after its first-seen member, so
+reposts can be skipped or linked to the original.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..config import DATA_DIR
+
+_WORD = re.compile(r"\w+")
+_COMBINING_MARKS = re.compile(r"[\u0300-\u036f]")
+
+
+def posting_text(job: Dict) -> str:
+    """Normalized title + company + description (accents folded, punctuation dropped)."""
+    company = job.get("company")
+    if isinstance(company, dict):  # raw Adzuna result
+        company = company.get("display_name")
+    text = " ".join(str(v or "") for v in (job.get("title"), company, job.get("description")))
+    text = text.lower()
+    if not text.isascii():
+        text = _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text))
+    return " ".join(_WORD.findall(text))
+
+
+def shingles(text: str, k: int = 3) -> np.ndarray:
+    """Distinct 32-bit hashes of the word k-grams of text (stable across runs)."""
+    words = text.split()
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    grams = {" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))}
+    return np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams)
+    )
+
+
+class MinHasher:
+    """
+    num_perm multiply-shift hash functions; signature[i] is the minimum of hash i
+    over the shingles. P(sig_a[i] == sig_b[i]) estimates the Jaccard similarity.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        # odd multipliers keep the multiply-shift family universal
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> Optional[np.ndarray]:
+        if hashes.size == 0:
+            return None
+        with np.errstate(over="ignore"):
+            mixed = self._a[:, None] * hashes[None, :] + self._b[:, None]
+        return (mixed >> np.uint64(32)).min(axis=1).astype(np.uint32)
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    Usage:
+        index = NearDuplicateIndex()
+        original = index.add(job_id, job)     # None if no near-duplicate was indexed
+        if original is not None:
+            ...skip the repost or link it to `original`...
+
+    Args:
+        path: SQLite file (":memory:" for tests); default DATA_DIR/near_dups.sqlite
+        threshold: Minimum estimated Jaccard similarity to call two postings duplicates
+        num_perm / bands: Signature length and LSH bands (num_perm % bands == 0).
+            With r = num_perm / bands rows per band, pairs at similarity s become
+            candidates with probability 1 - (1 - s^r)^bands (~0.98 at s=0.8 for 128/16).
+        shingle_size: Words per shingle
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+
+        path = path or DATA_DIR / "near_dups.sqlite"
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS signatures (
+                job_id TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                sig BLOB
+            );
+            CREATE INDEX IF NOT EXISTS signatures_cluster ON signatures(cluster_id);
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                key BLOB NOT NULL,
+                job_id TEXT NOT NULL,
+                PRIMARY KEY (band, key, job_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._check_params(f"{num_perm}/{bands}/{shingle_size}/{seed}")
+
+    def _check_params(self, params: str) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is None:
+            with self._conn:
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (params,))
+        elif row[0] != params:
+            raise RuntimeError(
+                f"Index was built with num_perm/bands/shingle_size/seed={row[0]}, not {params}"
+            )
+
+    def signature(self, job: Dict) -> Optional[np.ndarray]:
+        return self.hasher.signature(shingles(posting_text(job), self.shingle_size))
+
+    def _band_keys(self, sig: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (b, sig[b * self.rows:(b + 1) * self.rows].tobytes()) for b in range(self.bands)
+        ]
+
+    def query(self, job: Dict, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Indexed near-duplicates of job as (job_id, similarity), most similar first."""
+        sig = self.signature(job)
+        return [] if sig is None else self._query_sig(sig, exclude)
+
+    def _query_sig(self, sig: np.ndarray, exclude: Optional[str]) -> List[Tuple[str, float]]:
+        candidates = set()
+        for band, key in self._band_keys(sig):
+            candidates.update(
+                r[0] for r in self._conn.execute(
+                    "SELECT job_id FROM bands WHERE band = ? AND key = ?", (band, key)
+                )
+            )
+        candidates.discard(exclude)
+
+        matches = []
+        for job_id in candidates:
+            (blob,) = self._conn.execute(
+                "SELECT sig FROM signatures WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            similarity = estimate_jaccard(sig, np.frombuffer(blob, dtype=np.uint32))
+            if similarity >= self.threshold:
+                matches.append((job_id, similarity))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches
+
+    def add(self, job_id: str, job: Dict) -> Optional[str]:
+        """
+        Index a job and return the cluster id (first-seen job) of its near-duplicates,
+        or None if it is original. Re-adding a known job_id returns its stored answer.
+        """
+        return self.add_many([(job_id, job)])[0]
+
+    def add_many(self, items: Iterable[Tuple[str, Dict]]) -> List[Optional[str]]:
+        """add() for each (job_id, job) in one transaction; reposts within the batch match too."""
+        results: List[Optional[str]] = []
+        with self._conn:
+            for job_id, job in items:
+                results.append(self._add(job_id, job))
+        return results
+
+    def _add(self, job_id: str, job: Dict) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT cluster_id FROM signatures WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row is not None:
+            return None if row[0] == job_id else row[0]
+
+        sig = self.signature(job)
+        matches = [] if sig is None else self._query_sig(sig, exclude=job_id)
+        cluster_id = self.cluster_of(matches[0][0]) if matches else job_id
+
+        self._conn.execute(
+            "INSERT INTO signatures (job_id, cluster_id, sig) VALUES (?, ?, ?)",
+            (job_id, cluster_id, None if sig is None else sig.tobytes()),
+        )
+        if sig is not None:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bands (band, key, job_id) VALUES (?, ?, ?)",
+                [(band, key, job_id) for band, key in self._band_keys(sig)],
+            )
+        return None if cluster_id == job_id else cluster_id
+
+    def cluster_of(self, job_id: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT cluster_id FROM signatures WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def cluster_members(self, cluster_id: str) -> List[str]:
+        return [
+            r[0] for r in self._conn.execute(
+                "SELECT job_id FROM signatures WHERE cluster_id = ? ORDER BY rowid", (cluster_id,)
+            )
+        ]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def __enter__(self) -> "NearDuplicateIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,41 @@
+"""
+Normalization helpers for raw job postings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def sha1(s: str) -> str:
+    return hashlib.sha1(s.encode("utf-8")).hexdigest()
+
+
+def safe_str(v) -> str:
+    if v is None:
+        return ""
+    return " ".join(str(v).split()).strip()
+
+
+def pick_city(location: dict) -> str:
+    location = location or {}
+    display = safe_str(location.get("display_name"))
+
+    for sep in [",", " - ", "-"]:
+        if sep in display:
+            return safe_str(display.split(sep)[0])
+
+    area = location.get("area")
+    if isinstance(area, list) and area:
+        return safe_str(area[-1])
+
+    return display  # e.g. "Remote"
+
+
+def adzuna_job_url(job: dict) -> str:
+    return safe_str(job.get("redirect_url") or job.get("adref") or job.get("url"))
+
+
+def make_job_id(source: str, job_url: str) -> str:
+    """Stable pipeline id: sha1("<source>|<url>")."""
+    return sha1(f"{source}|{job_url}")
@@ -0,0 +1,355 @@
+"""
+Streaming ingestion pipeline.
+
+Each stage is a generator over job dicts, so stages compose freely and only a
+bounded number of jobs is in flight at any time:
+
+    fetch -> normalize -> drop_known -> screen -> drop_near_duplicates -> sink
+
+prefetch() runs the (network bound) fetch stage in a background thread behind a
+bounded queue: fetching keeps going while rows are screened and written, and
+blocks when the consumer falls behind. MicroBatchSink writes rows in batches
+flushed by size or age, so the first rows reach the sheet while later pages are
+still being fetched.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..rules import evaluate_rules
+from .adzuna import SOURCE as ADZUNA_SOURCE
+from .dedup import SeenIndex
+from .near_dup import NearDuplicateIndex
+from .normalize import adzuna_job_url, make_job_id, pick_city, safe_str
+
+
+@dataclass
+class IngestStats:
+    fetched: int = 0
+    kept: int = 0
+    skipped: int = 0
+    known: int = 0
+    near_duplicates: int = 0
+    written: int = 0
+    batches: int = 0
+
+
+# -----------------------------
+# Screening rules
+# -----------------------------
+def should_keep(title: str, description: str) -> Tuple[bool, Optional[str], str]:
+    """(keep, years_guess, reason) for a posting, using the shared rule engine."""
+    verdict = evaluate_rules(f"{title} {description}".lower())
+
+    # internships/alternance and senior roles are always excluded
+    if verdict.internship or verdict.senior:
+        return False, None, verdict.excluded_reason
+
+    # years requirement: accept <=2, assume junior if not mentioned
+    if verdict.years is None:
+        return True, "", "Kept: no explicit years found (assumed junior)"
+    if verdict.kept:
+        return True, str(verdict.years), f"Kept: explicit years <=2 ({verdict.years_evidence})"
+    return False, str(verdict.years), verdict.excluded_reason
+
+
+# -----------------------------
+# Stages
+# -----------------------------
+def adzuna_row(job: Dict, country: str = "FR") -> Optional[Dict]:
+    """
+    Sheet row dict for a raw Adzuna result (None if it has no URL). The country
+    a query planner searched in ("search_country") wins over `country`.
+    """
+    job_url = adzuna_job_url(job)
+    if not job_url:
+        return None
+    return {
+        "job_id": make_job_id(ADZUNA_SOURCE, job_url),
+        "source": ADZUNA_SOURCE,
+        "published_at": safe_str(job.get("created")),
+        "country": job.get("search_country") or country,
+        "city": pick_city(job.get("location")),
+        "title": safe_str(job.get("title")),
+        "company": safe_str((job.get("company") or {}).get("display_name")),
+        "contract_ty": safe_str(job.get("contract_type") or ""),
+        "url": job_url,
+        "description": safe_str(job.get("description")),
+        # keep status NEW for your workflow
+        "status": "NEW",
+        # leave these empty for later scripts
+        "junior_ok": "",
+        "language": "",
+        "language_ok": "",
+    }
+
+
+def normalize(
+    jobs: Iterable[Dict],
+    stats: IngestStats,
+    to_row: Callable[[Dict], Optional[Dict]] = adzuna_row,
+) -> Iterator[Dict]:
+    for job in jobs:
+        stats.fetched += 1
+        row = to_row(job)
+        if row is None:
+            stats.skipped += 1
+            continue
+        yield row
+
+
+def drop_known(
+    rows: Iterable[Dict], known: AbstractSet[str], stats: IngestStats
+) -> Iterator[Dict]:
+    """Exact dedup on job_id, against known ids and earlier rows of this run."""
+    this_run = set()
+    for row in rows:
+        job_id = row["job_id"]
+        if job_id in known or job_id in this_run:
+            stats.known += 1
+            continue
+        this_run.add(job_id)
+        yield row
+
+
+def screen(
+    rows: Iterable[Dict], stats: IngestStats, rejected: Optional[List[str]] = None
+) -> Iterator[Dict]:
+    """Apply should_keep; kept rows get years_required_guess and notes."""
+    for row in rows:
+        keep, years_guess, reason = should_keep(row["title"], row["description"])
+        if not keep:
+            stats.skipped += 1
+            if rejected is not None:
+                rejected.append(row["job_id"])
+            continue
+        row["years_required_guess"] = years_guess
+        row["notes"] = reason
+        yield row
+
+
+def drop_near_duplicates(
+    rows: Iterable[Dict],
+    index: NearDuplicateIndex,
+    stats: IngestStats,
+    rejected: Optional[List[str]] = None,
+) -> Iterator[Dict]:
+    """Drop reposts / syndicated copies of postings already in the near-dup index."""
+    for row in rows:
+        if index.add(row["job_id"], row) is not None:
+            stats.near_duplicates += 1
+            if rejected is not None:
+                rejected.append(row["job_id"])
+            continue
+        yield row
+
+
+class _End:
+    """Marks the end of a prefetched stream (with the producer's error, if any)."""
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+
+def prefetch(items: Iterable, maxsize: int = 100) -> Iterator:
+    """
+    Iterate `items` in a background thread, at most maxsize items ahead of the
+    consumer. Producer exceptions are re-raised in the consumer; closing the
+    generator early stops the producer.
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:  # handed over to the consumer
+            put(_End(e))
+            return
+        put(_End())
+
+    thread = threading.Thread(target=produce, name="ingest-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _End):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+
+# -----------------------------
+# Sink
+# -----------------------------
+class MicroBatchSink:
+    """
+    Buffer rows and hand them to write_batch in micro-batches: as soon as
+    max_rows are buffered, or when the oldest buffered row is max_seconds old
+    (checked by a background timer, so a slow fetch does not hold rows back).
+
+    Usage:
+        with MicroBatchSink(write_batch, max_rows=200, max_seconds=10) as sink:
+            for row in rows:
+                sink.put(row)
+
+    A batch leaves the buffer only once write_batch returned, so a failed write
+    loses nothing: the rows are written again by the next flush. Errors raised
+    by write_batch on the timer thread surface on the next put/flush/close (the
+    timer stops flushing until then). When the `with` block itself raised, the
+    final flush is still attempted, but its error never replaces the one in
+    flight; it is kept on `error` and the rows stay in `pending`.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Dict]], None],
+        max_rows: int = 200,
+        max_seconds: Optional[float] = 10.0,
+        stats: Optional[IngestStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.write_batch = write_batch
+        self.max_rows = max(1, max_rows)
+        self.max_seconds = max_seconds
+        self.stats = stats or IngestStats()
+        self._clock = clock
+        self._buffer: List[Dict] = []
+        self._oldest: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if max_seconds is not None:
+            self._timer = threading.Thread(target=self._run_timer, name="sink-flush", daemon=True)
+            self._timer.start()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The last write error not raised to the caller yet."""
+        return self._error
+
+    @property
+    def pending(self) -> List[Dict]:
+        """Rows not written yet (buffered, or kept after a failed write)."""
+        with self._lock:
+            return list(self._buffer)
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        batch = self._buffer
+        self.write_batch(list(batch))
+        # only now: a failed write keeps the rows for the next flush
+        self._buffer, self._oldest = [], None
+        self.stats.written += len(batch)
+        self.stats.batches += 1
+
+    def _run_timer(self) -> None:
+        tick = min(1.0, self.max_seconds / 4) if self.max_seconds else 0.05
+        while not self._stop.wait(tick):
+            with self._lock:
+                if self._error is not None:
+                    continue  # wait for the caller to see it before writing again
+                if self._oldest is None or self._clock() - self._oldest < self.max_seconds:
+                    continue
+                try:
+                    self._flush_locked()
+                except BaseException as e:
+                    self._error = e
+
+    def put(self, row: Dict) -> None:
+        with self._lock:
+            self._raise_pending_error()
+            if self._oldest is None:
+                self._oldest = self._clock()
+            self._buffer.append(row)
+            if len(self._buffer) >= self.max_rows:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._raise_pending_error()
+            self._flush_locked()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+
+    def __enter__(self) -> "MicroBatchSink":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # still write what was screened before the failure, without masking it
+            self._stop.set()
+            if self._timer is not None:
+                self._timer.join()
+            with self._lock:
+                try:
+                    self._flush_locked()
+                except Exception as e:
+                    self._error = e
+
+
+def run_pipeline(
+    jobs: Iterable[Dict],
+    sink: MicroBatchSink,
+    known: AbstractSet[str],
+    near_dups: Optional[NearDuplicateIndex] = None,
+    prefetch_size: int = 100,
+    seen: Optional[SeenIndex] = None,
+) -> IngestStats:
+    """
+    Stream raw jobs through normalize -> drop_known -> screen -> near-dup -> sink.
+    Stats are collected on sink.stats; the sink is flushed but left open.
+
+    Ids of jobs screened out or dropped as near-duplicates are recorded in
+    `seen` (when given) at the end of the run, so later runs skip them like
+    written ones. Recording written ids is left to the sink's write_batch,
+    once the write has succeeded.
+    """
+    stats = sink.stats
+    rejected: Optional[List[str]] = [] if seen is not None else None
+    rows = normalize(prefetch(jobs, prefetch_size), stats)
+    rows = screen(drop_known(rows, known, stats), stats, rejected)
+    if near_dups is not None:
+        rows = drop_near_duplicates(rows, near_dups, stats, rejected)
+    try:
+        for row in rows:
+            stats.kept += 1
+            sink.put(row)
+        sink.flush()
+    finally:
+        if rejected:
+            seen.add_many(rejected)
+    return stats
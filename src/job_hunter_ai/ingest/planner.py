@@ -0,0 +1,364 @@
+"""
+Profile-driven query planning for job ingestion.
+
+plan_queries() expands the roles and locations of profile.yml into one
+FetchTask per (role, location) search. MultiQueryFetcher runs the tasks
+concurrently on one AdzunaClient. The tasks share a single RequestBudget and the
+client's rate limiter. Results are merged through one in-memory dedupe, so a
+posting matched by several overlapping queries is processed only once.
+
+Each query's yield (new unique jobs per request) is recorded in a small
+YieldHistory file. Queries that keep yielding little are left out of later runs,
+and are re-run now and then in case their market picks up again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..config import DATA_DIR
+from .adzuna import AdzunaClient, FetchStats, RequestBudget, adzuna_job_id
+
+# Adzuna serves one endpoint per country
+COUNTRY_CODES = {
+    "australia": "au",
+    "austria": "at",
+    "belgium": "be",
+    "brazil": "br",
+    "canada": "ca",
+    "france": "fr",
+    "germany": "de",
+    "india": "in",
+    "italy": "it",
+    "mexico": "mx",
+    "netherlands": "nl",
+    "new zealand": "nz",
+    "poland": "pl",
+    "singapore": "sg",
+    "south africa": "za",
+    "spain": "es",
+    "switzerland": "ch",
+    "uk": "gb",
+    "united kingdom": "gb",
+    "united states": "us",
+    "usa": "us",
+}
+
+
+@dataclass(frozen=True)
+class FetchTask:
+    """One search: a role in a city (or a whole country when where is None)."""
+
+    query: str
+    country_code: str
+    where: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.country_code}|{self.where or '*'}|{self.query.lower()}"
+
+    def __str__(self) -> str:
+        return f"{self.query} @ {self.where or '*'} ({self.country_code})"
+
+    def params(self) -> Dict:
+        """Keyword arguments for AdzunaClient.iter_jobs."""
+        params: Dict = {"query": self.query, "country_code": self.country_code}
+        if self.where:
+            params["where"] = self.where
+        return params
+
+
+# -----------------------------
+# Planning
+# -----------------------------
+def country_code(name: str) -> Optional[str]:
+    """Adzuna country code for a name or code ("France" -> "fr"); None if not covered."""
+    name = name.strip().lower()
+    if name in COUNTRY_CODES.values():
+        return name
+    return COUNTRY_CODES.get(name)
+
+
+def parse_locations(text: str) -> List[Tuple[str, str]]:
+    """
+    "Lyon, France or Paris, France" -> [("Lyon", "fr"), ("Paris", "fr")].
+
+    Places whose country Adzuna does not cover are ignored.
+    """
+    locations = []
+    for place in re.split(r"\s+or\s+|;|/", text or "", flags=re.IGNORECASE):
+        city, _, country = place.rpartition(",")
+        code = country_code(country)
+        if code and city.strip():
+            locations.append((city.strip(), code))
+    return locations
+
+
+def plan_queries(profile: Dict) -> List[FetchTask]:
+    """
+    roles x locations -> FetchTasks (deduplicated, in profile order).
+
+    Roles come from search.roles, then seniority.acceptable_roles, then
+    positioning.primary_role. Locations come from search.locations (a list of
+    {where, country}), or else are parsed from identity.location; in that case
+    each parsed country is also searched as a whole (as the single country-wide
+    query did before), and the city queries only add what it misses. Countries
+    listed in search.countries are also searched without a location filter.
+    """
+    search = profile.get("search") or {}
+    roles = (
+        search.get("roles")
+        or (profile.get("seniority") or {}).get("acceptable_roles")
+        or [(profile.get("positioning") or {}).get("primary_role")]
+    )
+    roles = [r.strip() for r in roles if r and r.strip()]
+
+    if search.get("locations"):
+        locations: List[Tuple[Optional[str], str]] = []
+        for loc in search["locations"]:
+            code = country_code(loc.get("country", ""))
+            if code is None:
+                raise ValueError(f"Unsupported country in search.locations: {loc!r}")
+            locations.append((loc.get("where") or None, code))
+    else:
+        parsed = parse_locations((profile.get("identity") or {}).get("location", ""))
+        locations = [(None, code) for code in dict.fromkeys(code for _, code in parsed)]
+        locations += parsed
+    for country in search.get("countries") or []:
+        code = country_code(country)
+        if code is None:
+            raise ValueError(f"Unsupported country in search.countries: {country!r}")
+        locations.append((None, code))
+
+    tasks: Dict[str, FetchTask] = {}
+    for role in roles:
+        for where, code in locations:
+            task = FetchTask(role, code, where)
+            tasks.setdefault(task.key, task)
+    return list(tasks.values())
+
+
+# -----------------------------
+# Yield history
+# -----------------------------
+class YieldHistory:
+    """
+    Recent yields (new unique jobs per request) per query, in a JSON file.
+
+    A query is dropped once it has at least min_runs recorded runs and their
+    mean yield is below min_yield. A dropped query is run again after
+    probe_every skipped runs, so it can come back.
+
+    Usage:
+        history = YieldHistory()
+        tasks, dropped = history.select(plan_queries(profile), min_yield=1.0)
+        ...fetch...
+        history.record(fetcher.stats)
+        history.save()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        window: int = 5,
+        min_runs: int = 3,
+        probe_every: int = 5,
+    ):
+        self.path = Path(path or DATA_DIR / "query_yield.json")
+        self.window = window
+        self.min_runs = min_runs
+        self.probe_every = probe_every
+        try:
+            self._data: Dict[str, Dict] = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._data = {}
+
+    def mean_yield(self, task: FetchTask) -> Optional[float]:
+        yields = self._data.get(task.key, {}).get("yields", [])
+        return sum(yields) / len(yields) if yields else None
+
+    def is_low_yield(self, task: FetchTask, min_yield: float) -> bool:
+        entry = self._data.get(task.key, {})
+        if len(entry.get("yields", [])) < self.min_runs:
+            return False
+        return self.mean_yield(task) < min_yield
+
+    def select(
+        self, tasks: Sequence[FetchTask], min_yield: float
+    ) -> Tuple[List[FetchTask], List[FetchTask]]:
+        """
+        Split tasks into (to run, dropped). Tasks to run are ordered best yield
+        first (unmeasured ones first of all), so they get the budget first.
+        """
+        run, dropped = [], []
+        for task in tasks:
+            entry = self._data.setdefault(task.key, {"yields": [], "skipped": 0})
+            if self.is_low_yield(task, min_yield) and entry["skipped"] < self.probe_every:
+                entry["skipped"] += 1
+                dropped.append(task)
+            else:
+                run.append(task)
+
+        def priority(task: FetchTask) -> float:
+            mean = self.mean_yield(task)
+            return float("inf") if mean is None else mean
+
+        run.sort(key=priority, reverse=True)
+        return run, dropped
+
+    def record(self, stats: Sequence["QueryStats"]) -> None:
+        """Add this run's yield of every query that made at least one request."""
+        for s in stats:
+            if not s.requests:
+                continue
+            entry = self._data.setdefault(s.task.key, {"yields": [], "skipped": 0})
+            entry["yields"] = (entry["yields"] + [round(s.yield_per_request, 3)])[-self.window:]
+            entry["skipped"] = 0
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# -----------------------------
+# Fetching
+# -----------------------------
+@dataclass
+class QueryStats:
+    task: FetchTask
+    fetch: FetchStats = field(default_factory=FetchStats)
+    jobs: int = 0
+    new_jobs: int = 0
+    duplicates: int = 0  # already returned by another query of this run
+    error: Optional[BaseException] = None
+
+    @property
+    def requests(self) -> int:
+        return self.fetch.pages_requested
+
+    @property
+    def yield_per_request(self) -> float:
+        return self.new_jobs / self.requests if self.requests else 0.0
+
+
+class _Done:
+    """Marks the end of one task's stream."""
+
+
+class MultiQueryFetcher:
+    """
+    Usage:
+        fetcher = MultiQueryFetcher(client, budget=RequestBudget(60))
+        for job in fetcher.iter_jobs(tasks, known_ids=existing):
+            ...
+        for s in fetcher.stats:
+            print(s.task, s.requests, s.new_jobs, s.yield_per_request)
+
+    Args:
+        client: AdzunaClient whose rate limiter all queries share
+        budget: Page requests allowed for the whole run (default: unlimited)
+        max_parallel: Queries fetched at the same time
+        buffer_size: Jobs buffered ahead of the consumer
+        **iter_params: Passed to every iter_jobs call (e.g. max_pages=5, max_days_old=2)
+
+    Every job comes out once, tagged with the country it was searched in
+    ("search_country"). A job is credited to the query that returned it first.
+    """
+
+    def __init__(
+        self,
+        client: AdzunaClient,
+        budget: Optional[RequestBudget] = None,
+        max_parallel: int = 2,
+        buffer_size: int = 200,
+        **iter_params,
+    ):
+        self.client = client
+        self.budget = budget or RequestBudget()
+        self.max_parallel = max(1, max_parallel)
+        self.buffer_size = buffer_size
+        self.iter_params = iter_params
+        self.stats: List[QueryStats] = []
+
+    def iter_jobs(
+        self, tasks: Sequence[FetchTask], known_ids: Optional[AbstractSet[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Merged stream of raw jobs from every task.
+
+        A failing query is recorded on its QueryStats.error and the others keep
+        going; the error is raised only if every query failed.
+        """
+        self.stats = [QueryStats(task) for task in tasks]
+        if not tasks:
+            return
+        known = known_ids if known_ids is not None else frozenset()
+        buffer: "queue.Queue" = queue.Queue(maxsize=max(1, self.buffer_size))
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(qs: QueryStats) -> None:
+            jobs = self.client.iter_jobs(
+                **qs.task.params(),
+                known_ids=known_ids,
+                budget=self.budget,
+                stats=qs.fetch,
+                **self.iter_params,
+            )
+            try:
+                for job in jobs:
+                    if not put((qs, job)):
+                        return
+            except Exception as e:  # recorded on the query, the others keep going
+                qs.error = e
+            finally:
+                jobs.close()
+                put(_Done())
+
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            for qs in self.stats:
+                pool.submit(produce, qs)
+            try:
+                done = 0
+                while done < len(self.stats):
+                    item = buffer.get()
+                    if isinstance(item, _Done):
+                        done += 1
+                        continue
+                    qs, job = item
+                    qs.jobs += 1
+                    job_id = adzuna_job_id(job)
+                    if job_id:
+                        if job_id in seen:
+                            qs.duplicates += 1
+                            continue
+                        seen.add(job_id)
+                        if job_id not in known:
+                            qs.new_jobs += 1
+                    job["search_country"] = qs.task.country_code.upper()
+                    yield job
+            finally:
+                stop.set()
+
+        errors = [s.error for s in self.stats if s.error is not None]
+        if errors and len(errors) == len(self.stats):
+            raise errors[0]
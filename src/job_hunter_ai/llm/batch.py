@@ -0,0 +1,223 @@
+"""
+Batch LLM enrichment across many jobs.
+
+Jobs are scored as they arrive and kept in a priority queue, best match first.
+A fixed number of workers (the concurrency limit) take the best remaining job,
+run enrich_with_llm on it, and hand back the result as soon as it is done. If a
+daily run is cut short (quota, time box, Ctrl-C), the jobs already finished are
+the best-matching ones.
+
+The workers are threads: enrich_with_llm and its stages are synchronous, so the
+worker count is the concurrency limit (the role an asyncio semaphore would play
+over the async client).
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..config import GROQ_BATCH_CONCURRENCY
+from ..scoring import ProfileLike, as_scoring_context, compute_deterministic_score
+from .enrich import enrich_with_llm
+
+
+@dataclass
+class EnrichmentResult:
+    job: Dict[str, Any]
+    score: int
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    queued: int = 0
+    done: int = 0
+    failed: int = 0
+    not_started: int = 0  # left in the queue when the batch stopped early
+    aborted: bool = False
+
+
+class _WorkerDone:
+    """Marks the end of one worker."""
+
+
+def deterministic_scorer(profile: ProfileLike) -> Callable[[Dict], int]:
+    """job -> deterministic score, with the profile prepared once for the batch."""
+    ctx = as_scoring_context(profile)
+    return lambda job: compute_deterministic_score(ctx, job).deterministic_score
+
+
+class BatchEnricher:
+    """
+    Usage:
+        enricher = BatchEnricher(profile, experiences_md, projects_md, max_concurrency=4)
+        for result in enricher.run(jobs):          # best scores first, as they finish
+            if result.ok:
+                save(result.job, result.output)
+        print(enricher.stats)
+
+    Args:
+        profile / experiences_md / projects_md: As for enrich_with_llm
+        max_concurrency: Jobs enriched at the same time
+        score: job -> priority (default: deterministic score)
+        lookahead: Start enriching once this many jobs are queued (None = after the
+            whole input is scored, for a strict best-first order)
+        max_consecutive_errors: Stop starting new jobs after this many failures in
+            a row (e.g. the daily quota is spent); None = never
+        enrich: The per-job pipeline (default: enrich_with_llm)
+    """
+
+    def __init__(
+        self,
+        profile: Dict[str, Any],
+        experiences_md: str = "",
+        projects_md: str = "",
+        max_concurrency: int = GROQ_BATCH_CONCURRENCY,
+        score: Optional[Callable[[Dict], int]] = None,
+        lookahead: Optional[int] = None,
+        max_consecutive_errors: Optional[int] = 3,
+        enrich: Callable[..., Dict[str, Any]] = enrich_with_llm,
+    ):
+        self.profile = profile
+        self.experiences_md = experiences_md
+        self.projects_md = projects_md
+        self.max_concurrency = max(1, max_concurrency)
+        self.score = score or deterministic_scorer(profile)
+        self.lookahead = lookahead
+        self.max_consecutive_errors = max_consecutive_errors
+        self.enrich = enrich
+        self.stats = BatchStats()
+
+    def run(self, jobs: Iterable[Dict]) -> Iterator[EnrichmentResult]:
+        """
+        Enrich jobs best score first, yielding results in completion order.
+
+        Per-job errors are returned on EnrichmentResult.error. Closing the
+        iterator early stops the batch: it returns once the jobs in progress
+        have finished (their results are dropped).
+
+        Raises:
+            Exception: If reading or scoring the input fails
+        """
+        stats = self.stats = BatchStats()
+        heap: List[Tuple[int, int, Dict]] = []
+        order = itertools.count()  # FIFO among equal scores
+        cond = threading.Condition()
+        stop = threading.Event()
+        intake_done = threading.Event()
+        intake_error: List[BaseException] = []
+        results: "queue.Queue" = queue.Queue()
+        consecutive_errors = 0
+
+        def ready() -> bool:
+            if intake_done.is_set() or self.lookahead is None:
+                return intake_done.is_set()
+            return len(heap) >= self.lookahead
+
+        def intake() -> None:
+            try:
+                for job in jobs:
+                    if stop.is_set():
+                        break
+                    score = int(self.score(job))
+                    with cond:
+                        heapq.heappush(heap, (-score, next(order), job))
+                        stats.queued += 1
+                        cond.notify()
+            except BaseException as e:  # re-raised by the consumer
+                intake_error.append(e)
+                stop.set()
+            finally:
+                intake_done.set()
+                with cond:
+                    cond.notify_all()
+
+        def work() -> None:
+            nonlocal consecutive_errors
+            try:
+                while True:
+                    with cond:
+                        while not stop.is_set() and not (heap and ready()):
+                            if intake_done.is_set() and not heap:
+                                return
+                            cond.wait(0.1)
+                        if stop.is_set():
+                            return
+                        neg_score, _, job = heapq.heappop(heap)
+                    result = EnrichmentResult(job, -neg_score)
+                    t0 = time.perf_counter()
+                    try:
+                        result.output = self.enrich(
+                            self.profile, self.experiences_md, self.projects_md, job, result.score
+                        )
+                    except Exception as e:
+                        result.error = e
+                    result.elapsed_s = time.perf_counter() - t0
+                    with cond:
+                        consecutive_errors = 0 if result.ok else consecutive_errors + 1
+                        if (
+                            self.max_consecutive_errors is not None
+                            and consecutive_errors >= self.max_consecutive_errors
+                        ):
+                            stats.aborted = True
+                            stop.set()
+                            cond.notify_all()
+                    results.put(result)
+            finally:
+                results.put(_WorkerDone())
+
+        threads = [threading.Thread(target=intake, name="enrich-intake", daemon=True)]
+        threads += [
+            threading.Thread(target=work, name=f"enrich-{i}", daemon=True)
+            for i in range(self.max_concurrency)
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            finished = 0
+            while finished < self.max_concurrency:
+                item = results.get()
+                if isinstance(item, _WorkerDone):
+                    finished += 1
+                    continue
+                if item.ok:
+                    stats.done += 1
+                else:
+                    stats.failed += 1
+                yield item
+        finally:
+            stop.set()
+            with cond:
+                cond.notify_all()
+            for worker in threads[1:]:
+                worker.join()  # no enrichment keeps running after run() returns
+            threads[0].join(timeout=5)  # intake may be blocked on a slow input
+            with cond:
+                stats.not_started = len(heap)
+
+        if intake_error:
+            raise intake_error[0]
+
+
+def enrich_batch(
+    jobs: Iterable[Dict],
+    profile: Dict[str, Any],
+    experiences_md: str = "",
+    projects_md: str = "",
+    max_concurrency: int = GROQ_BATCH_CONCURRENCY,
+) -> Iterator[EnrichmentResult]:
+    """Shortcut for BatchEnricher(...).run(jobs)."""
+    return BatchEnricher(profile, experiences_md, projects_md, max_concurrency).run(jobs)
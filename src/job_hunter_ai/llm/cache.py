@@ -0,0 +1,109 @@
+"""
+Persistent cache for Groq chat completions.
+
+A completion is keyed by a hash of everything that determines it: the
+messages, the model and the temperature. Re-running generation for the same
+job (a render fix, a template tweak, a retry after a failure) reuses the stored
+text instead of paying another round trip. Entries expire after a TTL, and the
+store is size-bounded with least recently used eviction (see cache.SqliteCache).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..cache import CacheStats, SqliteCache
+from ..config import CACHE_DIR, GROQ_CACHE_ENABLED, GROQ_CACHE_MAX_ENTRIES, GROQ_CACHE_TTL_SECONDS
+
+
+def completion_key(messages: List[Dict[str, str]], model: str, temperature: float) -> str:
+    """sha256 of the canonical JSON of (messages, model, temperature)."""
+    payload = json.dumps(
+        {"messages": messages, "model": model, "temperature": float(temperature)},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """
+    Usage:
+        cache = CompletionCache()
+        text = cache.get(messages, model, temperature)
+        if text is None:
+            text = ...call the API...
+            cache.set(messages, model, temperature, text)
+        print(cache.stats())
+
+    Args:
+        path: SQLite file (default: CACHE_DIR/groq_completions.sqlite)
+        max_entries: Keep at most this many completions (None = unbounded)
+        ttl_seconds: Completions older than this are fetched again (None = never expire)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_entries: Optional[int] = GROQ_CACHE_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = GROQ_CACHE_TTL_SECONDS,
+    ):
+        self.store = SqliteCache(
+            path or CACHE_DIR / "groq_completions.sqlite",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+
+    def get(self, messages: List[Dict[str, str]], model: str, temperature: float) -> Optional[str]:
+        return self.store.get(completion_key(messages, model, temperature))
+
+    def set(
+        self, messages: List[Dict[str, str]], model: str, temperature: float, text: str
+    ) -> None:
+        self.store.set(completion_key(messages, model, temperature), text)
+
+    def stats(self) -> CacheStats:
+        return self.store.stats()
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def close(self) -> None:
+        self.store.close()
+
+    def __enter__(self) -> "CompletionCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# -----------------------------
+# Process-wide default
+# -----------------------------
+_default_cache: Optional[CompletionCache] = None
+_default_configured = False
+_default_lock = threading.Lock()
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """The cache used by call_groq* (created on first use; None when disabled)."""
+    global _default_cache, _default_configured
+    with _default_lock:
+        if not _default_configured:
+            _default_cache = CompletionCache() if GROQ_CACHE_ENABLED else None
+            _default_configured = True
+        return _default_cache
+
+
+def set_completion_cache(cache: Optional[CompletionCache]) -> None:
+    """Replace the process-wide cache; None turns caching off for this process."""
+    global _default_cache, _default_configured
+    with _default_lock:
+        _default_cache = cache
+        _default_configured = True
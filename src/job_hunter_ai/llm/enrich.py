@@ -4,6 +4,7 @@ from typing import Dict, Any
 
 # Import from groq_client module
 from .groq_client import call_groq, GroqClientError
+from .stages import Stage, run_stages
 
 # Import config for file paths
 import sys
@@ -127,6 +128,9 @@ def enrich_with_llm(
     3. Generate cover letter
     4. Add metadata
 
+    The cover letter does not depend on the CV, so it is generated concurrently
+    with steps 1-2 (see llm/stages.py).
+
     Args:
         profile: Profile dict from profile.yml
         experiences_md: Raw markdown of experiences
@@ -144,6 +148,7 @@ def enrich_with_llm(
         - fit_reasoning: LLM's reasoning about fit
         - llm_score: LLM's score (0-100)
         - deterministic_score: Passed-through deterministic score
+        - timings: Seconds per stage (master_cv, one_page_cv, cover_letter) and total
 
     Raises:
         GroqClientError: If LLM calls fail
@@ -151,14 +156,18 @@ def enrich_with_llm(
     """
     job_desc = f"{job.get('title', '')}\n{job.get('description', '')}"
 
-    # Step 1: Generate master CV
-    master_cv = generate_master_cv(job_desc)
-
-    # Step 2: Compress to one page
-    one_page_cv = compress_to_one_page(master_cv, job_desc)
-
-    # Step 3: Generate cover letter
-    cover_letter = generate_cover_letter(job_desc)
+    # Steps 1-3: master CV -> one page, in parallel with the cover letter
+    run = run_stages([
+        Stage("master_cv", lambda: generate_master_cv(job_desc)),
+        Stage(
+            "one_page_cv",
+            lambda master_cv: compress_to_one_page(master_cv, job_desc),
+            deps=("master_cv",),
+        ),
+        Stage("cover_letter", lambda: generate_cover_letter(job_desc)),
+    ])
+    one_page_cv = run.results["one_page_cv"]
+    cover_letter = run.results["cover_letter"]
 
     # Step 4: Combine outputs with metadata
     result = {
@@ -170,6 +179,7 @@ def enrich_with_llm(
         "fit_reasoning": one_page_cv.get("fit_reasoning", ""),
         "llm_score": one_page_cv.get("llm_score", deterministic_score),
         "deterministic_score": deterministic_score,
+        "timings": {**run.timings, "total": run.wall_s},
     }
 
     return result
@@ -2,10 +2,23 @@
 Unified Groq LLM client using official Groq SDK.
 
 This replaces the previous manual requests-based implementation.
+
+Every request goes through the shared RPM/TPM limiter (llm/ratelimit.py), which
+queues calls under the account limits and retries rate limits with backoff.
+
+One Groq client is created lazily and shared by the whole process, so calls
+reuse its keep-alive connection pool and TLS sessions. The async variants
+(acall_groq / acall_groq_with_messages) share one AsyncGroq client per event
+loop, so many requests can run concurrently from a single loop.
 """
 
+import asyncio
+import threading
+import weakref
 from typing import List, Dict, Optional
-from groq import Groq
+
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient, DefaultHttpxClient, Groq
 
 # Import from parent package
 import sys
@@ -14,10 +27,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from job_hunter_ai.config import (
     GROQ_API_KEY,
+    GROQ_KEEPALIVE_CONNECTIONS,
+    GROQ_MAX_CONNECTIONS,
     GROQ_MODEL,
     GROQ_TEMPERATURE,
     GROQ_TIMEOUT,
 )
+from .cache import get_completion_cache
+from .ratelimit import get_rate_limiter
 
 
 class GroqClientError(Exception):
@@ -25,10 +42,121 @@ class GroqClientError(Exception):
     pass
 
 
+# -----------------------------
+# Shared clients
+# -----------------------------
+_client: Optional[Groq] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=GROQ_MAX_CONNECTIONS,
+        max_keepalive_connections=GROQ_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def _require_api_key() -> str:
+    if not GROQ_API_KEY:
+        raise GroqClientError(
+            "GROQ_API_KEY not set. Please set it in your .env file or environment."
+        )
+    return GROQ_API_KEY
+
+
+def get_client() -> Groq:
+    """
+    The process-wide Groq client (created on first use, thread-safe).
+
+    Raises:
+        GroqClientError: If GROQ_API_KEY is missing
+    """
+    global _client
+    with _clients_lock:
+        if _client is None:
+            _client = Groq(
+                api_key=_require_api_key(),
+                timeout=GROQ_TIMEOUT,
+                max_retries=0,  # retried by the rate limiter
+                http_client=DefaultHttpxClient(limits=_pool_limits()),
+            )
+        return _client
+
+
+def get_async_client() -> AsyncGroq:
+    """
+    The AsyncGroq client of the running event loop (connection pools are bound
+    to the loop they were created on, so each loop gets its own).
+
+    Raises:
+        GroqClientError: If GROQ_API_KEY is missing
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = AsyncGroq(
+                api_key=_require_api_key(),
+                timeout=GROQ_TIMEOUT,
+                max_retries=0,  # retried by the rate limiter
+                http_client=DefaultAsyncHttpxClient(limits=_pool_limits()),
+            )
+            _async_clients[loop] = client
+        return client
+
+
+def _close_async_client(loop: asyncio.AbstractEventLoop, client: AsyncGroq) -> None:
+    if loop.is_closed() or not hasattr(client, "close"):
+        return  # its connections went down with the loop
+    if not loop.is_running():
+        loop.run_until_complete(client.close())
+        return
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    if current is loop:
+        loop.create_task(client.close())
+    else:
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+
+
+def close_clients() -> None:
+    """
+    Close the shared clients; the next call creates fresh ones.
+
+    Each AsyncGroq client is closed on its own event loop: right away if that
+    loop is idle, or scheduled on it if it is running (the close then completes
+    asynchronously). Clients whose loop is already closed are just dropped.
+    """
+    global _client
+    with _clients_lock:
+        client, _client = _client, None
+        async_clients = list(_async_clients.items())
+        _async_clients.clear()
+    if client is not None and hasattr(client, "close"):
+        client.close()
+    for loop, async_client in async_clients:
+        _close_async_client(loop, async_client)
+
+
+def _resolve(model: Optional[str], temperature: Optional[float]):
+    model_name = model or GROQ_MODEL
+    temp = temperature if temperature is not None else GROQ_TEMPERATURE
+    return model_name, temp
+
+
+# -----------------------------
+# Sync calls
+# -----------------------------
 def call_groq(
     prompt: str,
     temperature: Optional[float] = None,
     model: Optional[str] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Call Groq API with a single user prompt.
@@ -37,6 +165,7 @@ def call_groq(
         prompt: User prompt text
         temperature: Temperature for generation (default from config)
         model: Model name (default from config)
+        use_cache: False skips the completion cache lookup (the fresh answer is still stored)
 
     Returns:
         Generated text response
@@ -44,40 +173,31 @@ def call_groq(
     Raises:
         GroqClientError: If API key is missing or API call fails
     """
-    if not GROQ_API_KEY:
-        raise GroqClientError(
-            "GROQ_API_KEY not set. Please set it in your .env file or environment."
-        )
-
-    client = Groq(api_key=GROQ_API_KEY)
-
-    model_name = model or GROQ_MODEL
-    temp = temperature if temperature is not None else GROQ_TEMPERATURE
-
-    try:
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temp,
-        )
-        return response.choices[0].message.content
-
-    except Exception as e:
-        raise GroqClientError(f"Groq API call failed: {str(e)}") from e
+    return call_groq_with_messages(
+        [{"role": "user", "content": prompt}],
+        temperature=temperature,
+        model=model,
+        use_cache=use_cache,
+    )
 
 
 def call_groq_with_messages(
     messages: List[Dict[str, str]],
     temperature: Optional[float] = None,
     model: Optional[str] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Call Groq API with a full message history.
 
+    Identical (messages, model, temperature) requests are answered from the
+    completion cache (llm/cache.py) without an API call.
+
     Args:
         messages: List of message dicts with 'role' and 'content'
         temperature: Temperature for generation (default from config)
         model: Model name (default from config)
+        use_cache: False skips the completion cache lookup (the fresh answer is still stored)
 
     Returns:
         Generated text response
@@ -85,23 +205,97 @@ def call_groq_with_messages(
     Raises:
         GroqClientError: If API key is missing or API call fails
     """
-    if not GROQ_API_KEY:
-        raise GroqClientError(
-            "GROQ_API_KEY not set. Please set it in your .env file or environment."
+    model_name, temp = _resolve(model, temperature)
+
+    cache = get_completion_cache()
+    if cache is not None and use_cache:
+        cached = cache.get(messages, model_name, temp)
+        if cached is not None:
+            return cached
+
+    client = get_client()
+
+    try:
+        response = get_rate_limiter().call(
+            lambda: client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=temp,
+            ),
+            messages,
         )
+        text = response.choices[0].message.content
 
-    client = Groq(api_key=GROQ_API_KEY)
+    except Exception as e:
+        raise GroqClientError(f"Groq API call failed: {str(e)}") from e
+
+    if cache is not None and text is not None:
+        cache.set(messages, model_name, temp, text)
+    return text
 
-    model_name = model or GROQ_MODEL
-    temp = temperature if temperature is not None else GROQ_TEMPERATURE
+
+# -----------------------------
+# Async calls
+# -----------------------------
+async def acall_groq(
+    prompt: str,
+    temperature: Optional[float] = None,
+    model: Optional[str] = None,
+    use_cache: bool = True,
+) -> str:
+    """
+    Async call_groq, for issuing many requests concurrently from one event loop.
+
+    Raises:
+        GroqClientError: If API key is missing or API call fails
+    """
+    return await acall_groq_with_messages(
+        [{"role": "user", "content": prompt}],
+        temperature=temperature,
+        model=model,
+        use_cache=use_cache,
+    )
+
+
+async def acall_groq_with_messages(
+    messages: List[Dict[str, str]],
+    temperature: Optional[float] = None,
+    model: Optional[str] = None,
+    use_cache: bool = True,
+) -> str:
+    """
+    Async call_groq_with_messages (same completion cache).
+
+    Usage:
+        texts = await asyncio.gather(*(acall_groq(p) for p in prompts))
+
+    Raises:
+        GroqClientError: If API key is missing or API call fails
+    """
+    model_name, temp = _resolve(model, temperature)
+
+    cache = get_completion_cache()
+    if cache is not None and use_cache:
+        cached = cache.get(messages, model_name, temp)
+        if cached is not None:
+            return cached
+
+    client = get_async_client()
 
     try:
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=messages,
-            temperature=temp,
+        response = await get_rate_limiter().acall(
+            lambda: client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=temp,
+            ),
+            messages,
         )
-        return response.choices[0].message.content
+        text = response.choices[0].message.content
 
     except Exception as e:
         raise GroqClientError(f"Groq API call failed: {str(e)}") from e
+
+    if cache is not None and text is not None:
+        cache.set(messages, model_name, temp, text)
+    return text
@@ -0,0 +1,278 @@
+"""
+Client-side requests-per-minute / tokens-per-minute limiter for Groq calls.
+
+Groq limits each API key on both requests and tokens per minute. Every call
+first reserves one request and its estimated tokens (prompt size estimate plus
+an expected completion) from two token buckets. Once the response arrives, the
+estimate is corrected with the usage Groq reports; a failed attempt gives its
+tokens back before it is retried. Calls queue instead of being rejected, so a
+busy batch stays just under the limits.
+
+When the server still answers 429 (or 5xx / a dropped connection), the call is
+retried. The delay is the Retry-After hint (plus a little jitter, capped at
+max_backoff) or, without a hint, jittered exponential backoff. A 429 also
+empties both buckets and pauses every caller until the delay has passed, so
+concurrent workers back off together instead of piling on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import groq
+
+from ..config import (
+    GROQ_COMPLETION_TOKENS_ESTIMATE,
+    GROQ_MAX_RETRIES,
+    GROQ_REQUESTS_PER_MINUTE,
+    GROQ_TOKENS_PER_MINUTE,
+)
+from ..ratelimit import TokenBucket, parse_retry_after
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough prompt size: ~4 characters per token plus a few tokens per message."""
+    return sum(len(m.get("content") or "") // 4 + 4 for m in messages)
+
+
+def _usage_tokens(response: Any) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    return int(total) if total is not None else None
+
+
+def _retry_hint(error: BaseException) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def is_retryable(error: BaseException) -> bool:
+    """429 / 5xx status errors, connection failures and timeouts from the Groq SDK."""
+    if isinstance(error, groq.APIStatusError):
+        return error.status_code in RETRY_STATUSES
+    # APITimeoutError is a subclass of APIConnectionError
+    return isinstance(error, groq.APIConnectionError)
+
+
+@dataclass(frozen=True)
+class Headroom:
+    requests: float  # requests that could start right now
+    tokens: float  # tokens that could be spent right now
+    cooldown_s: float  # pause left after a 429 (0 if none)
+
+
+@dataclass
+class LimiterStats:
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    waited_s: float = 0.0
+    tokens_estimated: int = 0
+    tokens_used: int = 0
+
+
+class GroqRateLimiter:
+    """
+    Usage:
+        limiter = GroqRateLimiter(requests_per_minute=30, tokens_per_minute=12000)
+        response = limiter.call(lambda: client.chat.completions.create(...), messages)
+        print(limiter.headroom(), limiter.stats)
+
+    Args:
+        requests_per_minute / tokens_per_minute: The account's Groq limits
+        completion_tokens: Expected completion size, added to the prompt estimate
+        max_retries / backoff / max_backoff: Retry policy for 429 / 5xx / connection errors
+            (max_backoff also caps the Retry-After hint)
+        clock / sleep / rng: Injectable for tests
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = GROQ_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = GROQ_TOKENS_PER_MINUTE,
+        completion_tokens: int = GROQ_COMPLETION_TOKENS_ESTIMATE,
+        max_retries: int = GROQ_MAX_RETRIES,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.requests = TokenBucket.per_minute(requests_per_minute, clock=clock, sleep=sleep)
+        self.tokens = TokenBucket.per_minute(tokens_per_minute, clock=clock, sleep=sleep)
+        self.completion_tokens = completion_tokens
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = LimiterStats()
+
+    # -----------------------------
+    # Budget
+    # -----------------------------
+    def estimate(self, messages: List[Dict[str, str]]) -> int:
+        """Tokens reserved for a call: prompt estimate + expected completion."""
+        return estimate_tokens(messages) + self.completion_tokens
+
+    def _try_reserve(self, tokens: int) -> float:
+        """Take one request and `tokens` now (returns 0), or return seconds to wait."""
+        tokens = min(tokens, self.tokens.capacity)  # a huge prompt waits for a full bucket
+        with self._lock:
+            cooldown = self._cooldown_until - self._clock()
+            if cooldown > 0:
+                return cooldown
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+            if wait > 0:
+                return wait
+            self.requests.adjust(-1)
+            self.tokens.adjust(-tokens)
+            self.stats.calls += 1
+            self.stats.tokens_estimated += tokens
+            return 0.0
+
+    def acquire(self, tokens: int) -> float:
+        """Block until a request and `tokens` are reserved. Returns the time waited."""
+        waited = 0.0
+        while True:
+            delay = self._try_reserve(tokens)
+            if delay <= 0:
+                self.stats.waited_s += waited
+                return waited
+            self._sleep(delay)
+            waited += delay
+
+    async def aacquire(self, tokens: int) -> float:
+        """acquire() for coroutines: waits with asyncio.sleep."""
+        waited = 0.0
+        while True:
+            delay = self._try_reserve(tokens)
+            if delay <= 0:
+                self.stats.waited_s += waited
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def record_usage(self, reserved: int, used: Optional[int]) -> None:
+        """Settle a reservation with the tokens the response actually used."""
+        if used is None:
+            return
+        reserved = min(reserved, self.tokens.capacity)
+        self.tokens.adjust(reserved - used)
+        with self._lock:
+            self.stats.tokens_used += used
+
+    def release(self, reserved: int) -> None:
+        """
+        Give back the tokens of a failed attempt (nothing was generated). The
+        request itself stays spent: the server counted it.
+        """
+        self.tokens.adjust(min(reserved, self.tokens.capacity))
+
+    def headroom(self) -> Headroom:
+        with self._lock:
+            cooldown = max(0.0, self._cooldown_until - self._clock())
+        return Headroom(
+            requests=max(0.0, self.requests.available),
+            tokens=max(0.0, self.tokens.available),
+            cooldown_s=cooldown,
+        )
+
+    # -----------------------------
+    # Retries
+    # -----------------------------
+    def retry_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying after `error` (None = do not retry).
+        A 429 also pauses every caller for that long and empties the buckets.
+        """
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        hint = _retry_hint(error)
+        if hint is not None:
+            delay = min(self.max_backoff, hint * self._rng.uniform(1.0, 1.2))
+        else:
+            delay = self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        with self._lock:
+            self.stats.retries += 1
+            if getattr(error, "status_code", None) == 429:
+                self.stats.rate_limited += 1
+                self._cooldown_until = max(self._cooldown_until, self._clock() + delay)
+        if getattr(error, "status_code", None) == 429:
+            self.requests.drain()
+            self.tokens.drain()
+        return delay
+
+    def call(self, fn: Callable[[], Any], messages: List[Dict[str, str]]) -> Any:
+        """
+        Run fn() (one chat completion request for `messages`) under the limits,
+        retrying rate limits and transient errors. Returns fn's response.
+        """
+        reserved = self.estimate(messages)
+        for attempt in range(self.max_retries + 1):
+            self.acquire(reserved)
+            try:
+                response = fn()
+            except Exception as e:
+                self.release(reserved)  # before retry_delay, which drains on a 429
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                self.stats.waited_s += delay
+                self._sleep(delay)
+                continue
+            self.record_usage(reserved, _usage_tokens(response))
+            return response
+
+    async def acall(
+        self, fn: Callable[[], Awaitable[Any]], messages: List[Dict[str, str]]
+    ) -> Any:
+        """call() for coroutines: `fn` returns an awaitable (e.g. AsyncGroq create)."""
+        reserved = self.estimate(messages)
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire(reserved)
+            try:
+                response = await fn()
+            except Exception as e:
+                self.release(reserved)  # before retry_delay, which drains on a 429
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                self.stats.waited_s += delay
+                await asyncio.sleep(delay)
+                continue
+            self.record_usage(reserved, _usage_tokens(response))
+            return response
+
+
+# -----------------------------
+# Process-wide default
+# -----------------------------
+_default_limiter: Optional[GroqRateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> GroqRateLimiter:
+    """The limiter shared by every call_groq* / acall_groq* (created on first use)."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = GroqRateLimiter()
+        return _default_limiter
+
+
+def set_rate_limiter(limiter: Optional[GroqRateLimiter]) -> None:
+    """Replace the shared limiter (None = a fresh one from config on next use)."""
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
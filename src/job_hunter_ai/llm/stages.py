@@ -0,0 +1,109 @@
+"""
+Run a small dependency graph of (mostly I/O bound) stages concurrently.
+
+Each stage starts as soon as the stages it depends on have finished, on a
+thread pool, and is timed. Used by enrich_with_llm so the LLM calls that do not
+depend on each other (cover letter vs. master CV -> one-page CV) overlap.
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """fn is called with the results of deps, in the order deps are listed."""
+
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageRun:
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per stage
+    wall_s: float = 0.0
+
+
+def _check_graph(stages: Sequence[Stage]) -> None:
+    """
+    Raises:
+        ValueError: On duplicate names, unknown dependencies or cycles
+    """
+    by_name = {s.name: s for s in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Duplicate stage names")
+    for s in stages:
+        unknown = [d for d in s.deps if d not in by_name]
+        if unknown:
+            raise ValueError(f"Stage '{s.name}' depends on unknown stages: {unknown}")
+
+    done: set = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if all(d in done for d in s.deps)]
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {[s.name for s in remaining]}")
+        done.update(s.name for s in ready)
+        remaining = [s for s in remaining if s.name not in done]
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    max_workers: Optional[int] = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> StageRun:
+    """
+    Run every stage once its dependencies are done; independent stages overlap.
+
+    Usage:
+        run = run_stages([
+            Stage("a", fetch_a),
+            Stage("b", lambda a: refine(a), deps=("a",)),
+            Stage("c", fetch_c),
+        ])
+        run.results["b"], run.timings
+
+    Raises:
+        ValueError: If the graph is invalid
+        Exception: The first stage error (stages not yet started are cancelled)
+    """
+    _check_graph(stages)
+    run = StageRun()
+    start = clock()
+    pending = list(stages)
+    running: Dict[Future, Stage] = {}
+
+    def timed(stage: Stage, args: Tuple) -> Any:
+        t0 = clock()
+        try:
+            return stage.fn(*args)
+        finally:
+            run.timings[stage.name] = clock() - t0
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(stages))) as pool:
+        while pending or running:
+            for stage in [s for s in pending if all(d in run.results for d in s.deps)]:
+                pending.remove(stage)
+                args = tuple(run.results[d] for d in stage.deps)
+                running[pool.submit(timed, stage, args)] = stage
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for other in running:
+                        other.cancel()
+                    raise error
+                run.results[stage.name] = future.result()
+
+    run.wall_s = clock() - start
+    return run
@@ -0,0 +1,99 @@
+"""
+Score several candidate profiles against one job corpus in a single pass.
+
+Each job's text is scanned once: skills, seniority signals and hits for the
+union of every profile's architecture/domain keywords are extracted into
+JobFeatures, then every profile is scored with set operations only. Cost goes
+from O(profiles x text scan) to O(text scan + profiles x set ops).
+"""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .scoring import (
+    DeterministicScore,
+    JobFeatures,
+    ProfileLike,
+    as_scoring_context,
+    extract_job_features,
+    score_job_features,
+)
+
+Ranking = List[Tuple[Dict, DeterministicScore]]
+
+
+class MultiProfileScorer:
+    """
+    Usage:
+        scorer = MultiProfileScorer({"alice": alice_profile, "bob": bob_profile})
+        rankings = scorer.rank(jobs, limit=50)
+        rankings["alice"][0]  # (best job, its DeterministicScore)
+    """
+
+    def __init__(self, profiles: Mapping[str, ProfileLike]):
+        if not profiles:
+            raise ValueError("at least one profile is required")
+        self.contexts = {name: as_scoring_context(p) for name, p in profiles.items()}
+        self.keywords: Tuple[str, ...] = tuple(sorted({
+            kw
+            for ctx in self.contexts.values()
+            for kw in ctx.architecture.keywords + ctx.domains.keywords
+        }))
+
+    def keyword_hits(self, features: JobFeatures) -> FrozenSet[str]:
+        """Keywords of any loaded profile that occur in the job text."""
+        return frozenset(kw for kw in self.keywords if kw in features.text)
+
+    def score_job(self, job: Dict) -> Dict[str, DeterministicScore]:
+        """
+        Scores of one job for every profile.
+
+        Raises:
+            ValueError: If job has neither title nor description
+        """
+        features = extract_job_features(job)
+        hits = self.keyword_hits(features)
+        return {
+            name: score_job_features(ctx, features, keyword_hits=hits)
+            for name, ctx in self.contexts.items()
+        }
+
+    def iter_scores(
+        self, jobs: Iterable[Dict]
+    ) -> Iterator[Tuple[Dict, Dict[str, DeterministicScore]]]:
+        for job in jobs:
+            yield job, self.score_job(job)
+
+    def rank(self, jobs: Iterable[Dict], limit: Optional[int] = None) -> Dict[str, Ranking]:
+        """
+        Per-profile rankings by descending deterministic score (ties keep input order).
+        With `limit`, only the top `limit` jobs per profile are kept in memory.
+        """
+        heaps: Dict[str, list] = {name: [] for name in self.contexts}
+        order = count()
+
+        for job, scores in self.iter_scores(jobs):
+            seq = next(order)
+            for name, det in scores.items():
+                # min-heap on (score, -seq): the root is the worst entry kept so far
+                entry = (det.deterministic_score, -seq, job, det)
+                heap = heaps[name]
+                if limit is None or len(heap) < limit:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+        return {
+            name: [(job, det) for _, _, job, det in sorted(heap, key=lambda e: e[:2], reverse=True)]
+            for name, heap in heaps.items()
+        }
+
+
+def rank_profiles(
+    profiles: Mapping[str, ProfileLike], jobs: Iterable[Dict], limit: Optional[int] = None
+) -> Dict[str, Ranking]:
+    """Convenience wrapper around MultiProfileScorer(profiles).rank(jobs, limit)."""
+    return MultiProfileScorer(profiles).rank(jobs, limit=limit)
@@ -0,0 +1,128 @@
+"""
+Token-bucket rate limiting shared by API clients (Adzuna, Google Sheets, Groq).
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf" / "nan" parse as floats but are not a usable delay
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity` (the burst
+    size). acquire() blocks until enough tokens are available.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum tokens held (burst)
+        clock / sleep: Injectable for tests
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be > 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float, burst: Optional[float] = None, **kwargs) -> "TokenBucket":
+        """Bucket allowing `limit` tokens per minute, bursting up to `burst` (default: limit)."""
+        return cls(rate=limit / 60.0, capacity=burst or limit, **kwargs)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` would be available (0 if available now)."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until `tokens` are taken. Returns the total time waited.
+
+        Raises:
+            ValueError: If tokens exceed the bucket capacity (could never succeed)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def adjust(self, tokens: float) -> None:
+        """
+        Add (refund) or remove (debit) tokens without waiting. A debit may leave
+        the balance negative, which delays later acquires until it is paid back.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reported a rate limit."""
+        with self._lock:
+            self._refill()
+            self._tokens = 0.0
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
@@ -0,0 +1,177 @@
+"""
+Shared seniority / years / internship rules.
+
+One place for the keyword families used at ingest time, at filter time and by
+the scorer's seniority penalty. All families are compiled once into a single
+pattern and evaluated in one scan per text, returning a structured RuleVerdict.
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# -----------------------------
+# Rule families (extend over time)
+# -----------------------------
+SENIOR_NEGATIVE: List[str] = [
+    r"\bsenior\b", r"\blead\b", r"\bstaff\b", r"\bprincipal\b",
+    r"\bexpert\b", r"\bconfirmed?\b", r"\bmanager\b", r"\bhead of\b",
+]
+
+# exclude internships / alternance / apprenticeships
+NO_INTERNSHIPS: List[str] = [
+    r"\bintern\b", r"\binternship\b", r"\bstage\b",
+    r"\balternance\b", r"\bapprenticeship\b", r"\bapprenti\b", r"\bapprentissage\b",
+    r"\btrainee\b",
+]
+
+# positive junior hints (not strictly required, but helps scoring/notes)
+JUNIOR_POSITIVE: List[str] = [
+    r"\bjunior\b", r"\bentry[- ]level\b", r"\bgraduate\b",
+    r"\bd[ée]butant\b", r"\bpremi[eè]re exp[eé]rience\b",
+    r"\b0\s*[-–]\s*2\b", r"\b0\s*to\s*2\b",
+]
+
+# Explicit years requirement; the first group is the number of years.
+# Handles: "3 years", "3+ years", "3 ans", "3 années", "au moins 3 ans",
+# "minimum 3 years", "3 ans d'expérience"
+YEARS_PATTERNS: List[str] = [
+    r"(?:minimum|at\s+least)\s+(\d+)\s*(?:years?|yrs?)\b",
+    r"(?:minimum|au\s+moins)\s+(\d+)\s*(?:ans?|ann[eé]es?)\b",
+    r"(\d+)\s*\+?\s*(?:years?|yrs?|ans?|ann[eé]es?)\s+(?:of\s+)?exp[eé]rience\b",
+    r"(\d+)\s*\+?\s*(?:years?|yrs?)\b",
+    r"(\d+)\s*\+?\s*(?:ans?|ann[eé]es?)\b",
+]
+
+EXCLUDED_INTERNSHIP = "Excluded: internship/alternance/apprenticeship detected"
+EXCLUDED_SENIOR = "Excluded: senior role indicators"
+
+
+@dataclass(frozen=True)
+class RuleVerdict:
+    """
+    Outcome of evaluating all rule families on one text.
+
+    years is the highest explicit requirement found (None if none), with the
+    matched text and its (start, end) span in the evaluated text as evidence.
+    """
+
+    excluded_reason: Optional[str]
+    internship: Optional[str]
+    senior: Optional[str]
+    years: Optional[int]
+    years_evidence: Optional[str]
+    evidence_span: Optional[Tuple[int, int]]
+    junior_signals: Tuple[str, ...]
+
+    @property
+    def kept(self) -> bool:
+        return self.excluded_reason is None
+
+
+class RuleEngine:
+    """
+    All families merged into one alternation, probed with a lookahead at every
+    word start so matches of different families can overlap
+    (e.g. junior "0 to 2" and years "2 years").
+    """
+
+    _FAMILIES = ("internship", "senior", "junior")
+
+    def __init__(
+        self,
+        no_internships: List[str],
+        senior_negative: List[str],
+        junior_positive: List[str],
+        years_patterns: List[str],
+    ):
+        branches = [
+            f"(?P<internship>{'|'.join(no_internships)})",
+            f"(?P<senior>{'|'.join(senior_negative)})",
+            f"(?P<junior>{'|'.join(junior_positive)})",
+        ]
+        self._years_groups: List[str] = []
+        for i, pat in enumerate(years_patterns):
+            name = f"years{i}"
+            self._years_groups.append(name)
+            branches.append(pat.replace(r"(\d+)", rf"(?P<{name}>\d+)", 1))
+        self._pattern = re.compile(
+            r"(?<!\w)(?=(?P<match>" + "|".join(branches) + "))", flags=re.IGNORECASE
+        )
+
+    def evaluate(self, text: str, max_years: int = 2) -> RuleVerdict:
+        """Scan text once and decide: internship > senior > years > max_years."""
+        first: Dict[str, str] = {}
+        junior: List[str] = []
+        years: Optional[int] = None
+        evidence: Optional[str] = None
+        span: Optional[Tuple[int, int]] = None
+
+        for m in self._pattern.finditer(text or ""):
+            for family in self._FAMILIES:
+                hit = m.group(family)
+                if hit is not None:
+                    if family == "junior":
+                        junior.append(hit)
+                    else:
+                        first.setdefault(family, hit)
+                    break
+            else:
+                for name in self._years_groups:
+                    digits = m.group(name)
+                    if digits is not None:
+                        found = int(digits)
+                        if years is None or found > years:
+                            years, evidence, span = found, m.group("match"), m.span("match")
+                        break
+
+        if "internship" in first:
+            reason: Optional[str] = EXCLUDED_INTERNSHIP
+        elif "senior" in first:
+            reason = EXCLUDED_SENIOR
+        elif years is not None and years > max_years:
+            reason = f"Excluded: explicit years >{max_years} ({evidence})"
+        else:
+            reason = None
+
+        return RuleVerdict(
+            excluded_reason=reason,
+            internship=first.get("internship"),
+            senior=first.get("senior"),
+            years=years,
+            years_evidence=evidence,
+            evidence_span=span,
+            junior_signals=tuple(dict.fromkeys(junior)),
+        )
+
+
+@lru_cache(maxsize=8)
+def _compile_rules(
+    no_internships: Tuple[str, ...],
+    senior_negative: Tuple[str, ...],
+    junior_positive: Tuple[str, ...],
+    years_patterns: Tuple[str, ...],
+) -> RuleEngine:
+    return RuleEngine(
+        list(no_internships), list(senior_negative), list(junior_positive), list(years_patterns)
+    )
+
+
+def get_rule_engine() -> RuleEngine:
+    """
+    Engine for the current rule lists.
+    Compiled once and rebuilt only if the lists are edited at runtime.
+    """
+    return _compile_rules(
+        tuple(NO_INTERNSHIPS), tuple(SENIOR_NEGATIVE), tuple(JUNIOR_POSITIVE), tuple(YEARS_PATTERNS)
+    )
+
+
+def evaluate_rules(text: str, max_years: int = 2) -> RuleVerdict:
+    """Evaluate every rule family on text in a single scan."""
+    return get_rule_engine().evaluate(text, max_years=max_years)
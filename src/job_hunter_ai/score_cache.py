@@ -0,0 +1,87 @@
+"""
+Persistent cache in front of compute_deterministic_score.
+
+A score only depends on three things, so the cache key is built from them:
+- the normalized job text (title + description)
+- the profile sections scoring reads (ScoringContext.fingerprint)
+- the skill dictionary / seniority rules (scoring.dictionary_version)
+
+Daily rescoring then only pays for new postings, and editing profile.yml or the
+dictionaries naturally invalidates old entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .cache import CacheStats, SqliteCache
+from .config import CACHE_DIR, SCORE_CACHE_MAX_ENTRIES
+from .scoring import (
+    DeterministicScore,
+    ProfileLike,
+    ScoringContext,
+    as_scoring_context,
+    compute_deterministic_score,
+    dictionary_version,
+    normalize_job_text,
+)
+
+
+class ScoreCache:
+    """
+    Usage:
+        cache = ScoreCache()
+        ctx = ScoringContext.from_profile(profile)
+        for job in jobs:
+            det = cache.score(ctx, job)
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_entries: Optional[int] = SCORE_CACHE_MAX_ENTRIES,
+    ):
+        self.store = SqliteCache(path or CACHE_DIR / "scores.sqlite", max_entries=max_entries)
+
+    def key(self, ctx: ScoringContext, job: Dict) -> str:
+        text_hash = hashlib.sha256(normalize_job_text(job).encode("utf-8")).hexdigest()
+        return f"{text_hash}:{ctx.fingerprint()}:{dictionary_version()}"
+
+    def score(self, profile: ProfileLike, job: Dict) -> DeterministicScore:
+        """
+        Cached compute_deterministic_score.
+
+        Raises:
+            ValueError: If required fields are missing or invalid
+        """
+        ctx = as_scoring_context(profile)
+        key = self.key(ctx, job)
+
+        cached = self.store.get(key)
+        if cached is not None:
+            # profile skills are not stored: they come from the context
+            return DeterministicScore(
+                profile_skills_used=list(ctx.sorted_profile_skills), **json.loads(cached)
+            )
+
+        det = compute_deterministic_score(ctx, job)
+        data = det.to_dict()
+        del data["profile_skills_used"]
+        self.store.set(key, json.dumps(data))
+        return det
+
+    def stats(self) -> CacheStats:
+        return self.store.stats()
+
+    def close(self) -> None:
+        self.store.close()
+
+    def __enter__(self) -> "ScoreCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
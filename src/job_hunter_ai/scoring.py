@@ -15,9 +15,30 @@ Notes:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    AbstractSet, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Optional, Union
+)
+
+from .rules import (
+    JUNIOR_POSITIVE,
+    NO_INTERNSHIPS,
+    SENIOR_NEGATIVE,
+    YEARS_PATTERNS,
+    evaluate_rules,
+)
+
+
+# Bump when the scoring formula itself changes (invalidates persisted scores).
+SCORING_VERSION: int = 1
 
 
 # -----------------------------
@@ -62,6 +83,7 @@ BASE_SKILLS: List[str] = [
 
 # Map "alias pattern" -> canonical skill
 SKILL_SYNONYMS: List[Tuple[str, str]] = [
+    (r"\bpython3?\b", "python"),
     (r"\bgcp\b", "gcp"),
     (r"\bgoogle cloud\b", "gcp"),
     (r"\bbig query\b", "bigquery"),
@@ -120,33 +142,148 @@ def flatten_profile_skills(profile: Dict) -> Set[str]:
 # -----------------------------
 # Job skill extraction
 # -----------------------------
-def _apply_synonyms(text: str) -> Set[str]:
-    found: Set[str] = set()
-    for pattern, canonical in SKILL_SYNONYMS:
-        if re.search(pattern, text, flags=re.IGNORECASE):
-            found.add(normalize_text(canonical))
-    return found
+_REGEX_META = re.compile(r"[\\.^$*+?{}\[\]|()]")
 
 
-def extract_job_skills(job_text: str) -> Set[str]:
+def _literal_alias(pattern: str) -> Optional[str]:
+    r"""
+    Turn a simple synonym pattern such as r"\bgithub\s+actions\b" into the plain
+    phrase it matches on normalized text ("github actions").
+    Returns None when the pattern uses real regex features; those are kept as regexes.
+    """
+    body = pattern
+    if body.startswith(r"\b"):
+        body = body[2:]
+    if body.endswith(r"\b"):
+        body = body[:-2]
+    body = body.replace(r"\s+", " ")
+    body = re.sub(r"\\(\W)", r"\1", body)
+    if not body or _REGEX_META.search(body):
+        return None
+    return normalize_text(body)
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    r"""
+    Build a prefix-factored regex from literal phrases, e.g.
+    ["spark", "spark structured streaming"] -> "spark(?:\ structured\ streaming)?".
+    Greedy optionals make the longest phrase win at a given position.
     """
-    Extract skills from the job text using:
-    - curated BASE_SKILLS substring checks (normalized)
-    - regex synonyms mapping (SKILL_SYNONYMS)
+    trie: Dict[str, Dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def walk(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return walk(trie)
+
+
+class SkillMatcher:
     """
-    text = normalize_text(job_text)
-    found: Set[str] = set()
+    Finds every canonical skill of BASE_SKILLS + SKILL_SYNONYMS in one pass.
+
+    All literal aliases are compiled into a single prefix-factored regex, probed
+    at every word start, so the cost grows with text length rather than with
+    dictionary size. Matches are word-bounded: "java" no longer hits "javascript".
+    Aliases that are word-bounded prefixes of a longer alias ("spark" in
+    "spark structured streaming") are credited whenever the longer one matches.
+    """
+
+    def __init__(self, base_skills: Iterable[str], synonyms: Iterable[Tuple[str, str]]):
+        aliases: Dict[str, Set[str]] = {}
+        fallback: List[Tuple[str, str]] = []
+
+        for kw in base_skills:
+            nkw = normalize_text(kw)
+            if nkw:
+                aliases.setdefault(nkw, set()).add(nkw)
+
+        for pattern, canonical in synonyms:
+            ncanon = normalize_text(canonical)
+            literal = _literal_alias(pattern)
+            if literal:
+                aliases.setdefault(literal, set()).add(ncanon)
+            else:
+                fallback.append((pattern, ncanon))
+
+        self._canonicals: Dict[str, FrozenSet[str]] = {}
+        for alias, canon in aliases.items():
+            found = set(canon)
+            for other, other_canon in aliases.items():
+                if (
+                    other != alias
+                    and alias.startswith(other)
+                    and not re.match(r"\w", alias[len(other)])
+                ):
+                    found |= other_canon
+            self._canonicals[alias] = frozenset(found)
+
+        self._pattern = re.compile(r"(?<!\w)(?=(" + _trie_pattern(aliases) + r")(?!\w))")
+        self._fallback = [(re.compile(p, flags=re.IGNORECASE), c) for p, c in fallback]
+
+    def find(self, text: str) -> Set[str]:
+        """Return canonical skills found in already-normalized text."""
+        found: Set[str] = set()
+        for m in self._pattern.finditer(text):
+            found |= self._canonicals[m.group(1)]
+        for regex, canonical in self._fallback:
+            if regex.search(text):
+                found.add(canonical)
+        return found
+
+
+@lru_cache(maxsize=8)
+def _compile_skill_matcher(
+    base_skills: Tuple[str, ...], synonyms: Tuple[Tuple[str, str], ...]
+) -> SkillMatcher:
+    return SkillMatcher(base_skills, synonyms)
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Matcher for the current BASE_SKILLS + SKILL_SYNONYMS.
+    Compiled once and rebuilt only if the dictionaries are edited at runtime.
+    """
+    return _compile_skill_matcher(tuple(BASE_SKILLS), tuple(SKILL_SYNONYMS))
+
+
+def _short_hash(payload) -> str:
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
 
-    # Synonyms first (regex)
-    found |= _apply_synonyms(text)
+@lru_cache(maxsize=None)
+def dictionary_version() -> str:
+    """
+    Hash of everything job-side the scorer depends on: SCORING_VERSION, the skill
+    dictionary and the shared seniority rules. Changes whenever any of them is edited.
+    Computed once per process (the dictionaries are module constants).
+    """
+    return _short_hash([
+        SCORING_VERSION,
+        BASE_SKILLS,
+        SKILL_SYNONYMS,
+        SENIOR_NEGATIVE,
+        NO_INTERNSHIPS,
+        JUNIOR_POSITIVE,
+        YEARS_PATTERNS,
+    ])
 
-    # Direct keyword contains for base skills
-    for kw in BASE_SKILLS:
-        nkw = normalize_text(kw)
-        if nkw and nkw in text:
-            found.add(nkw)
 
-    return found
+def extract_job_skills(job_text: str) -> Set[str]:
+    """
+    Extract canonical skills from the job text in a single pass over the
+    normalized text, covering both BASE_SKILLS and SKILL_SYNONYMS aliases.
+    """
+    return get_skill_matcher().find(normalize_text(job_text))
 
 
 def compute_overlap(job_skills: Set[str], profile_skills: Set[str]) -> Tuple[int, List[str], List[str]]:
@@ -165,69 +302,142 @@ def compute_overlap(job_skills: Set[str], profile_skills: Set[str]) -> Tuple[int
     return clamp_int(pct), overlap, missing
 
 
+# -----------------------------
+# Precompiled profile context
+# -----------------------------
+class KeywordMatcher:
+    """
+    Counts how many profile keywords occur in a normalized job text.
+    Keywords are normalized once; matching keeps the original substring semantics
+    (duplicates in the profile list count twice, as before).
+    """
+
+    def __init__(self, keywords: Iterable):
+        normalized = (normalize_text(str(k)) for k in keywords or [])
+        self.keywords: Tuple[str, ...] = tuple(k for k in normalized if k)
+
+    def count(self, text: str) -> int:
+        return sum(1 for k in self.keywords if k in text)
+
+    def count_hits(self, hits: AbstractSet[str]) -> int:
+        """Same count, from the set of keywords already known to occur in the text."""
+        return sum(1 for k in self.keywords if k in hits)
+
+
+def _read_max_years(profile: Dict) -> int:
+    # read max years from profile, fallback to 2
+    max_years = 2
+    seniority = profile.get("seniority")
+    if isinstance(seniority, dict):
+        try:
+            max_years = int(seniority.get("total_years_experience", 2))
+        except Exception:
+            max_years = 2
+    return max_years
+
+
+@dataclass(frozen=True)
+class ScoringContext:
+    """
+    Everything the scorer reads from profile.yml, preprocessed once.
+    Build it with ScoringContext.from_profile(profile) and reuse it for a whole batch.
+    """
+
+    profile_skills: FrozenSet[str]
+    sorted_profile_skills: Tuple[str, ...]
+    architecture: KeywordMatcher
+    domains: KeywordMatcher
+    max_years: int
+
+    @classmethod
+    def from_profile(cls, profile: Dict) -> "ScoringContext":
+        if not isinstance(profile, dict):
+            raise ValueError("profile must be a dict")
+        skills = frozenset(flatten_profile_skills(profile))
+        return cls(
+            profile_skills=skills,
+            sorted_profile_skills=tuple(sorted(skills)),
+            architecture=KeywordMatcher(profile.get("architecture_experience", [])),
+            domains=KeywordMatcher(profile.get("domain_exposure", [])),
+            max_years=_read_max_years(profile),
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Hash of the profile sections scoring reads (skills, keywords, max_years).
+        Computed on first use and kept on the (frozen) context.
+        """
+        cached = self.__dict__.get("_fingerprint")
+        if cached is None:
+            cached = _short_hash([
+                self.sorted_profile_skills,
+                self.architecture.keywords,
+                self.domains.keywords,
+                self.max_years,
+            ])
+            object.__setattr__(self, "_fingerprint", cached)
+        return cached
+
+
+ProfileLike = Union[Dict, ScoringContext]
+
+
+def as_scoring_context(profile: ProfileLike) -> ScoringContext:
+    """Return profile unchanged if it is already a ScoringContext, else build one."""
+    if isinstance(profile, ScoringContext):
+        return profile
+    return ScoringContext.from_profile(profile)
+
+
 # -----------------------------
 # Bonuses / penalties
 # -----------------------------
-def architecture_bonus(job_text: str, profile: Dict) -> int:
-    text = normalize_text(job_text)
-    keywords = profile.get("architecture_experience", []) or []
-    matches = 0
-    for k in keywords:
-        nk = normalize_text(str(k))
-        if nk and nk in text:
-            matches += 1
+def architecture_bonus(job_text: str, profile: ProfileLike) -> int:
+    ctx = as_scoring_context(profile)
+    matches = ctx.architecture.count(normalize_text(job_text))
     return clamp_int(matches * 5, 0, 20)  # cap +20
 
 
-def domain_bonus(job_text: str, profile: Dict) -> int:
-    text = normalize_text(job_text)
-    domains = profile.get("domain_exposure", []) or []
-    matches = 0
-    for d in domains:
-        nd = normalize_text(str(d))
-        if nd and nd in text:
-            matches += 1
+def domain_bonus(job_text: str, profile: ProfileLike) -> int:
+    ctx = as_scoring_context(profile)
+    matches = ctx.domains.count(normalize_text(job_text))
     return clamp_int(matches * 5, 0, 10)  # cap +10
 
 
+def seniority_signals(job_text: str) -> Tuple[bool, Optional[int]]:
+    """
+    Profile-independent seniority evidence for a job text, from the shared rules.
+
+    Returns:
+      (senior keyword present, highest explicit years requirement or None)
+    """
+    verdict = evaluate_rules(normalize_text(job_text))
+    return verdict.senior is not None, verdict.years
+
+
 def seniority_penalty(job_text: str, max_years: int = 2) -> int:
     """
     Penalty if job looks senior or explicitly asks for more than max_years.
     Conservative by design: helps ranking when some jobs slip through filtering.
     """
-    text = normalize_text(job_text)
-
-    senior_kw = [
-        r"\bsenior\b", r"\blead\b", r"\bprincipal\b", r"\bstaff\b",
-        r"\bmanager\b", r"\bhead of\b", r"\bconfirmed?\b",
-    ]
-    if any(re.search(p, text) for p in senior_kw):
+    senior, years = seniority_signals(job_text)
+    if senior or (years is not None and years > max_years):
         return -20
-
-    year_patterns = [
-        r"(\d+)\s*\+?\s*(?:years?|yrs?)\b",
-        r"(\d+)\s*\+?\s*(?:ans?|ann[eé]es?)\b",
-        r"(?:minimum|at\s+least)\s+(\d+)\s*(?:years?|yrs?)\b",
-        r"(?:minimum|au\s+moins)\s+(\d+)\s*(?:ans?|ann[eé]es?)\b",
-    ]
-    for pat in year_patterns:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            try:
-                years = int(m.group(1))
-                if years > max_years:
-                    return -20
-            except ValueError:
-                pass
-
     return 0
 
 
 # -----------------------------
 # Scoring objects
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class DeterministicScore:
+    """
+    Deterministic score breakdown.
+
+    Slotted (no per-instance __dict__), so 100k scores held for ranking stay
+    small; the skill lists hold references to the dictionary's skill strings.
+    """
+
     job_skills_found: List[str]
     profile_skills_used: List[str]
     skill_overlap_pct: int
@@ -238,6 +448,9 @@ class DeterministicScore:
     seniority_penalty: int
     deterministic_score: int
 
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
 
 @dataclass
 class HybridScore:
@@ -250,23 +463,13 @@ class HybridScore:
 # -----------------------------
 # Core scoring
 # -----------------------------
-def compute_deterministic_score(profile: Dict, job: Dict) -> DeterministicScore:
+def normalize_job_text(job: Dict) -> str:
     """
-    Compute deterministic score for a job based on profile.
-
-    Args:
-        profile: Profile dict (must have 'technical_stack')
-        job: Job dict (must have 'title' and/or 'description')
-
-    Returns:
-        DeterministicScore with detailed breakdown
+    Normalized "title + description" text that every scorer works on.
 
     Raises:
-        ValueError: If required fields are missing or invalid
+        ValueError: If job is not a dict or has neither title nor description
     """
-    # Input validation
-    if not isinstance(profile, dict):
-        raise ValueError("profile must be a dict")
     if not isinstance(job, dict):
         raise ValueError("job must be a dict")
 
@@ -274,33 +477,73 @@ def compute_deterministic_score(profile: Dict, job: Dict) -> DeterministicScore:
     if not job_text.strip():
         raise ValueError("job must have either 'title' or 'description'")
 
-    job_text_norm = normalize_text(job_text)
+    return normalize_text(job_text)
 
-    profile_skills = flatten_profile_skills(profile)
-    job_skills = extract_job_skills(job_text_norm)
 
-    overlap_pct, overlap_list, missing_list = compute_overlap(job_skills, profile_skills)
+@dataclass(frozen=True)
+class JobFeatures:
+    """
+    Profile-independent facts about a job, extracted once from its text.
+    Any number of profiles can then be scored against them without rescanning.
+    """
 
-    arch_b = architecture_bonus(job_text_norm, profile)
-    dom_b = domain_bonus(job_text_norm, profile)
+    text: str
+    skills: FrozenSet[str]
+    senior: bool
+    years: Optional[int]
 
-    # read max years from profile, fallback to 2
-    max_years = 2
-    seniority = profile.get("seniority")
-    if isinstance(seniority, dict):
-        try:
-            max_years = int(seniority.get("total_years_experience", 2))
-        except Exception:
-            max_years = 2
 
-    sen_p = seniority_penalty(job_text_norm, max_years=max_years)
+def extract_job_features(job: Dict) -> JobFeatures:
+    """
+    Raises:
+        ValueError: If job is not a dict or has neither title nor description
+    """
+    return job_features_from_text(normalize_job_text(job))
+
+
+def job_features_from_text(text: str) -> JobFeatures:
+    """JobFeatures for a job text (normalized here if it is not already)."""
+    text = normalize_text(text)
+    senior, years = seniority_signals(text)
+    return JobFeatures(
+        text=text, skills=frozenset(extract_job_skills(text)), senior=senior, years=years
+    )
+
+
+def score_job_features(
+    profile: ProfileLike,
+    features: JobFeatures,
+    keyword_hits: Optional[AbstractSet[str]] = None,
+) -> DeterministicScore:
+    """
+    Score pre-extracted JobFeatures; same result as compute_deterministic_score.
+
+    keyword_hits, if given, is the set of profile keywords known to occur in
+    features.text (it must cover this profile's keywords); it avoids rescanning
+    the text when several profiles are scored against the same job.
+    """
+    ctx = as_scoring_context(profile)
+
+    overlap_pct, overlap_list, missing_list = compute_overlap(features.skills, ctx.profile_skills)
+
+    if keyword_hits is None:
+        arch_hits = ctx.architecture.count(features.text)
+        dom_hits = ctx.domains.count(features.text)
+    else:
+        arch_hits = ctx.architecture.count_hits(keyword_hits)
+        dom_hits = ctx.domains.count_hits(keyword_hits)
+    arch_b = clamp_int(arch_hits * 5, 0, 20)  # cap +20
+    dom_b = clamp_int(dom_hits * 5, 0, 10)  # cap +10
+
+    too_many_years = features.years is not None and features.years > ctx.max_years
+    sen_p = -20 if features.senior or too_many_years else 0
 
     # Deterministic score: overlap + bonuses + penalty
     det_score = clamp_int(overlap_pct + arch_b + dom_b + sen_p)
 
     return DeterministicScore(
-        job_skills_found=sorted(job_skills),
-        profile_skills_used=sorted(profile_skills),
+        job_skills_found=sorted(features.skills),
+        profile_skills_used=list(ctx.sorted_profile_skills),
         skill_overlap_pct=overlap_pct,
         overlap_skills=overlap_list,
         missing_skills=missing_list,
@@ -311,6 +554,26 @@ def compute_deterministic_score(profile: Dict, job: Dict) -> DeterministicScore:
     )
 
 
+def compute_deterministic_score(profile: ProfileLike, job: Dict) -> DeterministicScore:
+    """
+    Compute deterministic score for a job based on profile.
+
+    Args:
+        profile: Profile dict (must have 'technical_stack') or a prebuilt
+            ScoringContext (recommended when scoring many jobs)
+        job: Job dict (must have 'title' and/or 'description')
+
+    Returns:
+        DeterministicScore with detailed breakdown
+
+    Raises:
+        ValueError: If required fields are missing or invalid
+    """
+    # Input validation
+    ctx = as_scoring_context(profile)
+    return score_job_features(ctx, extract_job_features(job))
+
+
 def bounded_llm_score(llm_score: int, deterministic_score: int, max_delta: int = 25) -> Tuple[int, Tuple[int, int]]:
     lo = clamp_int(deterministic_score - max_delta)
     hi = clamp_int(deterministic_score + max_delta)
@@ -324,7 +587,7 @@ def blend_scores(deterministic_score: int, llm_score: int, weight_llm: float = 0
 
 
 def compute_hybrid_score(
-    profile: Dict,
+    profile: ProfileLike,
     job: Dict,
     llm_score: Optional[int],
     weight_llm: float = 0.6,
@@ -349,3 +612,105 @@ def compute_hybrid_score(
         final_score=final,
         llm_score_bounds=bounds,
     )
+
+
+# -----------------------------
+# Batch scoring
+# -----------------------------
+_WORKER_CONTEXT: Optional[ScoringContext] = None
+
+
+def _init_score_worker(ctx: ScoringContext) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = ctx
+
+
+def _score_chunk(jobs: List[Dict]) -> List[DeterministicScore]:
+    return [compute_deterministic_score(_WORKER_CONTEXT, job) for job in jobs]
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_jobs(
+    profile: ProfileLike,
+    jobs: Iterable[Dict],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[Dict, DeterministicScore]]:
+    """
+    Score a stream of jobs, yielding (job, DeterministicScore) pairs.
+
+    Jobs are sent to a process pool in chunks of `chunksize`; at most
+    `max_pending` chunks (default 2 per worker) are in flight, so memory stays
+    bounded however long `jobs` is. The profile is turned into a ScoringContext
+    once and shipped to each worker a single time.
+
+    Args:
+        profile: Profile dict or ScoringContext
+        jobs: Any iterable of job dicts (consumed lazily)
+        workers: Process count (default: all cores); 1 scores in-process
+        chunksize: Jobs per task sent to a worker
+        ordered: Yield in input order (True) or as chunks complete (False)
+        max_pending: Maximum chunks submitted but not yet yielded
+
+    Raises:
+        ValueError: On invalid arguments or if a job cannot be scored
+    """
+    ctx = as_scoring_context(profile)
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for job in jobs:
+            yield job, compute_deterministic_score(ctx, job)
+        return
+
+    max_pending = max_pending or workers * 2
+    chunks = _chunked(jobs, chunksize)
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_score_worker, initargs=(ctx,)
+    )
+    in_order: deque = deque()
+    in_flight: Dict[Future, List[Dict]] = {}
+
+    def submit_next() -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        future = pool.submit(_score_chunk, chunk)
+        if ordered:
+            in_order.append((future, chunk))
+        else:
+            in_flight[future] = chunk
+        return True
+
+    try:
+        while len(in_order) + len(in_flight) < max_pending and submit_next():
+            pass
+
+        if ordered:
+            while in_order:
+                future, chunk = in_order.popleft()
+                results = future.result()
+                submit_next()
+                yield from zip(chunk, results)
+        else:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = in_flight.pop(future)
+                    results = future.result()
+                    submit_next()
+                    yield from zip(chunk, results)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,8 @@
+"""
+Google Sheets integration module.
+
+Provides the worksheet connection helper and the sync between the local job
+store and the pipeline sheet.
+"""
+
+__all__ = []
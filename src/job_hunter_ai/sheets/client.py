@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import gspread
+from google.oauth2.service_account import Credentials
+
+SHEETS_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+
+def connect_worksheet(
+    spreadsheet_name: Optional[str] = None,
+    worksheet_name: Optional[str] = None,
+) -> gspread.Worksheet:
+    """
+    Open the pipeline worksheet with the service account from GOOGLE_CREDENTIALS_PATH.
+
+    Names default to GOOGLE_SHEETS_SPREADSHEET_NAME / GOOGLE_SHEETS_WORKSHEET_NAME.
+    """
+    spreadsheet_name = spreadsheet_name or os.environ["GOOGLE_SHEETS_SPREADSHEET_NAME"]
+    worksheet_name = worksheet_name or os.environ.get(
+        "GOOGLE_SHEETS_WORKSHEET_NAME", "job_pipeline"
+    )
+
+    creds = Credentials.from_service_account_file(
+        os.environ["GOOGLE_CREDENTIALS_PATH"], scopes=SHEETS_SCOPES
+    )
+    gc = gspread.authorize(creds)
+    return gc.open(spreadsheet_name).worksheet(worksheet_name)
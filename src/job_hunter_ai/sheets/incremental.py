@@ -0,0 +1,63 @@
+"""
+Helpers for incremental passes over the pipeline sheet.
+
+New jobs are only ever appended at the bottom of the sheet, so a stage can
+remember the last row it processed (RowCheckpoint) and next time read just the
+rows below it. Results go through sheets.writer.SheetWriter, which merges them
+into a few rectangular ranges sent in a single batch update.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+from ..config import DATA_DIR
+
+
+class RowCheckpoint:
+    """
+    Last processed sheet row per stage/worksheet, kept in a small JSON file.
+
+    Usage:
+        checkpoint = RowCheckpoint("filter_jobs", ws.id)
+        start = checkpoint.last_row + 1          # 2 on the first run
+        ...process rows start..end...
+        checkpoint.save(end)
+    """
+
+    def __init__(self, stage: str, worksheet_id, path: Union[str, Path, None] = None):
+        self.path = Path(path or DATA_DIR / "sheet_checkpoints.json")
+        self.key = f"{stage}:{worksheet_id}"
+
+    def _load_all(self) -> Dict[str, int]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    @property
+    def last_row(self) -> int:
+        """Last processed row (1 = only the header row so far)."""
+        return int(self._load_all().get(self.key, 1))
+
+    def save(self, last_row: int) -> None:
+        data = self._load_all()
+        data[self.key] = int(last_row)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def column_runs(cols: Sequence[int]) -> List[Tuple[int, int]]:
+    """[1, 2, 3, 7, 8] -> [(1, 3), (7, 8)]"""
+    runs: List[Tuple[int, int]] = []
+    for col in sorted(set(cols)):
+        if runs and col == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], col)
+        else:
+            runs.append((col, col))
+    return runs
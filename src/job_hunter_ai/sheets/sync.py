@@ -0,0 +1,196 @@
+"""
+Sync between the local JobStore and the pipeline worksheet.
+
+pull() imports sheet rows into the store: by default only the rows below the
+last row the store knows (rows someone else appended), with full=True every row
+(manual edits flow back; rows with unpushed local changes keep them).
+push() sends only jobs whose local version is ahead of the sheet: existing rows
+are rewritten with batched range updates, new jobs are appended in batches, and
+their row numbers are recorded for the next push. Before rewriting rows, push
+reads the job_id column once, so a sorted / filtered sheet never gets a job
+written over another one: moved jobs are written to their current row and jobs
+deleted from the sheet are appended again.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from gspread.utils import rowcol_to_a1
+
+from ..config import SHEETS_SYNC_BATCH_SIZE
+from ..store import JobStore, PendingJob
+from .writer import APPEND_RETRY_CODES, SheetWriter
+
+_UPDATED_RANGE_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+@dataclass
+class SyncStats:
+    pulled: int = 0
+    updated: int = 0
+    appended: int = 0
+    relocated: int = 0  # rows found at another row number than recorded
+    restored: int = 0  # jobs missing from the sheet, appended again
+    api_calls: int = 0
+
+
+def _cell(value) -> str:
+    return "" if value is None else str(value)
+
+
+class SheetSync:
+    """
+    Usage:
+        store = JobStore()
+        sync = SheetSync(store, connect_worksheet())
+        sync.pull()          # rows appended to the sheet since the last sync
+        sync.pull(full=True) # also pick up manual edits
+        ...stages update the store...
+        sync.push()
+
+    Args:
+        store: Local JobStore
+        worksheet: gspread Worksheet whose first row holds the column headers
+        batch_size: Rows per API call
+        writer: SheetWriter whose quota bucket / retries the writes go through
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        worksheet,
+        batch_size: int = SHEETS_SYNC_BATCH_SIZE,
+        writer: Optional[SheetWriter] = None,
+    ):
+        self.store = store
+        self.ws = worksheet
+        self.batch_size = max(1, batch_size)
+        self.writer = writer or SheetWriter(worksheet)
+        self.stats = SyncStats()
+        self._headers: Optional[List[str]] = None
+
+    @property
+    def headers(self) -> List[str]:
+        if self._headers is None:
+            self.stats.api_calls += 1
+            self._set_headers(self.ws.row_values(1))
+        return self._headers
+
+    def _set_headers(self, row: Sequence[str]) -> None:
+        headers = [h.strip() for h in row]
+        while headers and not headers[-1]:
+            headers.pop()
+        if "job_id" not in headers:
+            raise RuntimeError("Sheet must have a 'job_id' column in header row.")
+        self._headers = headers
+
+    def row_values(self, job: Dict) -> List[str]:
+        return [_cell(job.get(h)) if h else "" for h in self.headers]
+
+    def pull(self, full: bool = False) -> int:
+        """
+        Import sheet rows into the store: the rows below the last one the store
+        knows, or every row if full. Returns jobs inserted or changed.
+        """
+        start_row = 2 if full else (self.store.last_sheet_row() or 1) + 1
+        if start_row == 2:
+            self.stats.api_calls += 1
+            values = self.ws.get_all_values()
+            if not values:
+                raise RuntimeError("Sheet is empty (no header row).")
+            self._set_headers(values[0])
+            values = values[1:]
+        else:
+            self.stats.api_calls += 1
+            self._set_headers(self.ws.row_values(1))
+            last_col = rowcol_to_a1(1, len(self._headers)).rstrip("0123456789")
+            values = []
+            # a range starting below the grid is a 400 from the API, not an empty read
+            if start_row <= self.ws.row_count:
+                self.stats.api_calls += 1
+                values = self.ws.get(f"A{start_row}:{last_col}")
+        headers = self.headers
+
+        def records():
+            for row_num, row in enumerate(values, start=start_row):
+                record = {h: v for h, v in zip(headers, row) if h}
+                if str(record.get("job_id") or "").strip():
+                    yield row_num, record
+
+        changed = self.store.import_remote(records())
+        self.stats.pulled += changed
+        return changed
+
+    def push(self) -> SyncStats:
+        """Write pending jobs to the sheet in batches."""
+        pending = self.store.pending()
+        existing = [job for job in pending if job.sheet_row is not None]
+        new = [job for job in pending if job.sheet_row is None]
+        if existing:
+            existing, missing = self._locate(existing)
+            new = missing + new
+
+        for start in range(0, len(existing), self.batch_size):
+            self._update_rows(existing[start:start + self.batch_size])
+        for start in range(0, len(new), self.batch_size):
+            self._append_rows(new[start:start + self.batch_size])
+        return self.stats
+
+    def _locate(self, jobs: List[PendingJob]) -> Tuple[List[PendingJob], List[PendingJob]]:
+        """
+        Check recorded rows against the sheet's job_id column (one read).
+        Returns (jobs at their current row, jobs no longer in the sheet).
+        """
+        self.stats.api_calls += 1
+        column = self.ws.col_values(self.headers.index("job_id") + 1)
+        rows = {}
+        for row_num, job_id in enumerate(column[1:], start=2):
+            rows.setdefault(str(job_id).strip(), row_num)
+
+        found, missing = [], []
+        for job in jobs:
+            row = rows.get(job.job_id)
+            if row is None:
+                missing.append(replace(job, sheet_row=None))
+                self.stats.restored += 1
+            elif row != job.sheet_row:
+                found.append(replace(job, sheet_row=row))
+                self.stats.relocated += 1
+            else:
+                found.append(job)
+        return found, missing
+
+    def _update_rows(self, batch: List[PendingJob]) -> None:
+        last_col = len(self.headers)
+        data = [
+            {
+                "range": f"A{job.sheet_row}:{rowcol_to_a1(job.sheet_row, last_col)}",
+                "values": [self.row_values(job.data)],
+            }
+            for job in batch
+        ]
+        self.stats.api_calls += 1
+        self.writer.call(self.ws.batch_update, data, value_input_option="RAW")
+        self.store.mark_synced((job.job_id, job.version, job.sheet_row) for job in batch)
+        self.stats.updated += len(batch)
+
+    def _append_rows(self, batch: List[PendingJob]) -> None:
+        self.stats.api_calls += 1
+        response = self.writer.call(
+            self.ws.append_rows,
+            [self.row_values(job.data) for job in batch],
+            value_input_option="RAW",
+            retry_codes=APPEND_RETRY_CODES,  # a 5xx may come after the rows landed
+        )
+        updated_range = ((response or {}).get("updates") or {}).get("updatedRange", "")
+        match = _UPDATED_RANGE_ROW.search(updated_range)
+        if match is None:
+            raise RuntimeError(f"Could not read appended row numbers from {updated_range!r}")
+        first_row = int(match.group(1))
+        self.store.mark_synced(
+            (job.job_id, job.version, first_row + i) for i, job in enumerate(batch)
+        )
+        self.stats.appended += len(batch)
@@ -0,0 +1,234 @@
+"""
+Quota-aware write coalescer for the pipeline worksheet.
+
+Stages queue cell updates and row appends instead of calling the API directly.
+flush() merges the queued cells into as few rectangular ranges as possible
+(adjacent columns of a row, then identical column spans on consecutive rows),
+sends them in one values batch update, and appends queued rows in one call.
+Every API call takes a token from a bucket sized to the Sheets write quota, and
+429 / 5xx responses are retried with jittered backoff, so big backfills run at
+the quota rate instead of failing on it. Appends are not idempotent (a 5xx may
+arrive after the rows were written), so they are only retried on 429.
+
+When a flush still fails, its cells are queued again (values writes can safely
+be repeated) and the error is raised. Rows are queued again only if the append
+was rejected (4xx); after a 5xx or connection error they may already be in the
+sheet, so they are dropped rather than risk duplicates.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from gspread.exceptions import APIError
+from gspread.utils import rowcol_to_a1
+
+from ..config import SHEETS_WRITES_PER_MINUTE
+from ..ratelimit import TokenBucket
+from .incremental import column_runs
+
+RETRY_CODES = frozenset({429, 500, 502, 503})
+APPEND_RETRY_CODES = frozenset({429})
+
+
+@dataclass
+class WriterStats:
+    api_calls: int = 0
+    retries: int = 0
+    cells: int = 0
+    ranges: int = 0
+    rows_appended: int = 0
+    waited_s: float = 0.0
+
+
+def coalesce_cells(cells: Dict[Tuple[int, int], str]) -> List[Dict]:
+    """
+    {(row, col): value} -> batch update payload of rectangular ranges.
+
+    Adjacent columns of a row form a run; runs with the same column span on
+    consecutive rows are stacked into one rectangle.
+    """
+    by_row: Dict[int, List[int]] = {}
+    for row, col in cells:
+        by_row.setdefault(row, []).append(col)
+
+    # (first_col, last_col) -> list of [first_row, last_row] blocks
+    blocks: Dict[Tuple[int, int], List[List[int]]] = {}
+    for row in sorted(by_row):
+        for span in column_runs(by_row[row]):
+            spans = blocks.setdefault(span, [])
+            if spans and spans[-1][1] == row - 1:
+                spans[-1][1] = row
+            else:
+                spans.append([row, row])
+
+    rects = sorted(
+        (first_row, first_col, last_row, last_col)
+        for (first_col, last_col), spans in blocks.items()
+        for first_row, last_row in spans
+    )
+    return [
+        {
+            "range": f"{rowcol_to_a1(r1, c1)}:{rowcol_to_a1(r2, c2)}",
+            "values": [[cells[(r, c)] for c in range(c1, c2 + 1)] for r in range(r1, r2 + 1)],
+        }
+        for r1, c1, r2, c2 in rects
+    ]
+
+
+def _error_code(error: APIError) -> Optional[int]:
+    return getattr(error, "code", None) or getattr(error.response, "status_code", None)
+
+
+class SheetWriter:
+    """
+    Usage:
+        with SheetWriter(ws, headers) as writer:
+            writer.update(row_num, {"status": "READY_LLM", "notes": "..."})
+            writer.append_rows(new_rows)
+        print(writer.stats)
+
+    Args:
+        worksheet: gspread Worksheet (or a stand-in with batch_update / append_rows)
+        headers: Column names of row 1, to address cells by name
+        rate_limiter: Shared TokenBucket (default: SHEETS_WRITES_PER_MINUTE)
+        max_pending_cells: Auto-flush once this many cells are queued
+        max_ranges_per_call: Split very large flushes into several batch updates
+        max_retries / backoff / max_backoff: Retry policy for 429 / 5xx (appends: 429 only)
+    """
+
+    def __init__(
+        self,
+        worksheet,
+        headers: Optional[Sequence[str]] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_pending_cells: int = 50_000,
+        max_ranges_per_call: int = 1_000,
+        max_retries: int = 6,
+        backoff: float = 2.0,
+        max_backoff: float = 64.0,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.ws = worksheet
+        self.columns = {h: i + 1 for i, h in enumerate(headers or []) if h}
+        self.rate_limiter = rate_limiter or TokenBucket.per_minute(SHEETS_WRITES_PER_MINUTE)
+        self.max_pending_cells = max_pending_cells
+        self.max_ranges_per_call = max(1, max_ranges_per_call)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self.stats = WriterStats()
+        self._cells: Dict[Tuple[int, int], str] = {}
+        self._rows: List[List[str]] = []
+        self._lock = threading.RLock()
+
+    # -----------------------------
+    # Queueing
+    # -----------------------------
+    def update_cell(self, row: int, col: int, value) -> None:
+        """Queue one cell (1-based); a later value for the same cell wins."""
+        with self._lock:
+            self._cells[(row, col)] = "" if value is None else str(value)
+            if len(self._cells) >= self.max_pending_cells:
+                self._flush_cells()
+
+    def update(self, row: int, fields: Dict) -> None:
+        """
+        Queue {column name: value} for one row.
+
+        Raises:
+            RuntimeError: If a column is not in headers
+        """
+        with self._lock:
+            for name, value in fields.items():
+                if name not in self.columns:
+                    raise RuntimeError(f"Missing column in sheet: '{name}'")
+                self.update_cell(row, self.columns[name], value)
+
+    def append_rows(self, rows: Sequence[Sequence]) -> None:
+        with self._lock:
+            self._rows.extend(["" if v is None else str(v) for v in row] for row in rows)
+
+    @property
+    def pending(self) -> int:
+        """Queued cells plus queued rows."""
+        return len(self._cells) + len(self._rows)
+
+    # -----------------------------
+    # Flushing
+    # -----------------------------
+    def call(self, fn: Callable, *args, retry_codes=RETRY_CODES, **kwargs):
+        """
+        One write API call under the quota bucket, retrying the HTTP codes in
+        retry_codes (429 / 5xx by default; pass APPEND_RETRY_CODES for calls
+        that must not be repeated once the server may have applied them).
+        """
+        for attempt in range(self.max_retries + 1):
+            self.stats.waited_s += self.rate_limiter.acquire()
+            self.stats.api_calls += 1
+            try:
+                return fn(*args, **kwargs)
+            except APIError as e:
+                code = _error_code(e)
+                if code not in retry_codes or attempt == self.max_retries:
+                    raise
+                if code == 429:
+                    # the server's window is spent: don't burst again on our side either
+                    self.rate_limiter.drain()
+                delay = self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                self.stats.retries += 1
+                self.stats.waited_s += delay
+                self._sleep(delay)
+
+    def _flush_cells(self) -> None:
+        if not self._cells:
+            return
+        cells, self._cells = self._cells, {}
+        data = coalesce_cells(cells)
+        try:
+            for start in range(0, len(data), self.max_ranges_per_call):
+                chunk = data[start:start + self.max_ranges_per_call]
+                self.call(self.ws.batch_update, chunk, value_input_option="RAW")
+                self.stats.ranges += len(chunk)
+        except Exception:
+            # requeue (chunks already sent are simply rewritten); newer values win
+            self._cells = {**cells, **self._cells}
+            raise
+        self.stats.cells += len(cells)
+
+    def _flush_rows(self) -> None:
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        try:
+            self.call(
+                self.ws.append_rows, rows, value_input_option="RAW",
+                retry_codes=APPEND_RETRY_CODES,
+            )
+        except APIError as e:
+            code = _error_code(e)
+            if code is not None and code < 500:
+                self._rows = rows + self._rows  # rejected, nothing was appended
+            raise
+        self.stats.rows_appended += len(rows)
+
+    def flush(self) -> WriterStats:
+        """Send queued cell updates, then queued appends."""
+        with self._lock:
+            self._flush_cells()
+            self._flush_rows()
+        return self.stats
+
+    def __enter__(self) -> "SheetWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.flush()
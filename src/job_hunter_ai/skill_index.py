@@ -0,0 +1,325 @@
+"""
+Persistent inverted index for incremental rescoring.
+
+Each indexed job keeps its profile-independent JobFeatures (normalized text,
+canonical skills, seniority signals) and its current DeterministicScore. An
+inverted index maps terms to job ids:
+- "skill:<canonical skill>" from extract_job_skills
+- "kw:<keyword>" for architecture_experience / domain_exposure keywords
+
+When profile.yml changes, update_profile() diffs the new ScoringContext against
+the stored one and rescores only jobs that mention an added/removed skill or
+keyword (or whose years requirement crosses the new max_years), updating the
+stored scores in place.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .config import CACHE_DIR
+from .scoring import (
+    DeterministicScore,
+    JobFeatures,
+    ProfileLike,
+    ScoringContext,
+    as_scoring_context,
+    dictionary_version,
+    extract_job_features,
+    job_features_from_text,
+    score_job_features,
+)
+
+SKILL_TERM = "skill:"
+KEYWORD_TERM = "kw:"
+
+
+def _profile_state(ctx: ScoringContext) -> Dict:
+    return {
+        "skills": list(ctx.sorted_profile_skills),
+        "architecture": list(ctx.architecture.keywords),
+        "domains": list(ctx.domains.keywords),
+        "max_years": ctx.max_years,
+    }
+
+
+def _changed_keywords(old: List[str], new: Iterable[str]) -> Set[str]:
+    before, after = Counter(old), Counter(new)
+    return {k for k in before.keys() | after.keys() if before[k] != after[k]}
+
+
+class SkillIndex:
+    """
+    Usage:
+        index = SkillIndex()
+        index.add_jobs(profile, jobs)          # jobs need a 'job_id'
+        ...edit profile.yml...
+        rescored = index.update_profile(new_profile)
+        top = index.ranking(limit=50)
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        path = path or CACHE_DIR / "skill_index.sqlite"
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                senior INTEGER NOT NULL,
+                years INTEGER,
+                score TEXT,
+                det_score INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS jobs_years ON jobs(years);
+            CREATE INDEX IF NOT EXISTS jobs_det_score ON jobs(det_score);
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                PRIMARY KEY (term, job_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_job ON postings(job_id);
+            CREATE TABLE IF NOT EXISTS indexed_keywords (keyword TEXT PRIMARY KEY);
+            """
+        )
+        self._profile_skills: Tuple[str, ...] = tuple(
+            (self._get_meta("profile") or {}).get("skills", [])
+        )
+
+    # -----------------------------
+    # Meta / state
+    # -----------------------------
+    def _get_meta(self, key: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+
+    def _save_state(self, ctx: ScoringContext) -> None:
+        self._set_meta("profile", _profile_state(ctx))
+        self._set_meta("dictionary_version", dictionary_version())
+        self._profile_skills = ctx.sorted_profile_skills
+
+    def _index_keywords(self, keywords: Iterable[str]) -> None:
+        """Add postings for keywords not indexed yet (one SQL scan per new keyword)."""
+        for kw in set(keywords):
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO indexed_keywords (keyword) VALUES (?)", (kw,)
+            )
+            if cur.rowcount:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO postings (term, job_id)"
+                    " SELECT ?, job_id FROM jobs WHERE instr(text, ?) > 0",
+                    (KEYWORD_TERM + kw, kw),
+                )
+
+    # -----------------------------
+    # Jobs
+    # -----------------------------
+    def _store_score(self, job_id: str, det: DeterministicScore) -> None:
+        data = det.to_dict()
+        del data["profile_skills_used"]
+        self._conn.execute(
+            "UPDATE jobs SET score = ?, det_score = ? WHERE job_id = ?",
+            (json.dumps(data), det.deterministic_score, job_id),
+        )
+
+    def _load_features(self, row) -> JobFeatures:
+        text, skills, senior, years = row
+        return JobFeatures(
+            text=text, skills=frozenset(json.loads(skills)), senior=bool(senior), years=years
+        )
+
+    def add_jobs(self, profile: ProfileLike, jobs: Iterable[Dict]) -> int:
+        """
+        Index and score jobs (re-indexing any job_id already present).
+        Brings stored scores up to date with `profile` first.
+
+        Raises:
+            ValueError: If a job has no 'job_id' or no title/description
+        """
+        ctx = as_scoring_context(profile)
+        self.update_profile(ctx)
+        keywords = [
+            row[0] for row in self._conn.execute("SELECT keyword FROM indexed_keywords")
+        ]
+
+        count = 0
+        with self._conn:
+            for job in jobs:
+                job_id = str(job.get("job_id") or "").strip()
+                if not job_id:
+                    raise ValueError("job must have a 'job_id' to be indexed")
+                features = extract_job_features(job)
+
+                self._conn.execute("DELETE FROM postings WHERE job_id = ?", (job_id,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO jobs (job_id, text, skills, senior, years)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        job_id,
+                        features.text,
+                        json.dumps(sorted(features.skills)),
+                        int(features.senior),
+                        features.years,
+                    ),
+                )
+                terms = [SKILL_TERM + s for s in features.skills]
+                terms += [KEYWORD_TERM + kw for kw in keywords if kw in features.text]
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO postings (term, job_id) VALUES (?, ?)",
+                    [(term, job_id) for term in terms],
+                )
+                self._store_score(job_id, score_job_features(ctx, features))
+                count += 1
+        return count
+
+    def _rescore(self, ctx: ScoringContext, job_ids: Iterable[str]) -> List[str]:
+        rescored = []
+        for job_id in job_ids:
+            row = self._conn.execute(
+                "SELECT text, skills, senior, years FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            self._store_score(job_id, score_job_features(ctx, self._load_features(row)))
+            rescored.append(job_id)
+        return rescored
+
+    def reindex(self, profile: ProfileLike) -> List[str]:
+        """Re-extract features of every stored job (after a dictionary change) and rescore."""
+        ctx = as_scoring_context(profile)
+        job_ids = []
+        with self._conn:
+            self._conn.execute("DELETE FROM postings")
+            self._conn.execute("DELETE FROM indexed_keywords")
+            rows = self._conn.execute("SELECT job_id, text FROM jobs").fetchall()
+            for job_id, text in rows:
+                features = job_features_from_text(text)
+                self._conn.execute(
+                    "UPDATE jobs SET skills = ?, senior = ?, years = ? WHERE job_id = ?",
+                    (
+                        json.dumps(sorted(features.skills)),
+                        int(features.senior),
+                        features.years,
+                        job_id,
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO postings (term, job_id) VALUES (?, ?)",
+                    [(SKILL_TERM + s, job_id) for s in features.skills],
+                )
+                job_ids.append(job_id)
+            self._index_keywords(ctx.architecture.keywords + ctx.domains.keywords)
+            self._rescore(ctx, job_ids)
+            self._save_state(ctx)
+        return job_ids
+
+    def update_profile(self, profile: ProfileLike) -> List[str]:
+        """
+        Rescore only the jobs a profile change can affect.
+
+        Returns:
+            job ids whose stored score was recomputed
+        """
+        ctx = as_scoring_context(profile)
+        old = self._get_meta("profile")
+
+        if old is not None and self._get_meta("dictionary_version") != dictionary_version():
+            return self.reindex(ctx)
+        if old == _profile_state(ctx):
+            return []
+
+        with self._conn:
+            self._index_keywords(ctx.architecture.keywords + ctx.domains.keywords)
+            if old is None:
+                affected = [row[0] for row in self._conn.execute("SELECT job_id FROM jobs")]
+            else:
+                terms = [
+                    SKILL_TERM + s
+                    for s in set(old["skills"]).symmetric_difference(ctx.profile_skills)
+                ]
+                terms += [
+                    KEYWORD_TERM + kw
+                    for kw in _changed_keywords(old["architecture"], ctx.architecture.keywords)
+                    | _changed_keywords(old["domains"], ctx.domains.keywords)
+                ]
+                affected_set: Set[str] = set()
+                for term in terms:
+                    affected_set.update(
+                        row[0]
+                        for row in self._conn.execute(
+                            "SELECT job_id FROM postings WHERE term = ?", (term,)
+                        )
+                    )
+                if old["max_years"] != ctx.max_years:
+                    lo, hi = sorted((old["max_years"], ctx.max_years))
+                    affected_set.update(
+                        row[0]
+                        for row in self._conn.execute(
+                            "SELECT job_id FROM jobs WHERE years > ? AND years <= ?", (lo, hi)
+                        )
+                    )
+                affected = sorted(affected_set)
+
+            rescored = self._rescore(ctx, affected)
+            self._save_state(ctx)
+        return rescored
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def _score_from_json(self, data: str) -> DeterministicScore:
+        return DeterministicScore(
+            profile_skills_used=list(self._profile_skills), **json.loads(data)
+        )
+
+    def get_score(self, job_id: str) -> Optional[DeterministicScore]:
+        row = self._conn.execute("SELECT score FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return self._score_from_json(row[0])
+
+    def jobs_with(self, skill_or_keyword: str) -> List[str]:
+        """Job ids mentioning a canonical skill (or an indexed profile keyword)."""
+        rows = self._conn.execute(
+            "SELECT job_id FROM postings WHERE term IN (?, ?)",
+            (SKILL_TERM + skill_or_keyword, KEYWORD_TERM + skill_or_keyword),
+        )
+        return sorted({row[0] for row in rows})
+
+    def ranking(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(job_id, deterministic_score) by descending score."""
+        rows = self._conn.execute(
+            "SELECT job_id, det_score FROM jobs ORDER BY det_score DESC, job_id LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        return [(job_id, score) for job_id, score in rows]
+
+    def scores(self) -> Iterator[Tuple[str, DeterministicScore]]:
+        for job_id, data in self._conn.execute("SELECT job_id, score FROM jobs"):
+            yield job_id, self._score_from_json(data)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SkillIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,294 @@
+"""
+Local job store: the pipeline's system of record.
+
+Jobs live in SQLite (WAL) as one row per job_id with the full sheet-shaped
+record stored as JSON, plus the columns stages query on (status, published_at)
+pulled out and indexed. Every change bumps a row version; the sheet sync
+(sheets.sync.SheetSync) pushes rows whose version is ahead of the last synced
+one, so Google Sheets only ever receives what changed.
+
+The ingest and filter stages read and write the store and push to the sheet at
+the end of each batch; the sheet is a view that people may also edit by hand
+(edits flow back on the next pull).
+
+This file has no external deps (pure stdlib).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .config import JOB_STORE_PATH
+
+
+@dataclass(frozen=True)
+class PendingJob:
+    """A job whose local version has not been pushed to the sheet yet."""
+
+    job_id: str
+    data: Dict
+    version: int
+    sheet_row: Optional[int]
+
+
+def _job_id(job: Dict) -> str:
+    job_id = str(job.get("job_id") or "").strip()
+    if not job_id:
+        raise ValueError("Job is missing 'job_id'")
+    return job_id
+
+
+class JobStore:
+    """
+    Usage:
+        store = JobStore()
+        store.upsert(jobs)                         # jobs need a 'job_id'
+        for job in store.iter_jobs(status="NEW"):
+            store.update(job["job_id"], status="READY_LLM", notes="...")
+        SheetSync(store, ws).push()
+
+    Args:
+        path: SQLite file (":memory:" for tests); default JOB_STORE_PATH
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        path = path or JOB_STORE_PATH
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT '',
+                published_at TEXT NOT NULL DEFAULT '',
+                data TEXT NOT NULL,
+                version INTEGER NOT NULL DEFAULT 1,
+                synced_version INTEGER NOT NULL DEFAULT 0,
+                sheet_row INTEGER,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status);
+            CREATE INDEX IF NOT EXISTS jobs_published_at ON jobs(published_at);
+            CREATE INDEX IF NOT EXISTS jobs_pending ON jobs(job_id)
+                WHERE version > synced_version;
+            """
+        )
+
+    # -----------------------------
+    # Writes
+    # -----------------------------
+    def _write(self, job_id: str, fields: Dict, remote_row: Optional[int] = None) -> bool:
+        """
+        Merge fields into one job. remote_row marks the write as coming from the
+        sheet (already in sync) unless the job has unpushed local changes, which win.
+        """
+        row = self._conn.execute(
+            "SELECT data, version, synced_version FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        now = time.time()
+        remote = remote_row is not None
+
+        if row is None:
+            data = {**fields, "job_id": job_id}
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, published_at, data, version,"
+                " synced_version, sheet_row, updated_at) VALUES (?, ?, ?, ?, 1, ?, ?, ?)",
+                (
+                    job_id,
+                    str(data.get("status") or ""),
+                    str(data.get("published_at") or ""),
+                    json.dumps(data, ensure_ascii=False),
+                    1 if remote else 0,
+                    remote_row,
+                    now,
+                ),
+            )
+            return True
+
+        old, version, synced_version = json.loads(row[0]), row[1], row[2]
+        if remote:
+            self._conn.execute(
+                "UPDATE jobs SET sheet_row = ? WHERE job_id = ?", (remote_row, job_id)
+            )
+            if version > synced_version:
+                return False
+
+        data = {**old, **fields}
+        if data == old:
+            return False
+        version += 1
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, published_at = ?, data = ?, version = ?,"
+            " synced_version = ?, updated_at = ? WHERE job_id = ?",
+            (
+                str(data.get("status") or ""),
+                str(data.get("published_at") or ""),
+                json.dumps(data, ensure_ascii=False),
+                version,
+                version if remote else synced_version,
+                now,
+                job_id,
+            ),
+        )
+        return True
+
+    def upsert(self, jobs: Iterable[Dict]) -> int:
+        """
+        Insert new jobs and merge fields into existing ones (one transaction).
+
+        Returns:
+            Number of jobs inserted or actually changed
+
+        Raises:
+            ValueError: If a job has no job_id
+        """
+        changed = 0
+        with self._lock, self._conn:
+            for job in jobs:
+                changed += self._write(_job_id(job), dict(job))
+        return changed
+
+    def update(self, job_id: str, **fields) -> bool:
+        """
+        Set fields on an existing job (e.g. status, notes, scores).
+
+        Raises:
+            KeyError: If job_id is not in the store
+        """
+        with self._lock, self._conn:
+            if not self._exists(job_id):
+                raise KeyError(job_id)
+            return self._write(job_id, fields)
+
+    def update_many(self, updates: Dict[str, Dict]) -> int:
+        """{job_id: fields} applied in one transaction; unknown ids raise KeyError."""
+        changed = 0
+        with self._lock, self._conn:
+            for job_id, fields in updates.items():
+                if not self._exists(job_id):
+                    raise KeyError(job_id)
+                changed += self._write(job_id, fields)
+        return changed
+
+    def import_remote(self, rows: Iterable[Tuple[int, Dict]]) -> int:
+        """
+        Load (sheet_row, record) pairs read from the sheet. They count as synced;
+        jobs with unpushed local changes keep them.
+        """
+        changed = 0
+        with self._lock, self._conn:
+            for sheet_row, job in rows:
+                changed += self._write(_job_id(job), dict(job), remote_row=sheet_row)
+        return changed
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+    def _exists(self, job_id: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone() is not None
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def job_ids(self) -> Set[str]:
+        with self._lock:
+            return {r[0] for r in self._conn.execute("SELECT job_id FROM jobs")}
+
+    def iter_jobs(
+        self,
+        status: Optional[str] = None,
+        published_after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Jobs newest first, optionally filtered by status / published_at (ISO strings)."""
+        sql = "SELECT data FROM jobs"
+        where, args = [], []
+        if status is not None:
+            where.append("status = ?")
+            args.append(status)
+        if published_after is not None:
+            where.append("published_at > ?")
+            args.append(published_after)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY published_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def last_sheet_row(self) -> Optional[int]:
+        """Highest sheet row the store knows of (None before the first pull/push)."""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(sheet_row) FROM jobs").fetchone()[0]
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(
+                self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+            )
+
+    # -----------------------------
+    # Sync bookkeeping
+    # -----------------------------
+    def pending(self, limit: Optional[int] = None) -> List[PendingJob]:
+        """Jobs changed locally since the last push, in sheet order (new rows last)."""
+        sql = (
+            "SELECT job_id, data, version, sheet_row FROM jobs WHERE version > synced_version"
+            " ORDER BY sheet_row IS NULL, sheet_row, updated_at"
+        )
+        args: list = []
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [PendingJob(r[0], json.loads(r[1]), r[2], r[3]) for r in rows]
+
+    def mark_synced(self, synced: Iterable[Tuple[str, int, int]]) -> None:
+        """
+        Record (job_id, pushed version, sheet_row) after a push. A job edited
+        again since it was read stays pending.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE jobs SET synced_version = MAX(synced_version, ?), sheet_row = ?"
+                " WHERE job_id = ?",
+                [(version, row, job_id) for job_id, version, row in synced],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            return self._exists(job_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
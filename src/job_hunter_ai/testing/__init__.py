@@ -0,0 +1,8 @@
+"""
+Offline test and benchmark helpers.
+
+Synthetic job postings and stand-ins for external services, so pipeline stages
+can be exercised and timed without credentials or network access.
+"""
+
+__all__ = []
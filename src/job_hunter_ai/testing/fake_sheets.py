@@ -0,0 +1,293 @@
+"""
+In-memory stand-in for a gspread Worksheet.
+
+Implements the calls the pipeline makes (row_values, col_values, get,
+get_all_values, get_all_records, append_rows, update_cells, batch_update) on a
+list-of-lists grid, and records what a real sheet would have cost: calls per
+method, read/write request counts, cells moved and simulated API time. Latency
+and quota errors (HTTP 429, as gspread.exceptions.APIError) can be injected to
+exercise retry paths. Like a real sheet it has a grid size (row_count): a read
+starting below the last grid row fails with the API's 400 "exceeds grid
+limits" error, and append_rows grows the grid to the last appended row.
+
+Usage:
+    ws = FakeWorksheet(rows=[headers, *data], latency=0.2, sleep=None)
+    run_stage(ws)
+    print(ws.calls, ws.api_time_s)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import time
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+from gspread.exceptions import APIError
+from gspread.utils import rowcol_to_a1
+
+_A1_CELL = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+def _col_index(letters: str) -> int:
+    col = 0
+    for ch in letters:
+        col = col * 26 + (ord(ch) - ord("A") + 1)
+    return col
+
+
+def parse_a1_range(a1: str) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """
+    "B5:D7" -> (5, 2, 7, 4); "A2:K" -> (2, 1, None, 11); "Sheet!A1" -> (1, 1, 1, 1).
+    Missing bounds are None (open-ended).
+    """
+    a1 = a1.split("!")[-1].replace("$", "").upper()
+    first, _, last = a1.partition(":")
+    last = last or first
+    bounds = []
+    for part in (first, last):
+        m = _A1_CELL.match(part)
+        if m is None:
+            raise ValueError(f"Unsupported A1 range: {a1!r}")
+        letters, digits = m.groups()
+        bounds.append((int(digits) if digits else None, _col_index(letters) if letters else None))
+    (r1, c1), (r2, c2) = bounds
+    return r1, c1, r2, c2
+
+
+def _numericise(value: str):
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            continue
+    return value
+
+
+def api_error(code: int, message: str, status: str) -> APIError:
+    """An APIError shaped like the one gspread raises for an HTTP error."""
+    resp = requests.Response()
+    resp.status_code = code
+    resp._content = json.dumps(
+        {"error": {"code": code, "message": message, "status": status}}
+    ).encode("utf-8")
+    return APIError(resp)
+
+
+def quota_error(code: int = 429, message: str = "Quota exceeded") -> APIError:
+    return api_error(code, message, "RESOURCE_EXHAUSTED")
+
+
+class FakeWorksheet:
+    """
+    Args:
+        rows: Initial grid, header row first
+        title / id: Worksheet identity (as on gspread.Worksheet)
+        row_count: Grid rows (default: len(rows), as after values appends)
+        latency: Simulated seconds per API call
+        latency_per_cell: Extra simulated seconds per cell read or written
+        sleep: Called with each call's latency (None = virtual time, only api_time_s grows)
+        read_quota_per_minute / write_quota_per_minute: Raise 429 above these rates
+        error_rate: Probability that any call fails with a 429
+        seed: RNG seed for error_rate
+        clock: Time source for the quota windows
+    """
+
+    def __init__(
+        self,
+        rows: Optional[Iterable[Sequence]] = None,
+        title: str = "daily_jobs",
+        id: int = 0,
+        row_count: Optional[int] = None,
+        latency: float = 0.0,
+        latency_per_cell: float = 0.0,
+        sleep: Optional[Callable[[float], None]] = time.sleep,
+        read_quota_per_minute: Optional[int] = None,
+        write_quota_per_minute: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rows: List[List[str]] = [["" if v is None else str(v) for v in r] for r in rows or []]
+        self.title = title
+        self.id = id
+        self.row_count = max(1, len(self.rows)) if row_count is None else row_count
+        self.latency = latency
+        self.latency_per_cell = latency_per_cell
+        self._sleep = sleep
+        self.read_quota_per_minute = read_quota_per_minute
+        self.write_quota_per_minute = write_quota_per_minute
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._recent: Dict[str, Deque[float]] = {"read": deque(), "write": deque()}
+        self._scripted_errors: Deque[int] = deque()
+
+        self.calls: Counter = Counter()
+        self.requests: Counter = Counter()  # "read" / "write", failed ones included
+        self.errors = 0
+        self.cells_read = 0
+        self.cells_written = 0
+        self.api_time_s = 0.0
+
+    # -----------------------------
+    # Accounting
+    # -----------------------------
+    def fail_next(self, n: int = 1, code: int = 429) -> None:
+        """Make the next n calls fail with HTTP `code`."""
+        self._scripted_errors.extend([code] * n)
+
+    def _now(self) -> float:
+        return self._clock() + (self.api_time_s if self._sleep is None else 0.0)
+
+    def _request(self, method: str, kind: str) -> None:
+        """Count the call and raise the injected / quota error, if any."""
+        self.calls[method] += 1
+        self.requests[kind] += 1
+        self._spend(self.latency)
+
+        if self._scripted_errors:
+            self.errors += 1
+            raise quota_error(self._scripted_errors.popleft())
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.errors += 1
+            raise quota_error()
+
+        limit = self.read_quota_per_minute if kind == "read" else self.write_quota_per_minute
+        if limit is not None:
+            now, window = self._now(), self._recent[kind]
+            while window and now - window[0] >= 60:
+                window.popleft()
+            if len(window) >= limit:
+                self.errors += 1
+                raise quota_error()
+            window.append(now)
+
+    def _spend(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        self.api_time_s += seconds
+        if self._sleep is not None:
+            self._sleep(seconds)
+
+    def _read(self, values: List[List[str]]) -> List[List[str]]:
+        cells = sum(len(r) for r in values)
+        self.cells_read += cells
+        self._spend(self.latency_per_cell * cells)
+        return values
+
+    def _write_cell(self, row: int, col: int, value) -> None:
+        self.row_count = max(self.row_count, row)
+        while len(self.rows) < row:
+            self.rows.append([])
+        line = self.rows[row - 1]
+        if len(line) < col:
+            line.extend([""] * (col - len(line)))
+        line[col - 1] = "" if value is None else str(value)
+
+    def _written(self, cells: int) -> None:
+        self.cells_written += cells
+        self._spend(self.latency_per_cell * cells)
+
+    def _trimmed(self, rows: List[List[str]]) -> List[List[str]]:
+        """Drop trailing empty cells / rows like the Sheets API does."""
+        out = []
+        for r in rows:
+            r = list(r)
+            while r and r[-1] == "":
+                r.pop()
+            out.append(r)
+        while out and not out[-1]:
+            out.pop()
+        return out
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+    def get_all_values(self, **kwargs) -> List[List[str]]:
+        self._request("get_all_values", "read")
+        return self._read(self._trimmed(self.rows))
+
+    def get(self, range_name: Optional[str] = None, **kwargs) -> List[List[str]]:
+        self._request("get", "read")
+        if range_name is None:
+            return self._read(self._trimmed(self.rows))
+        r1, c1, r2, c2 = parse_a1_range(range_name)
+        r1, c1 = r1 or 1, c1 or 1
+        if r1 > self.row_count:
+            raise api_error(
+                400,
+                f"Range ('{self.title}'!{range_name}) exceeds grid limits. "
+                f"Max rows: {self.row_count}",
+                "INVALID_ARGUMENT",
+            )
+        r2 = r2 or len(self.rows)
+        rows = [(self.rows[r - 1] if r <= len(self.rows) else []) for r in range(r1, r2 + 1)]
+        rows = [r[c1 - 1:c2] if c2 is not None else r[c1 - 1:] for r in rows]
+        return self._read(self._trimmed(rows))
+
+    def row_values(self, row: int, **kwargs) -> List[str]:
+        self._request("row_values", "read")
+        values = self._trimmed([self.rows[row - 1]] if row <= len(self.rows) else [])
+        return self._read(values)[0] if values else []
+
+    def col_values(self, col: int, **kwargs) -> List[str]:
+        self._request("col_values", "read")
+        column = [[r[col - 1] if len(r) >= col else ""] for r in self.rows]
+        return [r[0] if r else "" for r in self._read(self._trimmed(column))]
+
+    def get_all_records(self, head: int = 1, default_blank="", **kwargs) -> List[Dict]:
+        self._request("get_all_records", "read")
+        values = self._read(self._trimmed(self.rows))
+        if len(values) < head:
+            return []
+        keys = values[head - 1]
+        records = []
+        for row in values[head:]:
+            row = list(row) + [""] * (len(keys) - len(row))
+            records.append({
+                k: default_blank if v == "" else _numericise(v) for k, v in zip(keys, row)
+            })
+        return records
+
+    # -----------------------------
+    # Writes
+    # -----------------------------
+    def append_rows(self, values: Sequence[Sequence], value_input_option=None, **kwargs) -> Dict:
+        self._request("append_rows", "write")
+        first = len(self._trimmed(self.rows)) + 1
+        del self.rows[first - 1:]
+        for row in values:
+            self.rows.append(["" if v is None else str(v) for v in row])
+        last = first + len(values) - 1
+        self.row_count = max(self.row_count, last)
+        width = max((len(r) for r in values), default=1)
+        self._written(sum(len(r) for r in values))
+        return {
+            "updates": {
+                "updatedRange": f"'{self.title}'!A{first}:{rowcol_to_a1(last, width)}",
+                "updatedRows": len(values),
+            }
+        }
+
+    def update_cells(self, cell_list, value_input_option=None) -> Dict:
+        self._request("update_cells", "write")
+        for cell in cell_list:
+            self._write_cell(cell.row, cell.col, cell.value)
+        self._written(len(cell_list))
+        return {"updatedCells": len(cell_list)}
+
+    def batch_update(self, data: Iterable[Dict], value_input_option=None, **kwargs) -> Dict:
+        self._request("batch_update", "write")
+        cells = 0
+        for item in data:
+            r1, c1, _, _ = parse_a1_range(item["range"])
+            for r, row in enumerate(item["values"], start=r1):
+                for c, value in enumerate(row, start=c1):
+                    self._write_cell(r, c, value)
+                    cells += 1
+        self._written(cells)
+        return {"totalUpdatedCells": cells}
@@ -0,0 +1,121 @@
+"""
+Deterministic synthetic job postings for benchmarks and tests.
+
+Same seed -> same corpus. Knobs cover what matters to the scorer and filters:
+language (FR/EN), text length, how many dictionary skills are mentioned, and how
+seniority / years requirements are phrased.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, Iterator, Sequence
+
+from ..scoring import BASE_SKILLS
+
+TITLES = {
+    "en": ["Data Engineer", "Cloud Data Engineer", "Analytics Engineer", "Data Platform Engineer"],
+    "fr": ["Data Engineer", "Ingénieur Data", "Ingénieur Big Data", "Data Engineer Cloud"],
+}
+
+SENIOR_TITLE_PREFIX = {"en": ["Senior", "Lead", "Staff"], "fr": ["Senior", "Lead", "Confirmé"]}
+JUNIOR_TITLE_PREFIX = {"en": ["Junior", "Graduate"], "fr": ["Junior", "Débutant"]}
+
+FILLER = {
+    "en": [
+        "You will join a fast-growing team building the company data platform.",
+        "Our stack is modern and we care about quality and ownership.",
+        "You will work closely with analysts, product managers and data scientists.",
+        "We offer remote-friendly work, training budget and a great culture.",
+        "You design, build and monitor reliable batch and streaming pipelines.",
+        "The role involves modeling datasets for reporting and machine learning.",
+    ],
+    "fr": [
+        "Vous rejoindrez une équipe en forte croissance autour de la plateforme data.",
+        "Notre stack est moderne et nous attachons de l'importance à la qualité.",
+        "Vous travaillerez avec les analystes, les product managers et les data scientists.",
+        "Télétravail partiel, budget formation et une excellente ambiance.",
+        "Vous concevez, développez et supervisez des pipelines batch et temps réel.",
+        "Le poste inclut la modélisation de données pour le reporting.",
+    ],
+}
+
+SKILL_SENTENCE = {
+    "en": ["Experience with {} is required.", "Knowledge of {} is a plus.", "You master {}."],
+    "fr": [
+        "Maîtrise de {} indispensable.", "La connaissance de {} est un plus.", "Vous utilisez {}."
+    ],
+}
+
+YEARS_PHRASES = {
+    "en": ["{} years of experience", "at least {} years", "minimum {} years", "{}+ years"],
+    "fr": ["{} ans d'expérience", "au moins {} ans", "minimum {} ans", "{} années d'expérience"],
+}
+
+COMPANIES = ["ExampleCorp", "DataWorks", "CloudNine", "Lyon Analytics", "Paris FinTech"]
+CITIES = ["Paris", "Lyon", "Nantes", "Lille", "Toulouse", "Remote"]
+
+
+def generate_jobs(
+    n: int,
+    seed: int = 0,
+    languages: Sequence[str] = ("en", "fr"),
+    min_words: int = 60,
+    max_words: int = 400,
+    skill_density: float = 0.3,
+    senior_ratio: float = 0.15,
+    years_ratio: float = 0.4,
+) -> Iterator[Dict]:
+    """
+    Yield n synthetic job dicts shaped like ingested sheet rows.
+
+    Args:
+        n: Number of postings
+        seed: RNG seed (same seed, same corpus)
+        languages: Languages to draw from ("en", "fr")
+        min_words / max_words: Target description length range
+        skill_density: Probability that a sentence mentions dictionary skills
+        senior_ratio: Share of postings with senior wording in the title
+        years_ratio: Share of postings stating a years requirement
+    """
+    rnd = random.Random(seed)
+    for i in range(n):
+        lang = rnd.choice(list(languages))
+        title = rnd.choice(TITLES[lang])
+        roll = rnd.random()
+        if roll < senior_ratio:
+            title = f"{rnd.choice(SENIOR_TITLE_PREFIX[lang])} {title}"
+        elif roll < senior_ratio * 2:
+            title = f"{rnd.choice(JUNIOR_TITLE_PREFIX[lang])} {title}"
+
+        target = rnd.randint(min_words, max(min_words, max_words))
+        sentences = []
+        words = 0
+        while words < target:
+            if rnd.random() < skill_density:
+                skills = ", ".join(rnd.sample(BASE_SKILLS, rnd.randint(1, 3)))
+                sentence = rnd.choice(SKILL_SENTENCE[lang]).format(skills)
+            else:
+                sentence = rnd.choice(FILLER[lang])
+            sentences.append(sentence)
+            words += len(sentence.split())
+
+        if rnd.random() < years_ratio:
+            phrase = rnd.choice(YEARS_PHRASES[lang]).format(rnd.randint(0, 6))
+            sentences.insert(rnd.randint(0, len(sentences)), phrase.capitalize() + ".")
+
+        url = f"https://example.com/jobs/{seed}/{i}"
+        yield {
+            "job_id": hashlib.sha1(f"synthetic|{url}".encode("utf-8")).hexdigest(),
+            "source": "synthetic",
+            "published_at": f"2026-01-{1 + i % 28:02d}T09:00:00Z",
+            "country": "FR",
+            "city": rnd.choice(CITIES),
+            "title": title,
+            "company": rnd.choice(COMPANIES),
+            "url": url,
+            "description": " ".join(sentences),
+            "language": lang.upper(),
+            "status": "NEW",
+        }
@@ -0,0 +1,207 @@
+"""
+Columnar (NumPy) deterministic scoring for bulk re-ranking.
+
+Jobs are encoded once into a JobSkillMatrix: a sparse (CSR) job x skill matrix
+over an interned skill vocabulary, plus per-job seniority columns. Scoring a
+profile against the whole corpus is then a handful of array operations instead
+of per-job Python set math, and gives exactly the numbers
+compute_deterministic_score would.
+
+Typical use:
+    matrix = JobSkillMatrix.from_jobs(jobs)       # text scan, once
+    scores = score_matrix(profile, matrix)        # array ops, per profile
+    best = scores.ranking()[:50]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List
+
+import numpy as np
+
+from .scoring import (
+    DeterministicScore,
+    KeywordMatcher,
+    ProfileLike,
+    as_scoring_context,
+    compute_overlap,
+    extract_job_skills,
+    normalize_job_text,
+    seniority_signals,
+)
+
+
+class JobSkillMatrix:
+    """
+    Profile-independent features of a job corpus in columnar form.
+
+    Row i of the CSR matrix (indptr/indices) lists the vocabulary ids of the
+    skills extracted from job i. Normalized texts are kept so profile keyword
+    columns (architecture / domain) can be computed, and memoized, on demand.
+    """
+
+    def __init__(
+        self,
+        vocab: List[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        senior: np.ndarray,
+        has_years: np.ndarray,
+        years: np.ndarray,
+        texts: List[str],
+    ):
+        self.vocab = vocab
+        self.vocab_index: Dict[str, int] = {skill: i for i, skill in enumerate(vocab)}
+        self.indptr = indptr
+        self.indices = indices
+        self.senior = senior
+        self.has_years = has_years
+        self.years = years
+        self.texts = texts
+        self._keyword_columns: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Dict]) -> "JobSkillMatrix":
+        """
+        Extract skills and seniority signals from every job.
+
+        Raises:
+            ValueError: If a job has neither title nor description
+        """
+        vocab: List[str] = []
+        vocab_index: Dict[str, int] = {}
+        indptr: List[int] = [0]
+        indices: List[int] = []
+        senior: List[bool] = []
+        has_years: List[bool] = []
+        years: List[int] = []
+        texts: List[str] = []
+
+        for job in jobs:
+            text = normalize_job_text(job)
+            for skill in sorted(extract_job_skills(text)):
+                idx = vocab_index.get(skill)
+                if idx is None:
+                    idx = vocab_index[skill] = len(vocab)
+                    vocab.append(skill)
+                indices.append(idx)
+            indptr.append(len(indices))
+
+            is_senior, found_years = seniority_signals(text)
+            senior.append(is_senior)
+            has_years.append(found_years is not None)
+            years.append(found_years if found_years is not None else 0)
+            texts.append(text)
+
+        return cls(
+            vocab=vocab,
+            indptr=np.asarray(indptr, dtype=np.int64),
+            indices=np.asarray(indices, dtype=np.int64),
+            senior=np.asarray(senior, dtype=bool),
+            has_years=np.asarray(has_years, dtype=bool),
+            years=np.asarray(years, dtype=np.int64),
+            texts=texts,
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def skill_counts(self) -> np.ndarray:
+        """Number of distinct skills extracted per job."""
+        return np.diff(self.indptr)
+
+    def job_skills(self, i: int) -> FrozenSet[str]:
+        """Skills of job i as strings."""
+        row = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        return frozenset(self.vocab[j] for j in row)
+
+    def profile_mask(self, profile_skills: FrozenSet[str]) -> np.ndarray:
+        """Boolean vector over the vocabulary: True where the profile has the skill."""
+        return np.fromiter(
+            (skill in profile_skills for skill in self.vocab), dtype=bool, count=len(self.vocab)
+        )
+
+    def keyword_counts(self, matcher: KeywordMatcher) -> np.ndarray:
+        """Per-job number of matcher keywords found (substring semantics)."""
+        counts = np.zeros(len(self), dtype=np.int64)
+        for kw in matcher.keywords:
+            column = self._keyword_columns.get(kw)
+            if column is None:
+                column = np.fromiter(
+                    (kw in text for text in self.texts), dtype=bool, count=len(self)
+                )
+                self._keyword_columns[kw] = column
+            counts += column
+        return counts
+
+
+@dataclass(frozen=True)
+class VectorScores:
+    """Per-job score components, one array entry per matrix row."""
+
+    skill_overlap_pct: np.ndarray
+    architecture_bonus: np.ndarray
+    domain_bonus: np.ndarray
+    seniority_penalty: np.ndarray
+    deterministic_score: np.ndarray
+
+    def ranking(self) -> np.ndarray:
+        """Row ids by descending deterministic score (ties keep input order)."""
+        return np.argsort(-self.deterministic_score, kind="stable")
+
+
+def score_matrix(profile: ProfileLike, matrix: JobSkillMatrix) -> VectorScores:
+    """
+    Score every job of the matrix against one profile.
+    Mirrors compute_overlap / bonuses / seniority_penalty / clamp_int exactly.
+    """
+    ctx = as_scoring_context(profile)
+    n = len(matrix)
+
+    total = matrix.skill_counts()
+    in_profile = matrix.profile_mask(ctx.profile_skills)[matrix.indices]
+    row_ids = np.repeat(np.arange(n), total)
+    overlap = np.bincount(row_ids[in_profile], minlength=n)
+
+    # Same float64 ops as int(round(100 * (overlap / total))): round half to even.
+    safe_total = np.where(total > 0, total, 1)
+    pct = np.where(total > 0, np.round(100 * (overlap / safe_total)), 0)
+    pct = np.clip(pct, 0, 100).astype(np.int64)
+
+    arch = np.clip(matrix.keyword_counts(ctx.architecture) * 5, 0, 20)
+    dom = np.clip(matrix.keyword_counts(ctx.domains) * 5, 0, 10)
+
+    too_many_years = matrix.has_years & (matrix.years > ctx.max_years)
+    sen = np.where(matrix.senior | too_many_years, -20, 0).astype(np.int64)
+
+    det = np.clip(pct + arch + dom + sen, 0, 100)
+
+    return VectorScores(
+        skill_overlap_pct=pct,
+        architecture_bonus=arch,
+        domain_bonus=dom,
+        seniority_penalty=sen,
+        deterministic_score=det,
+    )
+
+
+def deterministic_score_at(
+    profile: ProfileLike, matrix: JobSkillMatrix, scores: VectorScores, i: int
+) -> DeterministicScore:
+    """Materialize the full DeterministicScore (with skill lists) for row i."""
+    ctx = as_scoring_context(profile)
+    job_skills = matrix.job_skills(i)
+    _, overlap_list, missing_list = compute_overlap(job_skills, ctx.profile_skills)
+
+    return DeterministicScore(
+        job_skills_found=sorted(job_skills),
+        profile_skills_used=list(ctx.sorted_profile_skills),
+        skill_overlap_pct=int(scores.skill_overlap_pct[i]),
+        overlap_skills=overlap_list,
+        missing_skills=missing_list,
+        architecture_bonus=int(scores.architecture_bonus[i]),
+        domain_bonus=int(scores.domain_bonus[i]),
+        seniority_penalty=int(scores.seniority_penalty[i]),
+        deterministic_score=int(scores.deterministic_score[i]),
+    )
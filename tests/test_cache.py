@@ -0,0 +1,72 @@
+"""
+Behaviour tests for the persistent caches.
+"""
+
+from src.job_hunter_ai.cache import SqliteCache
+from src.job_hunter_ai.score_cache import ScoreCache
+from src.job_hunter_ai.scoring import ScoringContext, compute_deterministic_score
+from tests.test_scoring import load_profile, load_sample_job
+
+
+def test_sqlite_cache_lru_eviction_and_stats(tmp_path):
+    """Least recently used entries are evicted past max_entries; stats are counted."""
+    cache = SqliteCache(tmp_path / "c.sqlite", max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.evictions) == (2, 1, 2, 1)
+
+
+def test_sqlite_cache_ttl(tmp_path):
+    """Expired entries read as missing."""
+    cache = SqliteCache(tmp_path / "c.sqlite", ttl_seconds=-1)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_prunes_expired_entries_on_open(tmp_path):
+    """Entries nobody reads again are still deleted once expired."""
+    with SqliteCache(tmp_path / "c.sqlite") as cache:
+        cache.set("a", "1")
+        cache.set("b", "2")
+    with SqliteCache(tmp_path / "c.sqlite", ttl_seconds=-1) as cache:
+        assert len(cache) == 0
+    with SqliteCache(tmp_path / "c.sqlite") as cache:
+        assert len(cache) == 0
+
+
+def test_score_cache_hits_and_profile_invalidation(tmp_path):
+    """Second lookup is a hit with an identical score; a profile change misses."""
+    profile = load_profile()
+    job = load_sample_job()
+    cache = ScoreCache(tmp_path / "scores.sqlite")
+    ctx = ScoringContext.from_profile(profile)
+
+    first = cache.score(ctx, job)
+    second = cache.score(ctx, job)
+    assert first == second == compute_deterministic_score(profile, job)
+    assert cache.stats().hits == 1
+
+    profile["domain_exposure"] = ["Cloud"]
+    cache.score(profile, job)
+    assert cache.stats().misses == 2
+
+
+def test_score_cache_key_hashes_context_and_dictionaries_once(tmp_path, monkeypatch):
+    from src.job_hunter_ai import scoring
+
+    ctx = ScoringContext.from_profile(load_profile())
+    cache = ScoreCache(tmp_path / "scores.sqlite")
+    key = cache.key(ctx, load_sample_job())
+
+    hashed = []
+    real = scoring._short_hash
+    monkeypatch.setattr(scoring, "_short_hash", lambda obj: hashed.append(obj) or real(obj))
+    assert cache.key(ctx, load_sample_job()) == key
+    assert hashed == []
@@ -14,6 +14,23 @@ def test_scoring_imports():
     assert callable(compute_hybrid_score)
 
 
+def test_cache_imports():
+    """Test cache module imports."""
+    from src.job_hunter_ai.cache import SqliteCache
+    from src.job_hunter_ai.score_cache import ScoreCache
+    from src.job_hunter_ai.skill_index import SkillIndex
+    assert callable(SqliteCache)
+    assert callable(ScoreCache)
+    assert callable(SkillIndex)
+
+
+def test_testing_imports():
+    """Test offline testing helpers import."""
+    from src.job_hunter_ai.testing.synthetic import generate_jobs
+    jobs = list(generate_jobs(5, seed=1))
+    assert jobs == list(generate_jobs(5, seed=1))
+
+
 def test_llm_imports():
     """Test LLM module imports."""
     from src.job_hunter_ai.llm.enrich import (
@@ -45,6 +62,22 @@ def test_drive_imports():
     assert callable(upload_to_drive)
 
 
+def test_sheets_imports():
+    """Test Sheets / job store imports."""
+    from src.job_hunter_ai.sheets.client import connect_worksheet
+    from src.job_hunter_ai.sheets.sync import SheetSync
+    from src.job_hunter_ai.store import JobStore
+    assert callable(connect_worksheet)
+    assert SheetSync is not None
+    assert JobStore is not None
+
+
+def test_fake_sheets_imports():
+    """Test offline Sheets stand-in imports."""
+    from src.job_hunter_ai.testing.fake_sheets import FakeWorksheet
+    assert FakeWorksheet is not None
+
+
 def test_config_imports():
     """Test config module imports."""
     from src.job_hunter_ai.config import (
@@ -0,0 +1,366 @@
+"""
+Offline behaviour tests for the ingestion building blocks.
+"""
+
+import io
+import json
+import time
+
+import pytest
+import requests
+
+from src.job_hunter_ai.cache import SqliteCache
+from src.job_hunter_ai.ingest.adzuna import AdzunaClient, FetchStats, RequestBudget, adzuna_job_id
+from src.job_hunter_ai.ingest.dedup import SeenIndex
+from src.job_hunter_ai.ingest.http import HttpSession
+from src.job_hunter_ai.ingest.near_dup import NearDuplicateIndex
+from src.job_hunter_ai.ingest.pipeline import MicroBatchSink, prefetch, run_pipeline
+from src.job_hunter_ai.ingest.planner import (
+    FetchTask,
+    MultiQueryFetcher,
+    QueryStats,
+    YieldHistory,
+    plan_queries,
+)
+from src.job_hunter_ai.ratelimit import TokenBucket
+from src.job_hunter_ai.testing.synthetic import generate_jobs
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def fake_adzuna(total: int, per_page: int):
+    """A requests.get stand-in serving `total` jobs, newest first."""
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        page = int(url.rsplit("/", 1)[1])
+        calls.append(page)
+        start = (page - 1) * per_page
+        results = [
+            {"redirect_url": f"https://ad/{i}", "title": f"Data Engineer {i}"}
+            for i in range(start, min(start + per_page, total))
+        ]
+        return FakeResponse({"count": total, "results": results})
+
+    return get, calls
+
+
+def unlimited() -> TokenBucket:
+    return TokenBucket(rate=1e6, capacity=1e6)
+
+
+def test_adzuna_walks_all_pages_in_order():
+    """Every page is fetched once and jobs come out in page order."""
+    get, calls = fake_adzuna(total=230, per_page=50)
+    client = AdzunaClient("id", "key", max_in_flight=3, rate_limiter=unlimited(), get=get)
+
+    jobs = list(client.iter_jobs("data engineer", results_per_page=50))
+    assert [j["redirect_url"] for j in jobs] == [f"https://ad/{i}" for i in range(230)]
+    assert sorted(calls) == [1, 2, 3, 4, 5]
+    assert client.last_stats.total_count == 230
+
+
+def test_adzuna_stops_on_page_of_known_ids():
+    """A page made only of known jobs ends the walk early."""
+    get, _ = fake_adzuna(total=500, per_page=50)
+    known = {adzuna_job_id({"redirect_url": f"https://ad/{i}"}) for i in range(50, 500)}
+    client = AdzunaClient("id", "key", max_in_flight=1, rate_limiter=unlimited(), get=get)
+
+    jobs = list(client.iter_jobs("data engineer", results_per_page=50, known_ids=known))
+    assert len(jobs) == 50
+    assert client.last_stats.stopped_on_known_page
+
+
+def test_token_bucket_waits_for_refill():
+    """acquire() sleeps exactly long enough for tokens to refill."""
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0],
+                         sleep=lambda s: now.__setitem__(0, now[0] + s))
+    assert bucket.acquire() == 0 and bucket.acquire() == 0
+    assert bucket.acquire() == 0.5
+
+
+class FakeSession:
+    """requests.Session stand-in replaying scripted responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append(headers or {})
+        r = self.responses.pop(0)
+        if isinstance(r, Exception):
+            raise r
+        resp = requests.Response()
+        resp.status_code, resp._content = r[0], json.dumps(r[1]).encode("utf-8")
+        resp.raw = io.BytesIO(resp._content)
+        resp.headers.update(r[2] if len(r) > 2 else {})
+        return resp
+
+    def close(self):
+        pass
+
+
+def test_http_session_retries_and_honours_retry_after():
+    """429/5xx and connection errors are retried; Retry-After wins over backoff."""
+    delays = []
+    session = FakeSession([
+        (429, {}, {"Retry-After": "7"}),
+        requests.ConnectionError("reset"),
+        (503, {}),
+        (200, {"ok": True}),
+    ])
+    http = HttpSession(max_retries=4, backoff=1, session=session, sleep=delays.append)
+
+    assert http.get("https://x/1").json() == {"ok": True}
+    assert delays[0] == 7 and all(0 <= d <= 4 for d in delays[1:])
+    assert http.retries == 3
+
+
+def test_adzuna_retries_take_rate_limit_tokens():
+    """Each HTTP attempt of a page, retries included, takes a token from the Adzuna bucket."""
+    session = FakeSession([(503, {}), (503, {}), (200, {"count": 1, "results": []})])
+    http = HttpSession(max_retries=4, session=session, sleep=lambda s: None)
+    bucket = TokenBucket(rate=1e-9, capacity=10)
+    client = AdzunaClient("id", "key", max_in_flight=1, rate_limiter=bucket, http=http)
+
+    assert client.fetch_page("fr", "data engineer", page=1)["count"] == 1
+    assert len(session.calls) == 3
+    assert bucket.available == pytest.approx(7)
+
+
+def test_http_session_cache_and_revalidation():
+    """Fresh entries skip the network; stale ones revalidate with the ETag."""
+    session = FakeSession([(200, {"page": 1}, {"ETag": '"v1"'}), (304, {})])
+    cache = SqliteCache(":memory:")
+    http = HttpSession(session=session, cache=cache, cache_ttl=3600)
+
+    assert http.get("https://x", params={"a": 1}).json() == {"page": 1}
+    assert http.get("https://x", params={"a": 1}).json() == {"page": 1}
+    assert len(session.calls) == 1
+
+    http.cache_ttl = -1  # everything stale
+    assert http.get("https://x", params={"a": 1}).json() == {"page": 1}
+    assert session.calls[1]["If-None-Match"] == '"v1"'
+
+
+def test_seen_index_persists_and_rebuilds(tmp_path):
+    """Ids survive a reopen, a torn last line is recovered, rebuild replaces all."""
+    path = tmp_path / "seen.txt"
+    with SeenIndex(path) as seen:
+        assert seen.is_new
+        assert seen.add_many(["a", "b", "a"]) == 2
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("tor")  # crash mid-write
+    with SeenIndex(path) as seen:
+        assert {"a", "b"} <= set(seen) and not seen.is_new
+        assert seen.add("c")
+        assert seen.rebuild(["x", "y"]) == 2
+        assert "a" not in seen
+
+    with SeenIndex(path) as seen:
+        assert set(seen) == {"x", "y"}
+
+
+def test_near_duplicate_index_clusters_reposts():
+    """A reworded repost joins the original's cluster; unrelated jobs do not."""
+    jobs = list(generate_jobs(50, seed=4, min_words=120))
+    index = NearDuplicateIndex(":memory:")
+    assert index.add_many((j["job_id"], j) for j in jobs) == [None] * len(jobs)
+
+    original = jobs[7]
+    repost = dict(original, company={"display_name": original["company"]})
+    repost["description"] = original["description"] + " Postulez dès maintenant !"
+    assert index.add("repost", repost) == original["job_id"]
+    assert index.add("repost", repost) == original["job_id"]  # idempotent
+    assert index.cluster_members(original["job_id"]) == [original["job_id"], "repost"]
+
+    other = next(generate_jobs(1, seed=99, min_words=120))
+    assert index.query(other) == []
+
+
+def adzuna_result(i: int, title: str = "Data Engineer", description: str = "Python, SQL") -> dict:
+    return {
+        "redirect_url": f"https://ad/{i}",
+        "title": f"{title} {i}",
+        "description": f"{description} posting number {i} for team {i * 7}",
+        "company": {"display_name": f"Company {i}"},
+        "location": {"display_name": "Lyon, Rhône"},
+        "created": "2026-01-01T00:00:00Z",
+    }
+
+
+def test_pipeline_streams_and_flushes_in_micro_batches():
+    """Known, excluded and repeated jobs are dropped; rows are written in batches of 3."""
+    jobs = [adzuna_result(i) for i in range(8)]
+    jobs.append(adzuna_result(8, title="Senior Data Engineer"))
+    jobs.append(adzuna_result(1))  # same url twice in one run
+    known = {adzuna_job_id(jobs[0])}
+
+    batches = []
+    with MicroBatchSink(batches.append, max_rows=3, max_seconds=None) as sink:
+        stats = run_pipeline(iter(jobs), sink, known=known, prefetch_size=2)
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert batches[0][0]["city"] == "Lyon" and batches[0][0]["notes"].startswith("Kept")
+    assert (stats.fetched, stats.known, stats.skipped, stats.written) == (10, 2, 1, 7)
+
+
+def test_pipeline_records_rejected_ids_as_seen(tmp_path):
+    """Screened-out postings are skipped by the next run, like written ones."""
+    jobs = [adzuna_result(0), adzuna_result(1, title="Senior Data Engineer")]
+    with SeenIndex(tmp_path / "seen.txt") as seen:
+        batches = []
+        with MicroBatchSink(batches.append, max_seconds=None) as sink:
+            run_pipeline(iter(jobs), sink, known=seen, seen=seen)
+        # written ids are left to write_batch, once the write succeeded
+        assert adzuna_job_id(jobs[1]) in seen and adzuna_job_id(jobs[0]) not in seen
+
+        seen.add_many(row["job_id"] for batch in batches for row in batch)
+        with MicroBatchSink(batches.append, max_seconds=None) as sink:
+            stats = run_pipeline(iter(jobs), sink, known=seen, seen=seen)
+        assert (stats.known, stats.skipped, stats.written) == (2, 0, 0)
+
+
+def test_micro_batch_sink_flushes_by_age():
+    """A lone row is written by the timer once it is older than max_seconds."""
+    batches = []
+    sink = MicroBatchSink(batches.append, max_rows=100, max_seconds=0.05)
+    sink.put({"job_id": "a"})
+    deadline = time.monotonic() + 2
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sink.close()
+    assert batches == [[{"job_id": "a"}]]
+
+
+def test_prefetch_reraises_producer_errors():
+    def boom():
+        yield 1
+        raise RuntimeError("source down")
+
+    it = prefetch(boom(), maxsize=1)
+    assert next(it) == 1
+    with pytest.raises(RuntimeError, match="source down"):
+        next(it)
+
+
+def test_plan_queries_expands_roles_and_locations():
+    profile = {
+        "identity": {"location": "Lyon, France or Paris, France"},
+        "seniority": {"acceptable_roles": ["Data Engineer", "Analytics Engineer", "Data Engineer"]},
+        "search": {"countries": ["Belgium"]},
+    }
+    tasks = plan_queries(profile)
+    # the country of identity.location is still searched as a whole, as before
+    assert [str(t) for t in tasks] == [
+        "Data Engineer @ * (fr)",
+        "Data Engineer @ Lyon (fr)",
+        "Data Engineer @ Paris (fr)",
+        "Data Engineer @ * (be)",
+        "Analytics Engineer @ * (fr)",
+        "Analytics Engineer @ Lyon (fr)",
+        "Analytics Engineer @ Paris (fr)",
+        "Analytics Engineer @ * (be)",
+    ]
+    assert tasks[1].params() == {"query": "Data Engineer", "country_code": "fr", "where": "Lyon"}
+
+    profile["search"]["locations"] = [{"where": "Lyon", "country": "France"}]
+    assert [str(t) for t in plan_queries(profile)][:2] == [
+        "Data Engineer @ Lyon (fr)",
+        "Data Engineer @ * (be)",
+    ]
+
+
+def test_multi_query_fetch_shares_budget_and_dedupe():
+    """Overlapping queries return each job once and stop together on the shared budget."""
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        page = int(url.rsplit("/", 1)[1])
+        calls.append((params["what"], page))
+        # both queries match jobs 0..199; "analytics" is shifted by 25
+        offset = 25 if params["what"] == "analytics" else 0
+        start = offset + (page - 1) * 50
+        results = [adzuna_result(i) for i in range(start, min(start + 50, 200))]
+        return FakeResponse({"count": 200 - offset, "results": results})
+
+    client = AdzunaClient("id", "key", max_in_flight=2, rate_limiter=unlimited(), get=get)
+    fetcher = MultiQueryFetcher(client, budget=RequestBudget(5), max_parallel=2)
+    tasks = [FetchTask("data", "fr", "Lyon"), FetchTask("analytics", "be")]
+    known = {adzuna_job_id(adzuna_result(0))}
+    jobs = list(fetcher.iter_jobs(tasks, known_ids=known))
+
+    ids = [j["redirect_url"] for j in jobs]
+    assert len(calls) == 5 and len(ids) == len(set(ids))
+    by_query = {s.task.query: s for s in fetcher.stats}
+    assert sum(s.requests for s in fetcher.stats) == 5
+    assert sum(s.new_jobs for s in fetcher.stats) == len(ids) - 1
+    assert sum(s.jobs - s.duplicates for s in fetcher.stats) == len(ids)
+    assert any(s.fetch.budget_exhausted for s in fetcher.stats)
+    assert {j["search_country"] for j in jobs} <= {"FR", "BE"}
+    assert by_query["data"].yield_per_request > 0
+
+
+def test_yield_history_drops_and_reprobes_low_yield_queries(tmp_path):
+    good, bad = FetchTask("good", "fr"), FetchTask("bad", "fr")
+
+    def run(task, new_jobs):
+        return QueryStats(task, fetch=FetchStats(pages_requested=2), new_jobs=new_jobs)
+
+    history = YieldHistory(tmp_path / "yield.json", min_runs=2, probe_every=1)
+    for _ in range(2):
+        assert history.select([bad, good], min_yield=1.0)[1] == []
+        history.record([run(good, 40), run(bad, 0)])
+    history.save()
+
+    history = YieldHistory(tmp_path / "yield.json", min_runs=2, probe_every=1)
+    assert history.select([bad, good], min_yield=1.0) == ([good], [bad])
+    # skipped once: probed again on the next run
+    assert history.select([bad, good], min_yield=1.0) == ([good, bad], [])
+
+
+def test_http_session_bounds_its_own_cache(tmp_path):
+    http = HttpSession(session=FakeSession([]), cache=tmp_path / "http.sqlite", cache_ttl=3600)
+    assert http.cache.max_entries is not None
+    assert http.cache.ttl_seconds > 3600
+
+
+def test_micro_batch_sink_keeps_rows_when_a_write_fails():
+    """A failed write keeps its rows for the next flush and is raised to the caller."""
+    written, failures = [], [RuntimeError("sheet down")]
+
+    def write_batch(rows):
+        if failures:
+            raise failures.pop()
+        written.extend(rows)
+
+    sink = MicroBatchSink(write_batch, max_rows=2, max_seconds=None)
+    sink.put({"job_id": "a"})
+    with pytest.raises(RuntimeError, match="sheet down"):
+        sink.put({"job_id": "b"})
+    assert [row["job_id"] for row in sink.pending] == ["a", "b"]
+    sink.close()
+    assert [row["job_id"] for row in written] == ["a", "b"] and sink.stats.written == 2
+
+    # a failing final flush does not replace the exception already in flight
+    failures.append(RuntimeError("sheet down"))
+    with pytest.raises(KeyError):
+        with MicroBatchSink(write_batch, max_seconds=None) as sink:
+            sink.put({"job_id": "c"})
+            raise KeyError("screening bug")
+    assert isinstance(sink.error, RuntimeError) and sink.pending == [{"job_id": "c"}]
@@ -0,0 +1,367 @@
+"""
+Offline tests for the Groq client layer (the SDK client is replaced by a fake).
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import groq
+import httpx
+import pytest
+
+from src.job_hunter_ai.config import get_prompt_path
+from src.job_hunter_ai.llm import enrich, groq_client
+from src.job_hunter_ai.llm.batch import BatchEnricher
+from src.job_hunter_ai.llm.cache import CompletionCache, set_completion_cache
+from src.job_hunter_ai.llm.ratelimit import GroqRateLimiter, is_retryable, set_rate_limiter
+from src.job_hunter_ai.llm.stages import Stage, run_stages
+from src.job_hunter_ai.ratelimit import parse_retry_after
+
+
+def completion(text: str):
+    message = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeGroq:
+    """Stands in for groq.Groq; answers with the number of calls so far."""
+
+    instances = 0
+    calls = 0
+
+    def __init__(self, **kwargs):
+        FakeGroq.instances += 1
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature, **kwargs):
+        FakeGroq.calls += 1
+        return completion(f"answer {FakeGroq.calls}")
+
+
+class FakeAsyncGroq:
+    """Stands in for groq.AsyncGroq; tracks how many calls overlap."""
+
+    instances = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, **kwargs):
+        FakeAsyncGroq.instances += 1
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def create(self, model, messages, temperature, **kwargs):
+        FakeAsyncGroq.in_flight += 1
+        FakeAsyncGroq.max_in_flight = max(FakeAsyncGroq.max_in_flight, FakeAsyncGroq.in_flight)
+        await asyncio.sleep(0.01)
+        FakeAsyncGroq.in_flight -= 1
+        return completion(messages[-1]["content"].upper())
+
+
+@pytest.fixture
+def fake_groq(monkeypatch):
+    monkeypatch.setattr(groq_client, "Groq", FakeGroq)
+    monkeypatch.setattr(groq_client, "AsyncGroq", FakeAsyncGroq)
+    monkeypatch.setattr(groq_client, "GROQ_API_KEY", "test-key")
+    FakeGroq.instances = FakeGroq.calls = 0
+    FakeAsyncGroq.instances = FakeAsyncGroq.max_in_flight = 0
+    groq_client.close_clients()
+    set_completion_cache(None)
+    set_rate_limiter(None)
+    yield
+    groq_client.close_clients()
+    set_completion_cache(None)
+    set_rate_limiter(None)
+
+
+def test_groq_completion_cache(tmp_path, fake_groq):
+    """Same prompt/model/temperature is served from the cache; use_cache=False refreshes it."""
+    cache = CompletionCache(tmp_path / "groq.sqlite")
+    set_completion_cache(cache)
+
+    assert groq_client.call_groq("hello", temperature=0.2) == "answer 1"
+    assert groq_client.call_groq("hello", temperature=0.2) == "answer 1"
+    messages = [{"role": "user", "content": "hello"}]
+    assert groq_client.call_groq_with_messages(messages, temperature=0.2) == "answer 1"
+    assert groq_client.call_groq("hello", temperature=0.7) == "answer 2"
+    assert groq_client.call_groq("hello", temperature=0.2, use_cache=False) == "answer 3"
+    assert groq_client.call_groq("hello", temperature=0.2) == "answer 3"
+
+    assert FakeGroq.calls == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (3, 2, 2)
+
+
+def test_groq_client_is_shared(fake_groq):
+    """Every call goes through one lazily created client."""
+    for i in range(3):
+        groq_client.call_groq(f"prompt {i}")
+    assert (FakeGroq.instances, FakeGroq.calls) == (1, 3)
+
+
+def test_async_calls_run_concurrently_on_one_client(fake_groq):
+    async def run():
+        return await asyncio.gather(*(groq_client.acall_groq(f"job {i}") for i in range(5)))
+
+    assert asyncio.run(run()) == [f"JOB {i}" for i in range(5)]
+    assert FakeAsyncGroq.instances == 1
+    assert FakeAsyncGroq.max_in_flight == 5
+
+
+def test_close_clients_closes_async_clients_on_their_loop(fake_groq):
+    async def client():
+        return groq_client.get_async_client()
+
+    idle = asyncio.new_event_loop()
+    idle_client = idle.run_until_complete(client())
+
+    running = asyncio.new_event_loop()
+    thread = threading.Thread(target=running.run_forever)
+    thread.start()
+    running_client = asyncio.run_coroutine_threadsafe(client(), running).result()
+
+    groq_client.close_clients()
+    assert idle_client.closed
+    # scheduled on the running loop: done once the loop has processed it
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), running).result()
+    assert running_client.closed
+
+    running.call_soon_threadsafe(running.stop)
+    thread.join()
+    for loop in (idle, running):
+        loop.close()
+
+
+def test_missing_api_key_raises(fake_groq, monkeypatch):
+    monkeypatch.setattr(groq_client, "GROQ_API_KEY", None)
+    with pytest.raises(groq_client.GroqClientError, match="GROQ_API_KEY"):
+        groq_client.call_groq("hello")
+
+
+def test_enrich_runs_cover_letter_alongside_cv(monkeypatch):
+    """The cover letter call overlaps the CV calls; timings are reported per stage."""
+    cover_tmpl = get_prompt_path("cover_letter_prompt.txt").read_text(encoding="utf-8")
+    master_tmpl = get_prompt_path("cv_master_prompt.txt").read_text(encoding="utf-8")
+    started = {"cover": threading.Event(), "master": threading.Event()}
+
+    def fake_call_groq(prompt, **kwargs):
+        if prompt.startswith(cover_tmpl):
+            started["cover"].set()
+            assert started["master"].wait(2), "cover letter waited for the CV"
+            return json.dumps({"opening": "Hello"})
+        if prompt.startswith(master_tmpl):
+            started["master"].set()
+            assert started["cover"].wait(2), "CV waited for the cover letter"
+            return json.dumps({"summary": "master"})
+        return "```json\n" + json.dumps({"summary": "one page", "llm_score": 77}) + "\n```"
+
+    monkeypatch.setattr(enrich, "call_groq", fake_call_groq)
+    job = {"title": "Data Engineer", "description": "Python"}
+    result = enrich.enrich_with_llm({}, "", "", job, deterministic_score=60)
+
+    assert result["summary"] == "one page" and result["llm_score"] == 77
+    assert result["cover_letter"] == {"opening": "Hello"}
+    assert set(result["timings"]) == {"master_cv", "one_page_cv", "cover_letter", "total"}
+
+
+def test_run_stages_rejects_cycles_and_propagates_errors():
+    with pytest.raises(ValueError, match="cycle"):
+        run_stages([Stage("a", lambda b: b, deps=("b",)), Stage("b", lambda a: a, deps=("a",))])
+
+    def boom():
+        raise RuntimeError("stage failed")
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        run_stages([Stage("a", boom), Stage("b", lambda a: a, deps=("a",))])
+
+
+def test_batch_enrichment_is_best_first_and_bounded():
+    """One worker takes jobs strictly by score; several never exceed the limit."""
+    jobs = [{"job_id": str(i), "score": s} for i, s in enumerate([40, 90, 10, 75, 60, 90])]
+    order = []
+
+    def fake_enrich(profile, experiences_md, projects_md, job, score):
+        order.append(job["job_id"])
+        return {"llm_score": score}
+
+    enricher = BatchEnricher({}, max_concurrency=1, score=lambda j: j["score"], enrich=fake_enrich)
+    results = list(enricher.run(iter(jobs)))
+    assert order == ["1", "5", "3", "4", "0", "2"]
+    assert [r.output["llm_score"] for r in results] == [90, 90, 75, 60, 40, 10]
+
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def slow_enrich(profile, experiences_md, projects_md, job, score):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return {}
+
+    enricher = BatchEnricher({}, max_concurrency=3, score=lambda j: j["score"], enrich=slow_enrich)
+    assert len(list(enricher.run(jobs * 3))) == 18
+    assert peak[0] == 3 and enricher.stats.done == 18
+
+
+def test_batch_enrichment_stops_after_consecutive_errors():
+    def failing(profile, experiences_md, projects_md, job, score):
+        raise groq_client.GroqClientError("rate limit")
+
+    jobs = [{"job_id": str(i), "score": i} for i in range(10)]
+    enricher = BatchEnricher(
+        {}, max_concurrency=1, score=lambda j: j["score"], max_consecutive_errors=2,
+        enrich=failing,
+    )
+    results = list(enricher.run(jobs))
+    assert [r.score for r in results] == [9, 8]
+    assert not any(r.ok for r in results)
+    stats = enricher.stats
+    assert (stats.failed, stats.not_started, stats.aborted) == (2, 8, True)
+
+
+def test_batch_enrichment_closed_early_leaves_no_running_jobs():
+    lock, running = threading.Lock(), [0]
+
+    def slow_enrich(profile, experiences_md, projects_md, job, score):
+        with lock:
+            running[0] += 1
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return {}
+
+    jobs = [{"job_id": str(i), "score": i} for i in range(20)]
+    enricher = BatchEnricher({}, max_concurrency=4, score=lambda j: j["score"], enrich=slow_enrich)
+    results = enricher.run(jobs)
+    next(results)
+    results.close()
+    assert running[0] == 0
+    assert not [t for t in threading.enumerate() if t.name.startswith("enrich-")]
+    assert enricher.stats.not_started > 0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def status_error(code: int, retry_after=None):
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(
+        code, headers=headers, request=httpx.Request("POST", "https://api.groq.com")
+    )
+    cls = groq.RateLimitError if code == 429 else groq.APIStatusError
+    return cls(f"HTTP {code}", response=response, body=None)
+
+
+def limiter_with_clock(**kwargs):
+    clock = FakeClock()
+    limiter = GroqRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+    return limiter, clock
+
+
+def test_rate_limiter_queues_on_tokens_and_settles_with_usage():
+    """A call waits for token refill; reported usage refunds the unused reservation."""
+    messages = [{"role": "user", "content": "x" * 4000}]  # ~1004 tokens
+    limiter, clock = limiter_with_clock(
+        requests_per_minute=600, tokens_per_minute=1200, completion_tokens=0
+    )
+
+    limiter.call(lambda: SimpleNamespace(usage=None), messages)
+    limiter.call(lambda: SimpleNamespace(usage=None), messages)
+    assert clock.now == pytest.approx((1004 - 196) / 20)
+
+    limiter, clock = limiter_with_clock(
+        requests_per_minute=600, tokens_per_minute=1200, completion_tokens=0
+    )
+    used = SimpleNamespace(usage=SimpleNamespace(total_tokens=104))
+    limiter.call(lambda: used, messages)
+    assert limiter.headroom().tokens == pytest.approx(1096)
+    limiter.call(lambda: used, messages)
+    assert clock.now == 0 and limiter.stats.tokens_used == 208
+
+
+def test_rate_limiter_honours_retry_after_and_gives_up_on_client_errors():
+    limiter, clock = limiter_with_clock(requests_per_minute=60, tokens_per_minute=1e6)
+    attempts = []
+
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise status_error(429, retry_after="2")
+        return SimpleNamespace(usage=None)
+
+    limiter.call(flaky, [{"role": "user", "content": "hi"}])
+    assert 2.0 <= attempts[1] <= 2.4
+    assert (limiter.stats.retries, limiter.stats.rate_limited) == (1, 1)
+    assert limiter.headroom().cooldown_s == 0
+
+    def bad_request():
+        raise status_error(400)
+
+    with pytest.raises(groq.APIStatusError):
+        limiter.call(bad_request, [{"role": "user", "content": "hi"}])
+    assert limiter.stats.retries == 1
+
+
+def test_rate_limiter_caps_retry_after_and_ignores_non_finite_hints():
+    limiter, _ = limiter_with_clock(max_backoff=30.0)
+    assert limiter.retry_delay(status_error(429, retry_after="1e308"), 0) == 30.0
+    assert limiter.headroom().cooldown_s == 30.0
+
+    limiter, _ = limiter_with_clock(backoff=1.0, max_backoff=30.0)
+    for value in ("inf", "nan", "-inf"):
+        assert parse_retry_after(value) is None
+        assert 0 <= limiter.retry_delay(status_error(503, retry_after=value), 0) <= 1.0
+
+
+def test_rate_limiter_retries_groq_errors_only_and_refunds_failed_attempts():
+    request = httpx.Request("POST", "https://api.groq.com")
+    assert is_retryable(groq.APIConnectionError(request=request))
+    assert is_retryable(groq.APITimeoutError(request=request))
+
+    class APIConnectionError(Exception):  # same name, not the SDK's
+        pass
+
+    assert not is_retryable(APIConnectionError())
+
+    messages = [{"role": "user", "content": "x" * 400}]  # ~104 tokens
+    limiter, _ = limiter_with_clock(
+        requests_per_minute=600, tokens_per_minute=1200, completion_tokens=0, backoff=0.0
+    )
+    attempts = []
+
+    def flaky():
+        attempts.append(limiter.headroom().tokens)
+        if len(attempts) < 3:
+            raise status_error(503)
+        return SimpleNamespace(usage=None)
+
+    limiter.call(flaky, messages)
+    # every attempt saw the full budget minus its own reservation only
+    assert attempts == [pytest.approx(1096)] * 3
+    assert limiter.headroom().tokens == pytest.approx(1096)
+
+
+def test_groq_calls_go_through_shared_limiter(fake_groq):
+    limiter, _ = limiter_with_clock(requests_per_minute=60, tokens_per_minute=1e6)
+    set_rate_limiter(limiter)
+    groq_client.call_groq("a")
+    asyncio.run(groq_client.acall_groq("b"))
+    assert limiter.stats.calls == 2
@@ -0,0 +1,28 @@
+"""
+Multi-profile scoring must match scoring each profile separately.
+"""
+
+import copy
+
+from src.job_hunter_ai.multi_profile import MultiProfileScorer
+from src.job_hunter_ai.scoring import compute_deterministic_score
+from src.job_hunter_ai.testing.synthetic import generate_jobs
+from tests.test_scoring import load_profile
+
+
+def test_rank_matches_separate_passes():
+    """Per-profile rankings equal independent compute_deterministic_score rankings."""
+    base = load_profile()
+    other = copy.deepcopy(base)
+    other["technical_stack"] = {"tools": ["Kafka", "Flink", "dbt"]}
+    other["domain_exposure"] = ["Cloud", "platform"]
+    profiles = {"base": base, "other": other}
+    jobs = list(generate_jobs(120, seed=3))
+
+    rankings = MultiProfileScorer(profiles).rank(jobs, limit=10)
+
+    for name, profile in profiles.items():
+        scored = [(job, compute_deterministic_score(profile, job)) for job in jobs]
+        expected = sorted(scored, key=lambda pair: pair[1].deterministic_score, reverse=True)[:10]
+        assert [job["job_id"] for job, _ in rankings[name]] == [j["job_id"] for j, _ in expected]
+        assert [det for _, det in rankings[name]] == [det for _, det in expected]
@@ -0,0 +1,39 @@
+"""
+Behaviour tests for the shared seniority / years / internship rules.
+"""
+
+from src.job_hunter_ai.rules import EXCLUDED_INTERNSHIP, EXCLUDED_SENIOR, evaluate_rules
+
+
+def test_internship_wins_over_other_exclusions():
+    """Internship exclusion takes precedence and is reported with its evidence."""
+    verdict = evaluate_rules("senior data engineer - stage de 6 mois")
+    assert verdict.excluded_reason == EXCLUDED_INTERNSHIP
+    assert verdict.internship == "stage"
+    assert verdict.senior == "senior"
+
+
+def test_senior_role_excluded():
+    """Senior keywords exclude the job."""
+    verdict = evaluate_rules("lead data engineer")
+    assert verdict.excluded_reason == EXCLUDED_SENIOR
+    assert not verdict.kept
+
+
+def test_years_requirement_and_evidence_span():
+    """The highest explicit years requirement decides, with its evidence span."""
+    text = "data engineer, au moins 1 an puis minimum 3 years of experience"
+    verdict = evaluate_rules(text, max_years=2)
+    assert verdict.years == 3
+    assert verdict.years_evidence == "minimum 3 years"
+    start, end = verdict.evidence_span
+    assert text[start:end] == "minimum 3 years"
+    assert verdict.excluded_reason == "Excluded: explicit years >2 (minimum 3 years)"
+
+
+def test_junior_signals_do_not_hide_years():
+    """Overlapping junior and years matches are both found."""
+    verdict = evaluate_rules("junior data engineer (0 to 2 years)")
+    assert verdict.kept
+    assert verdict.years == 2
+    assert verdict.junior_signals == ("junior", "0 to 2")
@@ -0,0 +1,106 @@
+"""
+Behaviour tests for the deterministic scorer.
+"""
+
+import json
+from pathlib import Path
+
+import yaml
+
+from src.job_hunter_ai.scoring import (
+    ScoringContext,
+    compute_deterministic_score,
+    extract_job_skills,
+    score_jobs,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+def load_profile():
+    return yaml.safe_load((ROOT / "profile" / "profile.yml").read_text(encoding="utf-8"))
+
+
+def load_sample_job():
+    return json.loads((ROOT / "tests" / "sample_job.json").read_text(encoding="utf-8"))
+
+
+def test_extract_job_skills_word_bounded():
+    """Skills only match on word boundaries (no 'java' inside 'javascript')."""
+    found = extract_job_skills("JavaScript developer with PostgreSQL and PySpark")
+    assert "java" not in found
+    assert "sql" not in found
+    assert "spark" not in found
+    assert {"postgresql", "pyspark"} <= found
+
+
+def test_extract_job_skills_python3_counts_as_python():
+    """The baseline substring match found 'python' in 'python3'; the synonym keeps that."""
+    assert "python" in extract_job_skills("Strong Python3 and SQL skills")
+    assert "python" not in extract_job_skills("pythonic code")
+
+
+def test_extract_job_skills_synonyms_and_nested_phrases():
+    """Synonyms map to canonical skills; shorter skills inside longer ones are kept."""
+    found = extract_job_skills(
+        "Spark Structured Streaming, GitHub   Actions, Big Query, k8s and Looker Studio"
+    )
+    assert {
+        "spark structured streaming",
+        "spark",
+        "github actions",
+        "bigquery",
+        "kubernetes",
+        "looker studio",
+        "looker",
+    } <= found
+
+
+def test_scoring_context_matches_raw_profile():
+    """A prebuilt ScoringContext scores exactly like the raw profile dict."""
+    profile = load_profile()
+    job = load_sample_job()
+    ctx = ScoringContext.from_profile(profile)
+
+    assert compute_deterministic_score(ctx, job) == compute_deterministic_score(profile, job)
+    assert ctx.max_years == 2
+
+
+def test_score_jobs_process_pool_matches_sequential():
+    """score_jobs over a process pool yields the same scores, ordered or not."""
+    profile = load_profile()
+    base = load_sample_job()
+    jobs = [
+        dict(base, job_id=str(i), description=f"{base['description']} {i} years")
+        for i in range(9)
+    ]
+    expected = [compute_deterministic_score(profile, job) for job in jobs]
+
+    ordered = list(score_jobs(profile, jobs, workers=2, chunksize=2))
+    assert [job["job_id"] for job, _ in ordered] == [job["job_id"] for job in jobs]
+    assert [score for _, score in ordered] == expected
+
+    unordered = dict(
+        (job["job_id"], score)
+        for job, score in score_jobs(profile, iter(jobs), workers=2, chunksize=4, ordered=False)
+    )
+    assert unordered == {job["job_id"]: score for job, score in zip(jobs, expected)}
+
+
+def test_deterministic_score_is_a_slotted_dataclass():
+    """Scores carry no __dict__ but keep the dataclass API (asdict/replace, mutable lists)."""
+    import dataclasses
+    import pickle
+
+    ctx = ScoringContext.from_profile(load_profile())
+    first = compute_deterministic_score(ctx, load_sample_job())
+
+    assert not hasattr(first, "__dict__")
+    assert first.job_skills_found == sorted(first.job_skills_found)
+    assert first.profile_skills_used == list(ctx.sorted_profile_skills)
+    assert set(first.overlap_skills) | set(first.missing_skills) == set(first.job_skills_found)
+    assert dataclasses.asdict(first) == first.to_dict()
+    assert dataclasses.replace(first, deterministic_score=0).deterministic_score == 0
+    first.missing_skills.append("cobol")
+    assert first.missing_skills[-1] == "cobol"
+    assert pickle.loads(pickle.dumps(first)) == first
@@ -0,0 +1,33 @@
+"""
+Incremental rescoring through the inverted skill index.
+"""
+
+import copy
+
+from src.job_hunter_ai.scoring import compute_deterministic_score
+from src.job_hunter_ai.skill_index import SkillIndex
+from tests.test_scoring import load_profile
+from tests.test_vector_scoring import make_jobs
+
+
+def test_update_profile_rescores_only_affected_jobs(tmp_path):
+    """Adding a skill rescores just the jobs mentioning it; all scores stay exact."""
+    profile = load_profile()
+    jobs = [dict(job, job_id=f"job-{i}") for i, job in enumerate(make_jobs(200))]
+
+    index = SkillIndex(tmp_path / "index.sqlite")
+    assert index.add_jobs(profile, jobs) == 200
+
+    new_profile = copy.deepcopy(profile)
+    new_profile["technical_stack"]["streaming"].append("Flink")
+    new_profile["domain_exposure"].append("Data Modeling")
+
+    rescored = index.update_profile(new_profile)
+    expected = set(index.jobs_with("flink")) | set(index.jobs_with("data modeling"))
+    assert set(rescored) == expected
+    assert 0 < len(rescored) < len(jobs)
+
+    for job in jobs:
+        assert index.get_score(job["job_id"]) == compute_deterministic_score(new_profile, job)
+
+    assert index.update_profile(new_profile) == []
@@ -0,0 +1,278 @@
+"""
+Behaviour tests for the local job store and its sheet sync.
+"""
+
+import pytest
+from gspread.exceptions import APIError
+
+from scripts.filter_jobs import filter_store, filter_worksheet
+from src.job_hunter_ai.ratelimit import TokenBucket
+from src.job_hunter_ai.sheets.incremental import RowCheckpoint
+from src.job_hunter_ai.sheets.sync import SheetSync
+from src.job_hunter_ai.sheets.writer import SheetWriter, coalesce_cells
+from src.job_hunter_ai.store import JobStore
+from src.job_hunter_ai.testing.fake_sheets import FakeWorksheet
+
+HEADERS = ["job_id", "title", "status", "published_at", "notes"]
+FILTER_HEADERS = [
+    "job_id", "title", "description", "status",
+    "years_required_guess", "junior_ok", "language", "language_ok", "notes",
+]
+
+
+def filter_row(job_id, title, description="", status="NEW"):
+    return [job_id, title, description, status, "", "", "", "", ""]
+
+
+def test_store_upsert_update_and_queries():
+    store = JobStore(":memory:")
+    jobs = [
+        {"job_id": "a", "title": "DE", "status": "NEW", "published_at": "2026-01-02"},
+        {"job_id": "b", "title": "DE2", "status": "NEW", "published_at": "2026-01-03"},
+    ]
+    assert store.upsert(jobs) == 2
+    assert store.upsert(jobs) == 0  # unchanged rows are not rewritten
+
+    assert store.update("a", status="READY_LLM", notes="ok")
+    assert store.get("a")["notes"] == "ok"
+    assert [j["job_id"] for j in store.iter_jobs(status="NEW")] == ["b"]
+    assert store.count_by_status() == {"NEW": 1, "READY_LLM": 1}
+    with pytest.raises(KeyError):
+        store.update("missing", status="X")
+    with pytest.raises(ValueError):
+        store.upsert([{"title": "no id"}])
+
+
+def test_sheet_sync_pushes_only_changed_rows():
+    ws = FakeWorksheet([
+        HEADERS,
+        ["a", "DE", "NEW", "2026-01-02", ""],
+        ["b", "DE2", "NEW", "2026-01-03", ""],
+    ])
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws, batch_size=10)
+
+    assert sync.pull() == 2
+    assert store.pending() == []
+
+    store.update("b", status="SKIPPED", notes="senior")
+    store.upsert([{"job_id": "c", "title": "DE3", "status": "NEW"}])
+    stats = sync.push()
+
+    assert (stats.updated, stats.appended) == (1, 1)
+    assert ws.rows[2] == ["b", "DE2", "SKIPPED", "2026-01-03", "senior"]
+    assert ws.rows[3][0] == "c"
+    assert store.pending() == []
+
+    # the appended row number is remembered: next change is an in-place update
+    store.update("c", status="READY_LLM")
+    sync.push()
+    assert ws.rows[3][2] == "READY_LLM" and len(ws.rows) == 4
+
+
+def test_sheet_pull_keeps_unpushed_local_changes():
+    ws = FakeWorksheet([HEADERS, ["a", "DE", "NEW", "", ""]])
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws)
+    sync.pull()
+
+    store.update("a", status="READY_LLM")
+    ws.rows[1][4] = "edited in sheet"
+    sync.pull(full=True)
+    assert store.get("a")["status"] == "READY_LLM"
+
+
+def test_sheet_pull_reads_only_rows_below_the_known_ones():
+    ws = FakeWorksheet([HEADERS, ["a", "DE", "NEW", "", ""]])
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws)
+    sync.pull()
+
+    ws.rows[1][1] = "edited in sheet"
+    ws.append_rows([["b", "DE2", "NEW", "", ""]])
+    cells_read = ws.cells_read
+    assert sync.pull() == 1
+    # header row + the new row; the edit to row 2 waits for a full pull
+    assert ws.cells_read - cells_read == 2 * len(HEADERS) - 2
+    assert store.get("b")["title"] == "DE2" and store.get("a")["title"] == "DE"
+    assert sync.pull() == 0  # nothing below row 3: no range read past the grid
+    assert sync.pull(full=True) == 1 and store.get("a")["title"] == "edited in sheet"
+
+
+def test_sheet_push_follows_reordered_and_deleted_rows():
+    ws = FakeWorksheet([
+        HEADERS,
+        ["a", "DE", "NEW", "", ""],
+        ["b", "DE2", "NEW", "", ""],
+        ["c", "DE3", "NEW", "", ""],
+    ])
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws)
+    sync.pull()
+
+    # someone sorts the sheet and deletes b
+    ws.rows[1:] = [["c", "DE3", "NEW", "", ""], ["a", "DE", "NEW", "", ""]]
+    store.update("a", status="READY_LLM")
+    store.update("b", status="SKIPPED")
+    stats = sync.push()
+
+    assert (stats.updated, stats.relocated, stats.appended, stats.restored) == (1, 1, 1, 1)
+    assert ws.rows[1] == ["c", "DE3", "NEW", "", ""]
+    assert ws.rows[2] == ["a", "DE", "READY_LLM", "", ""]
+    assert ws.rows[3][:3] == ["b", "DE2", "SKIPPED"]
+    assert store.pending() == []
+
+    store.update("a", notes="moved")
+    sync.push()
+    assert ws.rows[2][4] == "moved" and sync.stats.relocated == 1
+
+
+def test_coalesce_cells_builds_rectangles():
+    cells = {(r, c): f"{r}.{c}" for r in (5, 6, 7) for c in (4, 5, 6)}
+    cells[(5, 2)] = "status"
+    cells[(9, 6)] = ""
+    assert coalesce_cells(cells) == [
+        {"range": "B5:B5", "values": [["status"]]},
+        {"range": "D5:F7", "values": [[f"{r}.{c}" for c in (4, 5, 6)] for r in (5, 6, 7)]},
+        {"range": "F9:F9", "values": [[""]]},
+    ]
+
+
+def test_sheet_writer_merges_updates_and_retries_quota_errors():
+    ws = FakeWorksheet([HEADERS] + [[str(i), "", "NEW", "", ""] for i in range(10)])
+    ws.fail_next(2, code=429)
+    delays = []
+    writer = SheetWriter(
+        ws, HEADERS, rate_limiter=TokenBucket(rate=1e6, capacity=10), sleep=delays.append
+    )
+    for row in range(2, 12):
+        writer.update(row, {"status": "READY_LLM", "notes": "ok"})
+    writer.update(3, {"notes": "last write wins"})
+    stats = writer.flush()
+
+    assert ws.calls["batch_update"] == 3 and ws.errors == 2 and len(delays) == 2
+    assert (stats.api_calls, stats.retries, stats.cells) == (3, 2, 20)
+    assert ws.rows[2][4] == "last write wins" and ws.rows[10][2] == "READY_LLM"
+    with pytest.raises(RuntimeError):
+        writer.update(2, {"missing": "x"})
+
+
+def test_row_checkpoint_is_per_stage_and_worksheet(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    first = RowCheckpoint("filter_jobs", 1, path=path)
+    assert first.last_row == 1
+    first.save(20001)
+    assert RowCheckpoint("filter_jobs", 1, path=path).last_row == 20001
+    assert RowCheckpoint("filter_jobs", 2, path=path).last_row == 1
+
+
+def test_fake_worksheet_accounting_and_quota():
+    now = [0.0]
+    ws = FakeWorksheet(
+        [HEADERS, ["a", "DE", "NEW", "", ""], ["b", "DE2", "NEW", "", "x"]],
+        latency=0.5, sleep=None, read_quota_per_minute=3, clock=lambda: now[0],
+    )
+    assert ws.get("A3:C") == [["b", "DE2", "NEW"]]
+    assert ws.col_values(1) == ["job_id", "a", "b"]
+    assert ws.get_all_records()[1]["notes"] == "x"
+    with pytest.raises(APIError):
+        ws.row_values(1)  # 4th read inside the same minute
+    now[0] += 60
+    assert ws.row_values(1) == HEADERS
+
+    assert ws.calls["get"] == 1 and ws.requests["read"] == 5 and ws.errors == 1
+    assert ws.api_time_s == 2.5
+
+
+def test_fake_worksheet_grid_limits():
+    ws = FakeWorksheet([HEADERS, ["a", "DE", "NEW", "", ""]])
+    assert ws.row_count == 2 and ws.get("A2:C") == [["a", "DE", "NEW"]]
+    with pytest.raises(APIError) as exc:
+        ws.get("A3:E")
+    assert exc.value.response.status_code == 400
+
+    ws.append_rows([["b", "DE2", "NEW", "", ""]])
+    assert ws.row_count == 3 and ws.get("A3:A") == [["b"]]
+
+
+def test_filter_worksheet_checkpoint_at_last_row_skips_read(tmp_path):
+    ws = FakeWorksheet([FILTER_HEADERS, filter_row("a", "Data Engineer")], sleep=None)
+    checkpoint = RowCheckpoint("filter_jobs", ws.id, path=tmp_path / "checkpoints.json")
+    checkpoint.save(ws.row_count)
+
+    assert filter_worksheet(ws, checkpoint=checkpoint) == 0
+    assert ws.calls["get"] == 0 and ws.errors == 0
+    assert checkpoint.last_row == 2
+
+
+def test_filter_worksheet_screens_only_rows_past_checkpoint(tmp_path):
+    ws = FakeWorksheet(
+        [
+            FILTER_HEADERS,
+            filter_row("a", "Data Engineer", status="READY_LLM"),
+            filter_row("b", "Data Engineer"),  # before the checkpoint: left alone
+            filter_row("c", "Junior Data Engineer", "Python, SQL, Airflow"),
+            filter_row("d", "Senior Data Engineer", "Lead the platform team"),
+        ],
+        sleep=None,
+    )
+    checkpoint = RowCheckpoint("filter_jobs", ws.id, path=tmp_path / "checkpoints.json")
+    checkpoint.save(3)
+
+    assert filter_worksheet(ws, checkpoint=checkpoint) == 2
+    # header row + the 4 non-blank cells of rows 4 and 5 (trailing blanks are trimmed)
+    assert ws.calls["get"] == 1 and ws.cells_read == len(FILTER_HEADERS) + 2 * 4
+    assert ws.calls["batch_update"] == 1 and ws.requests["write"] == 1
+    assert [row[3] for row in ws.rows[1:]] == ["READY_LLM", "NEW", "READY_LLM", "SKIPPED"]
+    assert RowCheckpoint("filter_jobs", ws.id, path=tmp_path / "checkpoints.json").last_row == 5
+
+    assert filter_worksheet(ws, checkpoint=checkpoint) == 0
+    assert ws.requests["write"] == 1
+
+
+def test_sheet_writer_retries_appends_only_on_quota_and_requeues_failed_flushes():
+    ws = FakeWorksheet([HEADERS, ["a", "", "NEW", "", ""]], sleep=None)
+    writer = SheetWriter(
+        ws, HEADERS, rate_limiter=TokenBucket(rate=1e6, capacity=10), sleep=lambda s: None,
+        max_retries=1,
+    )
+    writer.append_rows([["b", "DE", "NEW", "", ""]])
+    ws.fail_next(1, code=503)
+    with pytest.raises(APIError):
+        writer.flush()  # not retried: the rows may already be in the sheet
+    assert ws.calls["append_rows"] == 1 and writer.pending == 0
+
+    writer.append_rows([["c", "DE", "NEW", "", ""]])
+    ws.fail_next(2, code=429)
+    with pytest.raises(APIError):
+        writer.flush()
+    assert writer.pending == 1  # rejected on quota: kept for the next flush
+
+    writer.update(2, {"status": "READY_LLM"})
+    ws.fail_next(2, code=503)
+    with pytest.raises(APIError):
+        writer.flush()
+    writer.update(2, {"notes": "newer"})
+    writer.flush()
+    assert ws.rows[1] == ["a", "", "READY_LLM", "", "newer"]
+    assert [row[0] for row in ws.rows] == ["job_id", "a", "c"]
+
+
+def test_filter_store_screens_new_jobs_and_pushes_once():
+    ws = FakeWorksheet([
+        FILTER_HEADERS,
+        filter_row("a", "Junior Data Engineer", "Python, SQL"),
+        filter_row("b", "Senior Data Engineer"),
+        filter_row("c", "Data Engineer", status="READY_LLM"),
+    ], sleep=None)
+    store = JobStore(":memory:")
+    sync = SheetSync(store, ws)
+    sync.pull()
+
+    assert filter_store(store) == 2
+    assert store.count_by_status() == {"READY_LLM": 2, "SKIPPED": 1}
+    writes = ws.requests["write"]
+    sync.push()
+    assert ws.requests["write"] - writes == 1
+    assert [row[3] for row in ws.rows[1:]] == ["READY_LLM", "SKIPPED", "READY_LLM"]
+    assert filter_store(store) == 0
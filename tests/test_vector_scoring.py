@@ -0,0 +1,48 @@
+"""
+The columnar scorer must agree with compute_deterministic_score exactly.
+"""
+
+import random
+
+from src.job_hunter_ai.scoring import BASE_SKILLS, compute_deterministic_score
+from src.job_hunter_ai.vector_scoring import (
+    JobSkillMatrix,
+    deterministic_score_at,
+    score_matrix,
+)
+from tests.test_scoring import load_profile
+
+
+def make_jobs(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    extras = [
+        "senior", "3 years", "au moins 1 an", "lakehouse architecture design",
+        "finance analytics", "saas analytics", "javascript",
+    ]
+    jobs = []
+    for _ in range(n):
+        words = rnd.sample(BASE_SKILLS, rnd.randint(0, 9)) + rnd.sample(extras, rnd.randint(0, 2))
+        jobs.append({"title": "Data Engineer", "description": ", ".join(words)})
+    return jobs
+
+
+def test_score_matrix_matches_per_job_scoring():
+    """Every row of score_matrix equals compute_deterministic_score, field for field."""
+    profile = load_profile()
+    jobs = make_jobs(500)
+
+    matrix = JobSkillMatrix.from_jobs(jobs)
+    scores = score_matrix(profile, matrix)
+
+    for i, job in enumerate(jobs):
+        assert deterministic_score_at(profile, matrix, scores, i) == compute_deterministic_score(
+            profile, job
+        )
+
+
+def test_ranking_orders_by_score():
+    """ranking() returns row ids by descending deterministic score."""
+    matrix = JobSkillMatrix.from_jobs(make_jobs(50))
+    scores = score_matrix(load_profile(), matrix)
+    ranked = scores.deterministic_score[scores.ranking()]
+    assert list(ranked) == sorted(ranked, reverse=True)